@@ -0,0 +1,216 @@
+#! /usr/bin/env python3
+
+"""
+Preprocess a batch of law html files in parallel.
+
+Each file is cleaned and split into articles, as prep_const.py does,
+and written to its own output file, one article per line.
+A manifest.json in the output directory records sizes, article counts and timings.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import glob
+import json
+import os
+import sys
+import time
+
+from src.legalogic.prep_docs.prep_const import clean_text, iter_articles, iter_html_articles, CHUNK_SIZE
+
+MANIFEST_FILE_NAME = 'manifest.json'
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Preprocess a batch of law html files in parallel.')
+    parser.add_argument('-v', '--verbose', help='work verbosely', action="store_true")
+    parser.add_argument('-o', '--output-dir',
+                        required=True,
+                        help='directory for the per-law output files and the manifest',
+                        )
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        default=os.cpu_count(),
+                        help='number of worker processes (default: number of cores)',
+                        )
+    parser.add_argument('-p', '--pattern',
+                        default='*.html',
+                        help='file name pattern used for input directories (default: *.html)',
+                        )
+    parser.add_argument('-e', '--encoding',
+                        default='windows-1252',
+                        help='encoding of the input files (default: windows-1252)',
+                        )
+    parser.add_argument('-i', '--incremental',
+                        help='parse each input in fixed-size chunks, see prep_const.py',
+                        action="store_true",
+                        )
+    parser.add_argument('--chunk-size',
+                        type=int,
+                        default=CHUNK_SIZE,
+                        help=f'size in bytes of the chunks read in incremental mode (default: {CHUNK_SIZE})',
+                        )
+    parser.add_argument('inputs',
+                        nargs='+',
+                        help='input files, directories or glob patterns',
+                        )
+
+    args = parser.parse_args()
+    args.prog = parser.prog
+
+    return args
+
+
+def collect_input_files(inputs: list[str], pattern: str) -> list[str]:
+    """Expand directories and glob patterns into a sorted list of distinct files."""
+    file_set = set()
+    for in_path in inputs:
+        if os.path.isdir(in_path):
+            file_set.update(glob.glob(os.path.join(in_path, pattern)))
+        else:
+            file_set.update(glob.glob(in_path))
+    return sorted(path for path in file_set if os.path.isfile(path))
+
+
+def output_path_for(input_path: str, output_dir: str) -> str:
+    """Return the output file path for an input file: same base name, .txt extension."""
+    base_name = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(output_dir, f'{base_name}.txt')
+
+
+def prep_file(input_path: str,
+              output_path: str,
+              encoding: str = 'windows-1252',
+              incremental: bool = False,
+              chunk_size: int = CHUNK_SIZE,
+              ) -> dict:
+    """
+    Clean one html file, split it into articles and write them, one per line.
+
+    Runs in a worker process; only paths go in and a small stats dict comes out,
+    so no document text crosses process boundaries.
+
+    Returns:
+        manifest entry for the file
+    """
+    start = time.perf_counter()
+    entry = {
+        'input': input_path,
+        'output': output_path,
+        'input_bytes': os.path.getsize(input_path),
+    }
+    try:
+        if incremental:
+            article_texts = iter_html_articles(input_path, encoding=encoding, chunk_size=chunk_size)
+        else:
+            with open(input_path, encoding=encoding) as c_file:
+                simplified_text = clean_text(c_file.read())
+            article_texts = (article.text for article in iter_articles(simplified_text))
+
+        article_count = 0
+        with open(output_path, 'w', encoding='utf-8') as out_file:
+            for article_text in article_texts:
+                out_file.write(article_text)
+                out_file.write('\n')
+                article_count += 1
+
+        entry['output_bytes'] = os.path.getsize(output_path)
+        entry['articles'] = article_count
+    except (OSError, UnicodeDecodeError) as e:
+        entry['error'] = str(e)
+    entry['seconds'] = round(time.perf_counter() - start, 4)
+    return entry
+
+
+def prep_batch(input_files: list[str],
+               output_dir: str,
+               jobs: int,
+               encoding: str = 'windows-1252',
+               incremental: bool = False,
+               chunk_size: int = CHUNK_SIZE,
+               verbose: bool = False,
+               ) -> dict:
+    """
+    Fan the input files out over a process pool and return the manifest.
+
+    Files are submitted largest first, so that the longest jobs
+    do not end up running alone at the end of the batch.
+    """
+    start = time.perf_counter()
+    entries = []
+    submit_order = sorted(input_files, key=os.path.getsize, reverse=True)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(prep_file,
+                                   input_path,
+                                   output_path_for(input_path, output_dir),
+                                   encoding,
+                                   incremental,
+                                   chunk_size,
+                                   )
+                   for input_path in submit_order
+                   ]
+        for future in as_completed(futures):
+            entry = future.result()
+            if verbose:
+                status = entry.get('error', f"{entry['articles']} articles")
+                print(f"{entry['input']}: {status} in {entry['seconds']}s", file=sys.stderr)
+            entries.append(entry)
+
+    entries.sort(key=lambda e: e['input'])
+    done_entries = [e for e in entries if 'error' not in e]
+    return {
+        'jobs': jobs,
+        'incremental': incremental,
+        'wall_seconds': round(time.perf_counter() - start, 4),
+        'cpu_seconds': round(sum(e['seconds'] for e in entries), 4),
+        'files': len(entries),
+        'failed': len(entries) - len(done_entries),
+        'input_bytes': sum(e['input_bytes'] for e in entries),
+        'output_bytes': sum(e['output_bytes'] for e in done_entries),
+        'articles': sum(e['articles'] for e in done_entries),
+        'entries': entries,
+    }
+
+
+def main():
+    args = set_argparse()
+
+    if args.verbose:
+        print(f"Running {args.prog}:", file=sys.stderr)
+        print(f"{args.inputs=}", file=sys.stderr)
+
+    input_files = collect_input_files(args.inputs, args.pattern)
+    if not input_files:
+        print("Error: no input files found", file=sys.stderr)
+        sys.exit(1)
+
+    output_paths = [output_path_for(path, args.output_dir) for path in input_files]
+    if len(set(output_paths)) != len(output_paths):
+        print("Error: several input files map to the same output file name", file=sys.stderr)
+        sys.exit(1)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    manifest = prep_batch(input_files,
+                          args.output_dir,
+                          args.jobs,
+                          encoding=args.encoding,
+                          incremental=args.incremental,
+                          chunk_size=args.chunk_size,
+                          verbose=args.verbose,
+                          )
+
+    with open(os.path.join(args.output_dir, MANIFEST_FILE_NAME), 'w', encoding='utf-8') as m_file:
+        json.dump(manifest, m_file, ensure_ascii=False, indent=2)
+
+    if args.verbose:
+        print(f"{manifest['files']} files, {manifest['articles']} articles, "
+              f"{manifest['failed']} failed, in {manifest['wall_seconds']}s "
+              f"({manifest['cpu_seconds']}s of work over {manifest['jobs']} jobs)",
+              file=sys.stderr)
+
+    if manifest['failed']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#! /usr/bin/env python3
+
+"""
+Benchmark throughput (MB/s) of prep_const.clean_text
+against its original, one-regex-per-rule implementation.
+"""
+
+import argparse
+import copy
+import re
+import sys
+import time
+from typing import Callable
+
+from src.legalogic.prep_docs.prep_const import clean_text, MULTI_FLAG
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark clean_text throughput.')
+    parser.add_argument('-v', '--verbose', help='work verbosely', action="store_true")
+    parser.add_argument('-r', '--repeat',
+                        type=int,
+                        default=5,
+                        help='number of timed runs per input size, best one is reported (default: 5)',
+                        )
+    parser.add_argument('-s', '--scales',
+                        type=int,
+                        nargs='+',
+                        default=[1, 100],
+                        help='input sizes, as multiples of the input file (default: 1 100)',
+                        )
+    parser.add_argument('input_file_path', help='Path to the input file, e.g. constitucion_cr-26.html')
+
+    args = parser.parse_args()
+    args.prog = parser.prog
+
+    return args
+
+
+def clean_text_legacy(in_txt: str) -> str:
+    """Original clean_text: compiles and applies one regex per rule on every call."""
+    c_text = copy.copy(in_txt)
+
+    comment_pattern = re.compile(pattern=r'<!--.*-->', flags=MULTI_FLAG)
+    tag_pattern = re.compile(pattern=r'<[^>]*>', flags=MULTI_FLAG)
+    nbsp_html_pattern = re.compile(pattern=r'&nbsp;', flags=MULTI_FLAG)
+    nbsp_pattern = re.compile(pattern='\u00A0', flags=MULTI_FLAG)
+    ficha_pattern = re.compile(pattern=r'\s*Ficha articulo\s*')
+    bad_endpoint_pattern = re.compile(pattern=r'\.(?=[^\s0-9.-])')
+
+    c_text = re.sub(comment_pattern, '', c_text)
+    c_text = re.sub(tag_pattern, '', c_text)
+    c_text = re.sub(nbsp_html_pattern, ' ', c_text)
+    c_text = re.sub(nbsp_pattern, ' ', c_text)
+    c_text = re.sub(ficha_pattern, '', c_text)
+    c_text = re.sub(bad_endpoint_pattern, '. ', c_text)
+
+    return c_text
+
+
+def scale_text(in_txt: str, scale: int) -> str:
+    """
+    Return scale copies of in_txt.
+
+    html comment delimiters are defused in all copies but the first,
+    so that the greedy comment rule does not swallow the copies in between
+    and every copy is still cleaned, as a separate document would be.
+    """
+    defused_txt = in_txt.replace('<!--', '<!- -').replace('-->', '- ->')
+    return in_txt + defused_txt * (scale - 1)
+
+
+def time_it(func: Callable[[str], str], in_txt: str, repeat: int) -> tuple[float, str]:
+    """Return the best elapsed time, in seconds, over repeat runs, and the function output."""
+    best = float('inf')
+    out_txt = ''
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out_txt = func(in_txt)
+        best = min(best, time.perf_counter() - start)
+    return best, out_txt
+
+
+def main():
+    args = set_argparse()
+
+    if args.verbose:
+        print(f"Running {args.prog}:", file=sys.stderr)
+        print(f"{args.input_file_path=}", file=sys.stderr)
+
+    with open(args.input_file_path, encoding='windows-1252') as c_file:
+        c_text = c_file.read()
+
+    print(f"{'scale':>6} {'MB':>9} {'legacy MB/s':>12} {'new MB/s':>10} {'speedup':>8}")
+    for scale in args.scales:
+        in_txt = scale_text(c_text, scale)
+        size_mb = len(in_txt.encode('utf-8')) / 1e6
+        legacy_secs, legacy_out = time_it(clean_text_legacy, in_txt, args.repeat)
+        new_secs, new_out = time_it(clean_text, in_txt, args.repeat)
+        if new_out != legacy_out:
+            print(f"Error: outputs differ at scale {scale}", file=sys.stderr)
+            sys.exit(1)
+        print(f"{scale:>6} {size_mb:>9.2f} {size_mb / legacy_secs:>12.1f} {size_mb / new_secs:>10.1f} "
+              f"{legacy_secs / new_secs:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
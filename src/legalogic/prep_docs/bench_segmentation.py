@@ -0,0 +1,98 @@
+#! /usr/bin/env python3
+
+"""
+Compare sentence segmentation profiles of constitucion_sentences.py:
+speed, and sentence boundary agreement with the full-pipeline output.
+"""
+
+import argparse
+import sys
+import time
+
+from src.legalogic.prep_docs.constitucion_sentences import (
+    load_segmenter,
+    remove_art_num_prefix,
+    BATCH_SIZE,
+    PROFILES,
+)
+
+# profile whose boundaries are taken as reference
+REFERENCE_PROFILE = 'full'
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Compare sentence segmentation profiles.')
+    parser.add_argument('-v', '--verbose', help='work verbosely', action="store_true")
+    parser.add_argument('-b', '--batch-size',
+                        type=int,
+                        default=BATCH_SIZE,
+                        help=f'number of articles per nlp.pipe batch (default: {BATCH_SIZE})',
+                        )
+    parser.add_argument('-m', '--maxlines',
+                        type=int,
+                        help='max number of input lines to process',
+                        )
+    parser.add_argument('input_file_path', help='Path to the input file, e.g. constitucion_cr.txt')
+
+    args = parser.parse_args()
+    args.prog = parser.prog
+
+    return args
+
+
+def segment_boundaries(profile: str, c_lines: list[str], batch_size: int) -> tuple[float, float, list[set[int]]]:
+    """
+    Segment every line with a profile.
+
+    Returns:
+        - seconds to load the profile pipeline
+        - seconds to segment all lines
+        - per line, the set of character offsets where a sentence starts, other than 0
+    """
+    start = time.perf_counter()
+    nlp = load_segmenter(profile)
+    load_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    boundaries = [{sent.start_char for sent in doc.sents if sent.start_char > 0}
+                  for doc in nlp.pipe(c_lines, batch_size=batch_size)
+                  ]
+    return load_secs, time.perf_counter() - start, boundaries
+
+
+def agreement(boundaries: list[set[int]], reference: list[set[int]]) -> tuple[float, float, float, float]:
+    """Return boundary precision, recall and F1 against the reference, and the share of identical lines."""
+    true_pos = sum(len(b & r) for b, r in zip(boundaries, reference))
+    found = sum(len(b) for b in boundaries)
+    expected = sum(len(r) for r in reference)
+    precision = true_pos / found if found else 1.0
+    recall = true_pos / expected if expected else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    same = sum(b == r for b, r in zip(boundaries, reference)) / len(reference) if reference else 1.0
+    return precision, recall, f1, same
+
+
+def main():
+    args = set_argparse()
+
+    if args.verbose:
+        print(f"Running {args.prog}:", file=sys.stderr)
+        print(f"{args.input_file_path=}", file=sys.stderr)
+
+    with open(args.input_file_path, encoding='utf-8') as c_file:
+        c_lines = [remove_art_num_prefix(line) for line in c_file][:args.maxlines]
+
+    results = {profile: segment_boundaries(profile, c_lines, args.batch_size) for profile in PROFILES}
+    reference = results[REFERENCE_PROFILE][2]
+
+    print(f"{'profile':>8} {'load s':>7} {'run s':>7} {'art/s':>8} {'sents':>6} "
+          f"{'prec':>6} {'recall':>6} {'F1':>6} {'same':>6}")
+    for profile, (load_secs, run_secs, boundaries) in results.items():
+        precision, recall, f1, same = agreement(boundaries, reference)
+        sent_count = sum(len(b) + 1 for b in boundaries)
+        print(f"{profile:>8} {load_secs:>7.2f} {run_secs:>7.2f} {len(c_lines) / run_secs:>8.1f} {sent_count:>6} "
+              f"{precision:>6.3f} {recall:>6.3f} {f1:>6.3f} {same:>6.3f}")
+
+
+if __name__ == "__main__":
+    main()
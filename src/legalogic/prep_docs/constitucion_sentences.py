@@ -8,14 +8,76 @@ import argparse
 import copy
 import re
 import sys
+import time
 from typing import List
 
 import spacy
+from spacy.language import Language
+from spacy.tokens import Doc
+
+from src.config.config import Config
+from src.util.content_cache import ContentCache
+from src.util.model_registry import get_spacy
+
+config = Config().config
+
+# spaCy model used to identify sentences
+SPACY_MODEL = "es_core_news_lg"
+
+# cache stage name for sentence segmentation
+SEGMENT_STAGE = 'constitucion_sentences'
+
+# default number of articles per nlp.pipe batch
+BATCH_SIZE = 64
+
+# segmentation profiles:
+# - full: the whole SPACY_MODEL pipeline
+# - parser: only the SPACY_MODEL components that sentence boundaries depend on
+# - rules: a blank Spanish tokenizer plus the rule-based legal_sentencizer
+PROFILES = ('full', 'parser', 'rules')
+
+# SPACY_MODEL components not needed for the dependency-parse sentence boundaries
+NON_PARSER_COMPONENTS = ['morphologizer', 'attribute_ruler', 'lemmatizer', 'ner']
+
+# tokens that may end a sentence
+SENT_END_PUNCT = {'.', '!', '?', '…'}
+
+# lowercased abbreviations, without their final dot, that do not end a sentence
+LEGAL_ABBREVIATIONS = {
+    'art', 'arts', 'inc', 'incs', 'núm', 'nro', 'nº', 'n°', 'párr', 'cap', 'tít', 'sec',
+    'lic', 'licda', 'dr', 'dra', 'sr', 'sra', 'sres', 'gral', 'pág', 'págs', 'ss', 'cfr',
+}
+
+# numbered clause starts, like "1)", "a)", "2.-" or "3º"
+NUMBERED_CLAUSE_PATTERN = re.compile(r'^(\d+|[a-zA-Z])(\)|\.-|º)')
+
+# characters that may start a sentence, besides upper case letters
+SENT_START_CHARS = set('(¿¡"«“')
 
 
 def set_argparse() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Try sentence separation for constitucion_cr.txt .')
     parser.add_argument('-v', '--verbose', help='work verbosely', action="store_true")
+    parser.add_argument('--cache-dir',
+                        default=config.get('cache_dir'),
+                        help=f"directory of the content cache (default: {config.get('cache_dir')})",
+                        )
+    parser.add_argument('--no-cache', help='segment every article, without the content cache', action="store_true")
+    parser.add_argument('-b', '--batch-size',
+                        type=int,
+                        default=BATCH_SIZE,
+                        help=f'number of articles per nlp.pipe batch (default: {BATCH_SIZE})',
+                        )
+    parser.add_argument('-p', '--profile',
+                        choices=PROFILES,
+                        default='full',
+                        help='segmentation profile: full pipeline, parser only or legal rules (default: full)',
+                        )
+    parser.add_argument('-n', '--n-process',
+                        type=int,
+                        default=1,
+                        help='number of processes for nlp.pipe (default: 1)',
+                        )
     parser.add_argument('input_file_path', help='Path to the input file')
 
     args = parser.parse_args()
@@ -37,16 +99,114 @@ def remove_art_num_prefix(in_txt: str) -> str:
     return c_text
 
 
-def proc_sent(c_lines: List[str]):
-    """Print lines without initial or ending space in any of its sentences."""
-
-    # use the dependency parse to identify sentences
-    nlp = spacy.load("es_core_news_lg")
-
-    for line_text in c_lines:
-        doc = nlp(line_text)
-        sent_list = [sent.text.strip() for sent in doc.sents]
-        print(' '.join(sent_list))
+def is_abbreviation(token_text: str) -> bool:
+    """Whether a token, with or without its final dot, is a known abbreviation."""
+    return token_text.rstrip('.').lower() in LEGAL_ABBREVIATIONS
+
+
+def looks_like_sent_start(token_text: str) -> bool:
+    """Whether a token may start a sentence: upper case, opening punctuation or a numbered clause."""
+    return (token_text[0].isupper()
+            or token_text[0] in SENT_START_CHARS
+            or NUMBERED_CLAUSE_PATTERN.match(token_text) is not None
+            )
+
+
+@Language.component('legal_sentencizer')
+def legal_sentencizer(doc: Doc) -> Doc:
+    """
+    Set rule-based sentence boundaries, tuned for legal Spanish.
+
+    A sentence ends at '.', '!', '?' or '…' (or a token ending in '.'),
+    unless it closes an abbreviation like "Art." or "inc.",
+    and only when the next token looks like a sentence start.
+    A parenthesized sentence, like "(Así reformado por ...)", ends at its closing parenthesis.
+    Dots followed by a word without a space were already split by prep_const.clean_text.
+    """
+    in_paren_sentence = False
+    for i, token in enumerate(doc):
+        if i == 0:
+            token.is_sent_start = True
+            in_paren_sentence = token.text == '('
+            continue
+
+        prev = doc[i - 1]
+        if prev.text in SENT_END_PUNCT:
+            ends = i < 2 or not is_abbreviation(doc[i - 2].text)
+        elif prev.text.endswith('.'):
+            ends = not is_abbreviation(prev.text)
+        else:
+            ends = in_paren_sentence and prev.text == ')'
+
+        token.is_sent_start = ends and looks_like_sent_start(token.text)
+        if token.is_sent_start:
+            in_paren_sentence = token.text == '('
+    return doc
+
+
+def load_segmenter(profile: str = 'full') -> Language:
+    """Return the spaCy pipeline for a segmentation profile."""
+    if profile == 'rules':
+        nlp = spacy.blank('es')
+        nlp.add_pipe('legal_sentencizer')
+        return nlp
+    if profile == 'parser':
+        return get_spacy(SPACY_MODEL, exclude=NON_PARSER_COMPONENTS)
+    return get_spacy(SPACY_MODEL)
+
+
+def segment_version(profile: str = 'full') -> str:
+    """Return the model/version identification of a segmentation profile, for the content cache."""
+    if profile == 'rules':
+        return f"rules/spacy-{spacy.__version__}"
+    return f"{SPACY_MODEL}-{spacy.util.get_package_version(SPACY_MODEL)}/spacy-{spacy.__version__}/{profile}"
+
+
+def proc_sent(c_lines: List[str],
+              cache: ContentCache = None,
+              batch_size: int = BATCH_SIZE,
+              n_process: int = 1,
+              profile: str = 'full',
+              verbose: bool = False,
+              ):
+    """
+    Print lines without initial or ending space in any of its sentences.
+
+    Articles are streamed through nlp.pipe, in batches of batch_size over n_process processes,
+    and printed in input order.
+    With a cache, only articles whose text changed since a previous run are segmented;
+    the model is not even loaded when every article is cached.
+    """
+    version = segment_version(profile)
+
+    sent_lines = [None] * len(c_lines)
+    if cache is not None:
+        sent_lines = [cache.get(SEGMENT_STAGE, version, line_text) for line_text in c_lines]
+    todo_indexes = [i for i, sent_line in enumerate(sent_lines) if sent_line is None]
+
+    doc_iter = iter(())
+    if todo_indexes:
+        nlp = load_segmenter(profile)
+        doc_iter = nlp.pipe((c_lines[i] for i in todo_indexes),
+                            batch_size=batch_size,
+                            n_process=n_process,
+                            )
+
+    start = time.perf_counter()
+    for i, line_text in enumerate(c_lines):
+        if sent_lines[i] is None:
+            doc = next(doc_iter)
+            sent_list = [sent.text.strip() for sent in doc.sents]
+            sent_lines[i] = ' '.join(sent_list)
+            if cache is not None:
+                cache.put(SEGMENT_STAGE, version, line_text, sent_lines[i])
+        print(sent_lines[i])
+    elapsed = time.perf_counter() - start
+
+    if verbose and todo_indexes:
+        print(f"Segmented {len(todo_indexes)} articles in {elapsed:.2f}s "
+              f"({len(todo_indexes) / elapsed:.1f} articles/sec, {profile=}, {batch_size=}, {n_process=})",
+              file=sys.stderr)
 
 
 def main():
@@ -65,7 +225,25 @@ def main():
             for line in c_file
         ]
 
-    proc_sent(c_lines)
+    if args.no_cache:
+        proc_sent(c_lines,
+                  batch_size=args.batch_size,
+                  n_process=args.n_process,
+                  profile=args.profile,
+                  verbose=args.verbose,
+                  )
+        return
+
+    with ContentCache(args.cache_dir) as cache:
+        proc_sent(c_lines,
+                  cache,
+                  batch_size=args.batch_size,
+                  n_process=args.n_process,
+                  profile=args.profile,
+                  verbose=args.verbose,
+                  )
+        if args.verbose:
+            print(cache.stats(), file=sys.stderr)
 
 
 if __name__ == "__main__":
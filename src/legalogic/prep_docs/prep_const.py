@@ -1,19 +1,66 @@
 #! /usr/bin/env python3
 
 import argparse
-import copy
+import codecs
+from html.parser import HTMLParser
+import io
 import re
 import sys
-from typing import List
+from typing import Iterator, List, NamedTuple, Optional
 
 
 # re flags to include new-lines
 MULTI_FLAG = re.MULTILINE + re.DOTALL
 
+# delimiters for html comments
+COMMENT_OPEN = '<!--'
+COMMENT_CLOSE = '-->'
+
+# pattern for any other html tag
+TAG_PATTERN = re.compile(pattern=r'<[^>]*>', flags=MULTI_FLAG)
+
+# instances of &nbsp;
+NBSP_HTML = '&nbsp;'
+NBSP_CHAR = '\u00A0'
+
+# text for Ficha articulo
+FICHA_TEXT = 'Ficha articulo'
+
+# pattern for a bad sentence-end point.
+# a literal dot (.), only if followed by anything other than space, a digit or another dot
+# only the initial dot is to be recognized as the match
+BAD_ENDPOINT_PATTERN = re.compile(pattern=r'\.(?=[^\s0-9.-])')
+
+# article start markers; every article text starts with ARTICLE_MARKER
+ARTICLE_PATTERN = re.compile(pattern='ARTÍCULO|Artículo', flags=MULTI_FLAG)
+ARTICLE_MARKER = 'ARTÍCULO'
+ARTICLE_MARKER_LEN = len(ARTICLE_MARKER)
+
+# pattern for the article number following the marker
+ARTICLE_NUMBER_PATTERN = re.compile(pattern=r'\s*(\d+)')
+
+# text starting a left-over title, at the end of an article
+TITULO_TEXT = 'TITULO'
+
+# default size, in bytes, of the chunks read in incremental mode
+CHUNK_SIZE = 64 * 1024
+
 
 def set_argparse() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Preprocess constitucion_cr-26.html file.')
     parser.add_argument('-v', '--verbose', help='work verbosely', action="store_true")
+    parser.add_argument('-i', '--incremental',
+                        help='parse the input in fixed-size chunks, emitting each article as soon as it closes; '
+                             'the articles match those of the default mode only if the input has a single '
+                             'html comment span, as the default removes all from the first "<!--" to the last "-->", '
+                             'and no bare "<" in text, as the default removes all from a "<" to the next ">"',
+                        action="store_true",
+                        )
+    parser.add_argument('--chunk-size',
+                        type=int,
+                        default=CHUNK_SIZE,
+                        help=f'size in bytes of the chunks read in incremental mode (default: {CHUNK_SIZE})',
+                        )
     parser.add_argument('input_file_path', help='Path to the input file')
 
     args = parser.parse_args()
@@ -23,36 +70,103 @@ def set_argparse() -> argparse.Namespace:
 
 
 def clean_text(in_txt: str) -> str:
-    """Remove all undesired text from the input"""
-    c_text = copy.copy(in_txt)
+    """
+    Remove all undesired text from the input.
 
-    # pattern for html comments
-    comment_pattern = re.compile(pattern=r'<!--.*-->', flags=MULTI_FLAG)
+    Rules are compiled once, at module level, and applied in as few passes as
+    the rules allow while producing the same output as applying, in order:
+    html comments, html tags, &nbsp; (entity and character), "Ficha articulo"
+    and bad sentence-end points.
+    Only the tag and the bad-endpoint rules need a regex scan;
+    the rest run as plain str operations.
+    """
+    c_text = remove_html_comment(in_txt)
+    c_text = TAG_PATTERN.sub('', c_text)
+    c_text = c_text.replace(NBSP_HTML, ' ').replace(NBSP_CHAR, ' ')
+    c_text = remove_ficha(c_text)
+    c_text = BAD_ENDPOINT_PATTERN.sub('. ', c_text)
 
-    # pattern for any other html tag
-    tag_pattern = re.compile(pattern=r'<[^>]*>', flags=MULTI_FLAG)
+    return c_text
 
-    # patterns for instances of &nbsp;
-    nbsp_html_pattern = re.compile(pattern=r'&nbsp;', flags=MULTI_FLAG)
-    nbsp_pattern = re.compile(pattern='\u00A0', flags=MULTI_FLAG)
 
-    # patter for Ficha articulo
-    ficha_pattern = re.compile(pattern=r'\s*Ficha articulo\s*')
+def remove_html_comment(in_txt: str) -> str:
+    """
+    Remove the html comment span.
 
-    # pattern for a bad sentence-end point.
-    # a literal dot (.), only if followed by anything other than space, a digit or another dot
-    # only the initial dot is to be recognized as the match
-    bad_endpoint_pattern = re.compile(pattern=r'\.(?=[^\s0-9.-])')
+    Equivalent to re.sub(r'<!--.*-->', '', in_txt, flags=MULTI_FLAG):
+    the greedy, dot-all pattern matches once, from the first '<!--'
+    to the last '-->' following it.
+    """
+    start = in_txt.find(COMMENT_OPEN)
+    if start < 0:
+        return in_txt
+    end = in_txt.rfind(COMMENT_CLOSE, start + len(COMMENT_OPEN))
+    if end < 0:
+        return in_txt
+    return in_txt[:start] + in_txt[end + len(COMMENT_CLOSE):]
 
-    c_text = re.sub(comment_pattern, '', c_text)
-    c_text = re.sub(tag_pattern, '', c_text)
-    c_text = re.sub(nbsp_html_pattern, ' ', c_text)
-    c_text = re.sub(nbsp_pattern, ' ', c_text)
-    c_text = re.sub(ficha_pattern, '', c_text)
-    c_text = re.sub(bad_endpoint_pattern, '. ', c_text)
 
-    # assert c_text is not in_txt, "c_text and in_text are the same"
-    return c_text
+def remove_ficha(in_txt: str) -> str:
+    r"""
+    Remove every "Ficha articulo" together with its surrounding white space.
+
+    Equivalent to re.sub(r'\s*Ficha articulo\s*', '', in_txt),
+    but searches for the literal instead of trying \s* at every position.
+    """
+    if FICHA_TEXT not in in_txt:
+        return in_txt
+    pieces = in_txt.split(FICHA_TEXT)
+    last = len(pieces) - 1
+    return ''.join(
+        piece.lstrip() if i == last else (piece.rstrip() if i == 0 else piece.strip())
+        for i, piece in enumerate(pieces)
+    )
+
+
+class Article(NamedTuple):
+    """
+    Article found in a cleaned text, as character offsets into that text.
+
+    start is the offset of the 'ARTÍCULO' (or 'Artículo') marker,
+    end is the offset where the article text stops:
+    the next marker, a left-over "TITULO ..." or the end of the text.
+    """
+    number: Optional[int]
+    start: int
+    end: int
+    source: str
+
+    @property
+    def text(self) -> str:
+        """Article text, sliced from source only when requested."""
+        body = self.source[self.start + ARTICLE_MARKER_LEN:self.end]
+        return ARTICLE_MARKER + body.replace('\n', ' ')
+
+
+def iter_articles(in_text: str) -> Iterator[Article]:
+    """
+    Yield the articles in in_text, scanning it once.
+
+    Produces the same article texts as get_article_list,
+    holding no more than the current article.
+    """
+    marker_iter = ARTICLE_PATTERN.finditer(in_text)
+    marker = next(marker_iter, None)
+    while marker is not None:
+        next_marker = next(marker_iter, None)
+        start = marker.start()
+        end = next_marker.start() if next_marker is not None else len(in_text)
+
+        # remove any left-over "TITULO ..." from the article
+        titulo = in_text.find(TITULO_TEXT, marker.end(), end)
+        if titulo >= 0:
+            end = titulo
+
+        number_match = ARTICLE_NUMBER_PATTERN.match(in_text, marker.end(), end)
+        number = int(number_match.group(1)) if number_match else None
+
+        yield Article(number, start, end, in_text)
+        marker = next_marker
 
 
 def get_article_list(in_text: str) -> List[str]:
@@ -61,23 +175,127 @@ def get_article_list(in_text: str) -> List[str]:
     including all their paragraphs,
     including parenthesized comments.
     """
-    # remove all nl
-    article_text = in_text.replace('\n', ' ')
+    return [article.text for article in iter_articles(in_text)]
+
+
+class ArticleHTMLParser(HTMLParser):
+    """
+    Feed-style html parser that collects clean article texts as each article closes.
+
+    Text outside tags and comments is scanned for article markers as it arrives;
+    once the next marker (or the end of input) is seen, the article is cleaned
+    with the same rules as clean_text and get_article_list,
+    and queued for pop_articles.
+    Only the current article, and never the whole document, is held in memory.
+
+    Comments are removed one by one, so the article stream matches that of
+    clean_text and get_article_list whenever the greedy comment rule in
+    clean_text removes only comments, i.e. for documents with a single comment span.
+    A bare '<' in text, as in "1 < 2 y 3 > 1", is kept here as text,
+    while the tag rule of clean_text removes everything up to the next '>'.
+    """
+
+    # stands for '&' while parsing, so that entities reach handle_data verbatim,
+    # as clean_text leaves them; windows-1252 text never decodes to this character
+    AMP_PLACEHOLDER = '\uE000'
 
-    # split text by 'ARTÍCULO', removing first item
-    article_list = re.split('ARTÍCULO|Artículo', article_text, flags=MULTI_FLAG)[1:]
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self._pieces = []
+        self._size = 0
+        self._tail = ''
+        self._in_article = False
+        self._articles = []
 
-    # restore "ARTÍCULO" in front of each article
-    article_list = ["ARTÍCULO" + x
-                    for x in article_list
-                    ]
+    def feed(self, data):
+        super().feed(data.replace('&', self.AMP_PLACEHOLDER))
 
-    # remove any left-over "TITULO ..." from the item text
-    article_list = [x.split("TITULO")[0]
-                    for x in article_list
-                    ]
+    def handle_data(self, data):
+        self._append(data.replace(self.AMP_PLACEHOLDER, '&'))
 
-    return article_list
+    def close(self):
+        super().close()
+        if self._in_article:
+            self._articles.append(finish_article(''.join(self._pieces), followed=False))
+        self._pieces = []
+        self._size = 0
+        self._tail = ''
+        self._in_article = False
+
+    def pop_articles(self) -> List[str]:
+        """Return, and forget, the articles closed so far."""
+        articles, self._articles = self._articles, []
+        return articles
+
+    def _append(self, text: str):
+        """Add text to the current article, closing it when a new marker shows up."""
+        window_start = self._size - len(self._tail)
+        window = self._tail + text
+        self._pieces.append(text)
+        self._size += len(text)
+
+        if ARTICLE_PATTERN.search(window) is not None:
+            buffer = ''.join(self._pieces)
+            start = 0
+            for marker in ARTICLE_PATTERN.finditer(buffer, window_start):
+                if marker.start() == 0 and self._in_article:
+                    # marker of the current article
+                    continue
+                if self._in_article:
+                    self._articles.append(finish_article(buffer[start:marker.start()], followed=True))
+                self._in_article = True
+                start = marker.start()
+            buffer = buffer[start:]
+            self._pieces = [buffer]
+            self._size = len(buffer)
+
+        # keep enough text to recognize a marker split across pieces
+        self._tail = window[-(ARTICLE_MARKER_LEN - 1):]
+        if not self._in_article:
+            # text before the first article is not needed
+            self._pieces = [self._tail]
+            self._size = len(self._tail)
+
+
+def finish_article(segment: str, followed: bool) -> str:
+    """
+    Return the article text for a tag-free segment starting with an article marker.
+
+    Args:
+        segment: text from the article marker up to the next marker or the end of input
+        followed: whether another article marker follows the segment
+    """
+    c_text = segment.replace(NBSP_HTML, ' ').replace(NBSP_CHAR, ' ')
+    c_text = remove_ficha(c_text)
+    c_text = BAD_ENDPOINT_PATTERN.sub('. ', c_text)
+    if followed and c_text.endswith('.'):
+        # the final dot is followed by the next article marker
+        c_text += ' '
+    titulo = c_text.find(TITULO_TEXT, ARTICLE_MARKER_LEN)
+    if titulo >= 0:
+        c_text = c_text[:titulo]
+    return ARTICLE_MARKER + c_text[ARTICLE_MARKER_LEN:].replace('\n', ' ')
+
+
+def iter_html_articles(file_path: str,
+                       encoding: str = 'windows-1252',
+                       chunk_size: int = CHUNK_SIZE,
+                       ) -> Iterator[str]:
+    """
+    Yield clean article texts from an html file, reading it in fixed-size chunks.
+
+    Bytes are decoded incrementally, with universal newlines as in text-mode open,
+    and fed to an ArticleHTMLParser, so memory stays flat regardless of file size.
+    """
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(), translate=True)
+    parser = ArticleHTMLParser()
+    with open(file_path, 'rb') as c_file:
+        while chunk := c_file.read(chunk_size):
+            parser.feed(decoder.decode(chunk))
+            yield from parser.pop_articles()
+    parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    yield from parser.pop_articles()
 
 
 def main():
@@ -88,18 +306,22 @@ def main():
         print(f"Running {args.prog}:", file=sys.stderr)
         print(f"{input_file_path=}", file=sys.stderr)
 
+    # confirm default output encoding
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    if args.incremental:
+        for article_text in iter_html_articles(input_file_path, chunk_size=args.chunk_size):
+            print(article_text)
+        return
+
     # read the file
     with open(input_file_path, encoding='windows-1252') as c_file:
         c_text = c_file.read()
 
-    # confirm default output encoding
-    sys.stdout.reconfigure(encoding='utf-8')
-
     simplified_text = clean_text(c_text)
-    article_list = get_article_list(simplified_text)
 
-    for art in article_list:
-        print(art)
+    for article in iter_articles(simplified_text):
+        print(article.text)
 
 
 if __name__ == "__main__":
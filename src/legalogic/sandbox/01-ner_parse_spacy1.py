@@ -12,6 +12,8 @@ import spacy
 from spacy import displacy
 from spacy.tokens import Span, Token
 
+from src.util.model_registry import get_spacy
+
 
 def set_argparse() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Try sentence separation for constitucion_cr.txt .')
@@ -100,7 +102,7 @@ def main():
         c_lines = c_file.readlines()
 
     # using the dependency parse
-    nlp = spacy.load("es_core_news_lg")
+    nlp = get_spacy("es_core_news_lg")
 
     print_entities(nlp, c_lines[:5])
 
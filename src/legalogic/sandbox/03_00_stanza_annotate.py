@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+"""
+Annotate constitución text once, with every Stanza processor used by the 03_* scripts,
+and save the documents to the annotation store they can read from (--store).
+"""
+
+import argparse
+import sys
+import time
+
+import stanza
+
+from src.config.config import Config
+from src.util.annotation_store import AnnotationStore
+from src.util.batch_annotate import iter_annotated, BATCH_SIZE
+from src.util.nlp_daemon import stanza_pipeline
+
+config = Config().config
+
+# Stanza processors run once for all the 03_* scripts
+PROCESSORS = 'tokenize,mwt,pos,lemma,depparse,constituency,ner,coref'
+
+# Stanza packages, as used by 03_03_stanza_ner.py
+PACKAGE = {"ner": ["ancora", "conll02"]}
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Annotate constitución text once, with all Stanza processors.')
+    parser.add_argument('-v', '--verbose',
+                        help='work verbosely',
+                        action="store_true"
+                        )
+    parser.add_argument('-m', '--maxlines',
+                        type=int,
+                        help='max number of input lines to process',
+                        )
+    parser.add_argument('-b', '--batch-size',
+                        type=int,
+                        default=BATCH_SIZE,
+                        help=f'number of lines per pipeline call (default: {BATCH_SIZE})',
+                        )
+    parser.add_argument('-f', '--force',
+                        help='re-annotate lines already in the store',
+                        action="store_true",
+                        )
+    parser.add_argument('-s', '--store',
+                        default=config.get('annotation_store_dir'),
+                        help=f"directory of the annotation store (default: {config.get('annotation_store_dir')})",
+                        )
+    parser.add_argument('input_file_path',
+                        help='Path to the input file'
+                        )
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+def init_nlp(use_gpu: bool = True) -> stanza.Pipeline:
+    """
+    Initialize the Stanza NLP pipeline.
+
+    Args:
+        use_gpu: Whether to use GPU acceleration if available
+
+    Returns:
+        Stanza Pipeline object
+
+    Raises:
+        Exception: If pipeline initialization fails
+    """
+    try:
+        return stanza_pipeline('es',
+                               PROCESSORS,
+                               use_gpu=use_gpu,
+                               package=PACKAGE,
+                               )
+    except Exception as e:
+        raise Exception(f"Failed to initialize Stanza pipeline: {e}") from e
+
+
+def retain_lines(store: AnnotationStore, line_text_list: list[str], verbose: bool = False) -> None:
+    """Make the lines of the input file the lines of the store, dropping the documents of other lines."""
+    dropped = store.retain(line_text_list)
+    store.commit()
+    if verbose:
+        print(f"{len(line_text_list)} lines kept, {dropped} stale documents dropped", file=sys.stderr)
+
+
+def annotate_file(file_path: str,
+                  store: AnnotationStore,
+                  maxlines: int = None,
+                  batch_size: int = BATCH_SIZE,
+                  force: bool = False,
+                  verbose: bool = False,
+                  ) -> int:
+    """
+    Annotate the lines of a text file and save their documents to the store.
+    Unless maxlines is given, the lines of the file become the lines of the store,
+    and the documents of lines no longer in the file are dropped.
+
+    Args:
+        file_path: Path to the input file
+        store: Annotation store receiving the documents
+        maxlines: Maximum number of lines to process from input file
+        batch_size: Number of lines annotated per pipeline call
+        force: Whether to re-annotate lines already in the store
+        verbose: Whether to report progress on stderr
+
+    Returns:
+        Number of lines annotated
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        line_text_list = f.readlines()[:maxlines if maxlines else config.get('maxlines_infinite')]
+
+    # first position of every distinct line
+    positions = {}
+    for position, line_text in enumerate(line_text_list):
+        positions.setdefault(line_text, position)
+    pending = [line_text for line_text in positions if force or line_text not in store]
+    if verbose:
+        print(f"{len(pending)} of {len(positions)} distinct lines to annotate", file=sys.stderr)
+    if not pending:
+        if maxlines is None:
+            retain_lines(store, line_text_list, verbose)
+        return 0
+
+    nlp = init_nlp()
+    start = time.perf_counter()
+    for count, (line_text, doc) in enumerate(iter_annotated(nlp, pending, batch_size), start=1):
+        store.put(line_text, doc, positions[line_text])
+        if count % batch_size == 0:
+            store.commit()
+            if verbose:
+                print(f"{count} lines annotated", file=sys.stderr)
+    store.set_metadata(processors=PROCESSORS,
+                       package=repr(PACKAGE),
+                       stanza_version=stanza.__version__,
+                       )
+    if maxlines is None:
+        retain_lines(store, line_text_list, verbose)
+    store.commit()
+    if verbose:
+        secs = time.perf_counter() - start
+        print(f"{len(pending)} lines annotated in {secs:.1f} s ({len(pending) / secs:.2f} lines/s)", file=sys.stderr)
+    return len(pending)
+
+
+def main():
+    args = set_argparse()
+    with AnnotationStore(args.store) as store:
+        annotate_file(args.input_file_path,
+                      store,
+                      args.maxlines,
+                      args.batch_size,
+                      args.force,
+                      args.verbose,
+                      )
+
+
+if __name__ == '__main__':
+    main()
@@ -2,14 +2,39 @@
 """
 Obtain Constituency Grammar Trees from constitución text.
 This script processes Spanish text and generates constituency grammar trees using Stanza.
+With --from-out, the trees are read back from a previous output of this script instead,
+so that the grup.nom, categories, tree nodes and production analyses run without Stanza.
 """
 
 import argparse
 from collections import Counter
 import pprint as pp
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterator, Optional
 
-import stanza
+from src.config.config import Config
+from src.util.batch_annotate import iter_annotated, BATCH_SIZE
+from src.util.bracketed_reader import iter_out_trees
+from src.util.compact_tree import TreeBank
+from src.util.nlp_daemon import stanza_pipeline
+from src.util.np_lexicon import NPLexicon, noun_phrases
+from src.util.output_sink import OutputSink, open_sink
+from src.util.production_store import FULL_TREES, TREES_METADATA, ProductionStore, tree_productions
+from src.util.script_io import add_output_arguments, add_source_arguments, open_output, open_source
+from src.util.subtree_table import SubtreeTable
 from src.util.tags import upos_tags
+from src.util.tree_walker import TreeVisitor, walk_tree
+
+if TYPE_CHECKING:
+    import stanza
+
+config = Config().config
+
+# Stanza processors run by this script
+PROCESSORS = 'tokenize,mwt,pos,constituency'
+
+# Stanza processors run with -n, lemmas being indexed in the noun phrase lexicon
+LEMMA_PROCESSORS = 'tokenize,mwt,pos,lemma,constituency'
 
 
 def set_argparse() -> argparse.Namespace:
@@ -38,6 +63,35 @@ def set_argparse() -> argparse.Namespace:
                         help='summarize accumulated counts for each line (default: False)',
                         action="store_true",
                         )
+    add_source_arguments(parser)
+    parser.add_argument('-f', '--forest',
+                        help='also save the compact trees of all sentences to this .npz file',
+                        )
+    parser.add_argument('-p', '--productions',
+                        nargs='?',
+                        const=config.get('production_store'),
+                        help='count the productions of the full trees, grup.noms included whatever -g, and save '
+                             'their counts per article, or per sentence with --from-out, to this production store '
+                             f"(default path: {config.get('production_store')})",
+                        )
+    parser.add_argument('-n', '--np-lexicon',
+                        nargs='?',
+                        const=config.get('np_lexicon'),
+                        help='save the grup.nom noun phrases of each article, with their lemmas and sentences, '
+                             f"to this noun phrase lexicon, adding lemma to the Stanza processors "
+                             f"(default path: {config.get('np_lexicon')})",
+                        )
+    parser.add_argument('--subtrees',
+                        help='share identical subtrees in a hash-consing table, memoizing collapsed grup.noms, '
+                             'and print the most repeated constituents at the end of the output',
+                        action="store_true",
+                        )
+    add_output_arguments(parser)
+    parser.add_argument('--from-out',
+                        help='read the trees printed in a previous output of this script, given as input file, '
+                             'instead of parsing text with Stanza',
+                        action="store_true",
+                        )
     parser.add_argument('input_file_path',
                         help='Path to the input file'
                         )
@@ -45,42 +99,119 @@ def set_argparse() -> argparse.Namespace:
     args.prog = parser.prog
     
     args.grupnom = args.grupnom or args.summarize
+    if args.from_out and args.np_lexicon:
+        parser.error('--np-lexicon indexes noun phrases by article, which --from-out does not read')
     
     return args
 
 
-def init_nlp(use_gpu: bool = True) -> stanza.Pipeline:
+def init_nlp(use_gpu: bool = True, processors: str = PROCESSORS) -> 'stanza.Pipeline':
     """
     Initialize the Stanza NLP pipeline.
 
     Args:
         use_gpu: Whether to use GPU acceleration if available
+        processors: Stanza processors to run
 
     Returns:
-        Stanza Pipeline object or None if initialization fails
+        Stanza Pipeline object
 
     Raises:
         Exception: If pipeline initialization fails for any reason
     """
     try:
-        return stanza.Pipeline('es',
+        return stanza_pipeline('es',
+                               processors,
                                use_gpu=use_gpu,
-                               processors='tokenize,mwt,pos,constituency',
-                               download_method=None,
                                )
     except Exception as e:
         raise Exception(f"Failed to initialize Stanza pipeline: {e}") from e
 
 
+class TreePrinter(TreeVisitor):
+    """
+    Visitor printing a constituency parse tree with proper indentation,
+    while accumulating grup.noms, gramatical categories and tree nodes over the whole tree.
+    """
+    INDENT_SIZE = 4  # Number of spaces for each level of indentation
+
+    def __init__(self,
+                 indent: int = 0,
+                 grupnom: bool = False,
+                 summarize: bool = False,
+                 categories: bool = False,
+                 treenodes: bool = False,
+                 subtrees: SubtreeTable = None,
+                 subtree_ids: dict[int, int] = None,
+                 out: OutputSink = None,
+                 ):
+        self.indent = indent
+        self.grupnom = grupnom
+        self.summarize = summarize
+        self.categories = categories
+        self.treenodes = treenodes
+        # subtree table, and subtree id of each node of the tree, by id() of the node
+        self.subtrees = subtrees
+        self.subtree_ids = subtree_ids
+        self.print = out.print if out is not None else print
+        self.grupnom_set = set()
+        self.category_set = set()
+        self.treenode_count = Counter()
+        # grup.nom being collapsed, and its leaf labels collected so far
+        self._group_node = None
+        self._group_leaves = []
+
+    def enter(self, node: 'ParseTree', depth: int) -> bool:
+        if self._group_node is not None:
+            if not node.children:
+                self._group_leaves.append(node.label)
+            return True
+
+        if self.categories and node.label not in upos_tags:
+            self.category_set.add(node.label)
+
+        if self.treenodes and node.label not in upos_tags and node.children:
+            self.treenode_count[(node.label, ) + tuple(c.label for c in node.children)] += 1
+
+        if self.grupnom and node.label == 'grup.nom':
+            if self.subtrees is not None:
+                self._print_group(node, depth, self.subtrees.text(self.subtree_ids[id(node)]))
+                return False
+            self._group_node = node
+            self._group_leaves = [] if node.children else [node.label]
+            return True
+
+        indent = self.indent + depth * self.INDENT_SIZE
+        if node.label in upos_tags:
+            self.print(f"{' ' * indent}{node.label} {node.children[0].label}")
+            return False
+
+        self.print(f"{' ' * indent}{node.label}")
+        return True
+
+    def leave(self, node: 'ParseTree', depth: int) -> None:
+        if node is self._group_node:
+            self._print_group(node, depth, ' '.join(self._group_leaves))
+            self._group_node = None
+            self._group_leaves = []
+
+    def _print_group(self, node: 'ParseTree', depth: int, group_text: str) -> None:
+        self.print(f"{' ' * (self.indent + depth * self.INDENT_SIZE)}{node.label} {group_text}")
+        if self.summarize:
+            self.grupnom_set.add(group_text)
+
+
 def print_tree(tree: 'ParseTree',
                indent: int = 0,
                grupnom: bool = False,
                summarize: bool = False,
                categories: bool = False,
                treenodes: bool = False,
-               ) -> set[str]:
+               subtrees: SubtreeTable = None,
+               out: OutputSink = None,
+               ) -> tuple[set[str], set[str], Counter]:
     """
-    Print a constituency parse tree with proper indentation.
+    Print a constituency parse tree with proper indentation, in a single iterative traversal.
     
     Args:
         tree: The constituency parse tree object to print
@@ -89,142 +220,219 @@ def print_tree(tree: 'ParseTree',
         summarize: Whether to summarize accumulated counts for each line (default: False)
         categories: Whether to produce a set of gramatical categories at the end of the output (default: False)
         treenodes: Whether to produce a Counter of tree nodes at the end of the output (default: False)
+        subtrees: Table where to add the subtrees of the tree, memoizing the text of collapsed grup.noms, if any
+        out: Output sink where to print the tree (default: stdout)
     
     Returns:
         - set of collapsed grup.noms if summarize is True, else the empty set
         - set of gramatical categories if categories is True, else the empty set
-        - Counter of tree nodes if treenodes is True, else the empty set
+        - Counter of tree nodes if treenodes is True, else the empty Counter
     """
-    INDENT_SIZE = 4  # Number of spaces for each level of indentation
+    subtree_ids = subtrees.add_parse_tree(tree) if subtrees is not None else None
+    printer = walk_tree(tree,
+                        TreePrinter(indent, grupnom, summarize, categories, treenodes, subtrees, subtree_ids, out),
+                        )
+    return printer.grupnom_set, printer.category_set, printer.treenode_count
 
-    def get_tree_text(tree: 'ParseTree') -> str:
-        """Return text for the whole tree."""
-
-        if not tree.children:
-            return tree.label
-
-        return ' '.join([get_tree_text(c) for c in tree.children])
-
-    category_set = set()
-    if categories and tree.label not in upos_tags:
-        category_set.add(tree.label)
-
-    treenode_count = Counter()
-    if treenodes and tree.label not in upos_tags and tree.children:
-        new_node = (tree.label, ) + tuple(c.label for c in tree.children)
-        treenode_count[new_node] += 1
-
-    if grupnom and tree.label == 'grup.nom':
-        group_text = get_tree_text(tree)
-        print(f"{' ' * indent}{tree.label} {group_text}")
-        return ({group_text} if summarize else set(),
-                category_set,
-                treenode_count,
-                )
-
-    if tree.label in upos_tags:
-        print(f"{' ' * indent}{tree.label} {tree.children[0].label}")
-        return set(), category_set, treenode_count
-
-    print(f"{' ' * indent}{tree.label}")
-    grupnom_set = set()
-    for child in tree.children:
-        grupnom_subset, category_subset, treenode_subcount = (
-            print_tree(child,
-                       indent + INDENT_SIZE,
-                       grupnom=grupnom,
-                       summarize=summarize,
-                       categories=categories,
-                       treenodes=treenodes,
-                       )
-        )
-        grupnom_set |= grupnom_subset
-        category_set |= category_subset
-        treenode_count += treenode_subcount
-    return grupnom_set, category_set, treenode_count
+
+def iter_out_documents(file_path: str, maxlines: int = None) -> Iterator[tuple[str, SimpleNamespace]]:
+    """
+    Read the trees printed in an output of this script, as (sentence text, document) pairs.
+
+    Each document holds a single sentence, with the text and constituency attributes of a Stanza sentence.
+
+    Args:
+        file_path: Path to the output file, e.g. 03_01_stanza_const_parse.out
+        maxlines: Maximum number of trees to read
+    """
+    for count, (sentence_text, tree) in enumerate(iter_out_trees(file_path)):
+        if maxlines is not None and count >= maxlines:
+            return
+        sentence_text = sentence_text or ''
+        yield sentence_text, SimpleNamespace(sentences=[SimpleNamespace(text=sentence_text, constituency=tree)])
+
+
+def sentence_lemmas(sentence: 'stanza.models.common.doc.Sentence') -> Optional[list[str]]:
+    """Return the lemmas of the words of a sentence, or None if it has no lemmas."""
+    lemmas = [getattr(word, 'lemma', None) for word in getattr(sentence, 'words', [])]
+    return lemmas if lemmas and None not in lemmas else None
+
+
+def treenode_records(treenode_count: Counter) -> list[dict]:
+    """Return tree node counts as JSON-serializable records, most frequent first."""
+    return [{'node': list(node), 'count': count} for node, count in treenode_count.most_common()]
 
 
 def process_file(file_path: str,
-                 nlp: stanza.Pipeline,
+                 nlp: 'stanza.Pipeline',
                  maxlines: int = None,
+                 batch_size: int = BATCH_SIZE,
                  grupnom: bool = False,
                  summarize: bool = False,
                  categories: bool = False,
                  treenodes: bool = False,
+                 forest_path: str = None,
+                 productions_path: str = None,
+                 from_out: bool = False,
+                 subtrees: bool = False,
+                 np_lexicon_path: str = None,
+                 out: OutputSink = None,
                  ) -> None:
     """
     Process a text file and print its constituency trees.
     
     Args:
         file_path: Path to the input file
-        nlp: Initialized Stanza pipeline
+        nlp: Initialized Stanza pipeline, unused if from_out is True
         maxlines: Maximum number of lines to process from input file
+        batch_size: Number of lines annotated per pipeline call
         grupnom: Whether to collapse grup.noms as single leaf nodes (default: False)
         summarize: Whether to summarize accumulated counts for each line (default: False)
         categories: Whether to produce a set of gramatical categories at the end of the output (default: False)
         treenodes: Whether to produce a Counter of tree nodes at the end of the output (default: False)
+        forest_path: Path of the .npz file where to save the compact trees of all sentences, if any
+        productions_path: Path of the production store where to save the production counts of each line, if any
+        from_out: Whether file_path is an output of this script, whose trees are read instead of parsed
+        subtrees: Whether to share identical subtrees and print the most repeated ones at the end of the output
+        np_lexicon_path: Path of the noun phrase lexicon where to save the grup.noms of each line, if any
+        out: Output sink of the trees and counts (default: text to stdout)
 
     Raises:
         FileNotFoundError: If input file does not exist
         Exception: If parsing fails
     """
+    own_out = out is None
+    out = open_sink() if own_out else out
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            line_text_list = f.readlines()
+        if from_out:
+            documents = iter_out_documents(file_path, maxlines)
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                line_text_list = f.readlines()
+            documents = iter_annotated(nlp, line_text_list[:maxlines], batch_size)
 
         all_category_set = set()
         all_treenode_counts = Counter()
-        for line_text in line_text_list[:maxlines]:
-            doc = nlp(line_text)
+        forest = TreeBank() if forest_path else None
+        productions = ProductionStore(productions_path) if productions_path else None
+        subtree_table = SubtreeTable() if subtrees else None
+        np_lexicon = NPLexicon(np_lexicon_path) if np_lexicon_path else None
+        # texts of the articles processed, sentences with from_out
+        article_texts = []
+        for position, (line_text, doc) in enumerate(documents):
+            article_texts.append(line_text)
+            article_productions = Counter()
+            article_phrases = []
             for sentence in doc.sentences:
-                print(sentence.text)
+                out.print(sentence.text)
                 tree = sentence.constituency
-                print(tree)
+                out.print(tree)
+                if forest is not None:
+                    forest.add_parse_tree(tree)
+                if productions is not None:
+                    article_productions += tree_productions(tree)
+                if np_lexicon is not None:
+                    article_phrases.append(noun_phrases(tree, sentence_lemmas(sentence)))
                 grupnom_set, category_set, treenode_count = print_tree(tree,
                                                                         grupnom=grupnom,
                                                                         summarize=summarize,
                                                                         categories=categories,
                                                                         treenodes=treenodes,
+                                                                        subtrees=subtree_table,
+                                                                        out=out,
                                                                         )
                 if summarize:
                     if grupnom:
-                        print('Set of grup.nom:')
-                        pp.pprint(grupnom_set)
+                        out.print('Set of grup.nom:')
+                        out.print(pp.pformat(grupnom_set))
+                    if categories:
+                        out.print(f'Set of gramatical categories ({len(category_set)}):')
+                        out.print(pp.pformat(category_set))
+                    if treenodes:
+                        out.print(f'Tree nodes count: ({len(treenode_count)}):')
+                        out.print(pp.pformat(treenode_count))
+                if out.structured:
+                    record = {'type': 'sentence', 'text': sentence.text, 'tree': str(tree)}
+                    if summarize:
+                        record['grupnom'] = grupnom_set
                     if categories:
-                        print(f'Set of gramatical categories ({len(category_set)}):')
-                        pp.pprint(category_set)
+                        record['categories'] = category_set
                     if treenodes:
-                        print(f'Tree nodes count: ({len(treenode_count)}):')
-                        pp.pprint(treenode_count)
+                        record['treenodes'] = treenode_records(treenode_count)
+                    out.record(record)
                 if categories:
                     all_category_set |= category_set
                 if treenodes:
                     all_treenode_counts += treenode_count
-                print()
-        print(f'Total different gramatical categories ({len(all_category_set)}):')
-        pp.pprint(all_category_set)
-        print(f'Total tree node counts: ({len(all_treenode_counts)}):')
-        pp.pprint(all_treenode_counts)
+                out.print()
+            if productions is not None:
+                productions.set_article(position, line_text, article_productions)
+            if np_lexicon is not None:
+                np_lexicon.set_article(position, line_text, article_phrases)
+        out.print(f'Total different gramatical categories ({len(all_category_set)}):')
+        out.print(pp.pformat(all_category_set))
+        out.print(f'Total tree node counts: ({len(all_treenode_counts)}):')
+        out.print(pp.pformat(all_treenode_counts))
+        if subtree_table is not None:
+            out.print('Repeated constituents:')
+            for line in subtree_table.summary():
+                out.print(line)
+        if out.structured:
+            record = {'type': 'summary',
+                      'categories': all_category_set,
+                      'treenodes': treenode_records(all_treenode_counts),
+                      }
+            if subtree_table is not None:
+                record['repeated'] = [{'label': subtree_table.label(subtree_id),
+                                       'text': subtree_table.text(subtree_id),
+                                       'count': count,
+                                       } for subtree_id, count in subtree_table.repeated(10)]
+            out.record(record)
+        if forest is not None:
+            forest.save(forest_path)
+        if productions is not None:
+            productions.set_metadata(**{TREES_METADATA: FULL_TREES})
+            if maxlines is None:
+                productions.retain(article_texts)
+            productions.close()
+        if np_lexicon is not None:
+            if maxlines is None:
+                np_lexicon.retain(article_texts)
+            np_lexicon.close()
     except FileNotFoundError:
+        out.flush()
         print(f"Error: File {file_path} not found")
     except Exception as e:
+        out.flush()
         print(f"Error processing file: {e}")
+    finally:
+        if own_out:
+            out.close()
 
 
 def main():
     args = set_argparse()
-    nlp = init_nlp()
-    if nlp is None:
-        return
-
-    process_file(args.input_file_path,
-                 nlp,
-                 args.maxlines,
-                 args.grupnom,
-                 args.summarize,
-                 args.categories,
-                 args.treenodes,
-                 )
+    processors = LEMMA_PROCESSORS if args.np_lexicon else PROCESSORS
+    with open_source(args,
+                     processors,
+                     lambda: init_nlp(processors=processors),
+                     offline=args.from_out,
+                     ) as nlp, open_output(args) as out:
+        process_file(args.input_file_path,
+                     nlp,
+                     args.maxlines,
+                     args.batch_size,
+                     args.grupnom,
+                     args.summarize,
+                     args.categories,
+                     args.treenodes,
+                     args.forest,
+                     args.productions,
+                     args.from_out,
+                     args.subtrees,
+                     args.np_lexicon,
+                     out,
+                     )
 
 
 if __name__ == '__main__':
@@ -1,21 +1,39 @@
 #!/usr/bin/env python
 """
 Obtain a Dependency Parse from constitución text.
+With --from-conllu, the parse is read back from a CoNLL-U file written with --conllu instead,
+so that the dependency analyses run without Stanza.
 """
 
 import argparse
 from collections import Counter
+from itertools import islice
 import pprint as pp
-import sys
+from typing import TYPE_CHECKING
 
-import numpy as np
 import pandas as pd
-import stanza
 
+from src.util.batch_annotate import iter_annotated, BATCH_SIZE
+from src.util.conllu import iter_documents, write_document
+from src.util.corpus_stats import frequency_counter
+from src.util.deptree import DepTree
+from src.util.nlp_daemon import stanza_pipeline
+from src.util.output_sink import OutputSink, open_sink
 from src.util.pandas_config import configure_pandas_display
+from src.util.script_io import add_output_arguments, add_source_arguments, open_output, open_source
+from src.util.token_table import TokenTableBuilder, write_token_table
+
+if TYPE_CHECKING:
+    import stanza
 
 configure_pandas_display()
 
+# Stanza processors run by this script
+PROCESSORS = 'tokenize,mwt,pos,lemma,depparse'
+
+# content cache stage for this script's annotations
+CACHE_STAGE = f'stanza:{PROCESSORS}'
+
 
 def set_argparse() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Obtain a Dependency Parse from constitución text.')
@@ -27,6 +45,20 @@ def set_argparse() -> argparse.Namespace:
                         type=int,
                         help='max number of input lines to process',
                         )
+    add_source_arguments(parser)
+    parser.add_argument('-t', '--token-table',
+                        help='also write the token table of the processed lines to this path (.arrow or .parquet)',
+                        )
+    parser.add_argument('--conllu',
+                        help='also write the dependency parse of the processed lines to this CoNLL-U file, '
+                             'compressed if it ends in .gz or .zst',
+                        )
+    parser.add_argument('--from-conllu',
+                        help='read the dependency parse of a CoNLL-U file, given as input file, '
+                             'instead of parsing text with Stanza',
+                        action="store_true",
+                        )
+    add_output_arguments(parser)
     parser.add_argument('input_file_path',
                         help='Path to the input file'
                         )
@@ -35,7 +67,7 @@ def set_argparse() -> argparse.Namespace:
     return args
 
 
-def init_nlp(use_gpu: bool = True) -> stanza.Pipeline:
+def init_nlp(use_gpu: bool = True) -> 'stanza.Pipeline':
     """
     Initialize the Stanza NLP pipeline.
     
@@ -43,66 +75,83 @@ def init_nlp(use_gpu: bool = True) -> stanza.Pipeline:
         use_gpu: Whether to use GPU acceleration if available
     
     Returns:
-        Stanza Pipeline object or None if initialization fails
+        Stanza Pipeline object
     
     Raises:
         Exception: If pipeline initialization fails
     """
     try:
-        return stanza.Pipeline('es',
+        return stanza_pipeline('es',
+                               PROCESSORS,
                                use_gpu=use_gpu,
-                               processors='tokenize,mwt,pos,lemma,depparse',
-                               download_method=None,
                                )
     except Exception as e:
         raise Exception(f"Failed to initialize Stanza pipeline: {e}") from e
 
 
-def print_deptree(df: pd.DataFrame, node_index: np.int64, indent: int = 0) -> None:
+def print_deptree(tree: DepTree, out: OutputSink = None) -> None:
     """
-    Recursively print dependency tree structure.
-    
+    Print dependency tree structure, from its first root.
+
     Args:
-        df: DataFrame containing parsed sentence information
-        node_index: Index of the current node in the DataFrame
-        indent: Number of spaces for indentation level
+        tree: Dependency tree of a parsed sentence
+        out: Output sink where to print the tree (default: stdout)
     """
-    INDENT_SIZE = 4
-
-    print(f"{" " * indent}{df.loc[node_index, "word"]} -- {df.loc[node_index, "deprel"]}")
+    (out.print if out is not None else print)(tree.format_tree())
 
-    idx = df.loc[node_index, "id"]
-    children_indexes = df[df['head_id'] == idx].index
 
-    for child_ix in children_indexes:
-        print_deptree(df, child_ix, indent + INDENT_SIZE)
+def count_records(counts: Counter, columns: list[str]) -> list[dict]:
+    """Return frequency counts of token columns as JSON-serializable records, most frequent first."""
+    return [dict(zip(columns, key if len(columns) > 1 else (key, )), count=count)
+            for key, count in counts.most_common()]
 
 
-def process_file(file_path: str, nlp: stanza.Pipeline, maxlines: int = None) -> None:
+def process_file(file_path: str,
+                 nlp: 'stanza.Pipeline',
+                 maxlines: int = None,
+                 batch_size: int = BATCH_SIZE,
+                 token_table_path: str = None,
+                 out: OutputSink = None,
+                 conllu_path: str = None,
+                 from_conllu: bool = False,
+                 ) -> None:
     """
     Process a text file and print its dependency trees.
     
     Args:
         file_path: Path to the input file
-        nlp: Initialized Stanza pipeline
+        nlp: Initialized Stanza pipeline, unused if from_conllu is True
         maxlines: Maximum number of lines to process from input file
+        batch_size: Number of lines annotated per pipeline call
+        token_table_path: Path where to write the token table of the processed lines, if any
+        out: Output sink of the dependency trees and counts (default: text to stdout)
+        conllu_path: Path of the CoNLL-U file where to write the dependency parse of the processed lines, if any
+        from_conllu: Whether file_path is a CoNLL-U file, whose parse is read instead of computed
     
     Raises:
         FileNotFoundError: If input file does not exist
         ValueError: If dependency parsing fails
     """
+    own_out = out is None
+    out = open_sink() if own_out else out
+    conllu = None
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            line_text_list = f.readlines()
-
-        total_pos_counts = Counter()
-        total_deprel_pos_counts = Counter()
-        total_deprel_pos_lemma_counts = Counter()
-
-        for line_text in line_text_list[:(maxlines if maxlines else 1000000)]:
-            doc = nlp(line_text)
+        if from_conllu:
+            documents = islice(iter_documents(file_path), maxlines if maxlines else 1000000)
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                line_text_list = f.readlines()
+
+            line_text_list = line_text_list[:(maxlines if maxlines else 1000000)]
+            documents = (doc for _, doc in iter_annotated(nlp, line_text_list, batch_size))
+        conllu = open_sink(conllu_path, 'text') if conllu_path else None
+        token_table = TokenTableBuilder()
+        for doc_id, doc in enumerate(documents):
+            token_table.add_document(doc_id, doc)
+            if conllu is not None:
+                write_document(conllu, doc_id, doc)
             for sent in doc.sentences:
-                print(f"\n{sent.text}")
+                out.print(f"\n{sent.text}")
                 dep_list = []
                 for word in sent.words:
                     dep_dict = {
@@ -116,33 +165,62 @@ def process_file(file_path: str, nlp: stanza.Pipeline, maxlines: int = None) ->
                         'feats': word.feats,
                         'misc': word.misc
                     }
-                    total_pos_counts[word.upos] += 1
-                    total_deprel_pos_counts[(word.deprel,word.pos)] += 1
-                    total_deprel_pos_lemma_counts[(word.deprel,word.pos,word.lemma)] += 1
                     dep_list.append(dep_dict)
-                df = pd.DataFrame(dep_list)
-                print(df)
+                if out.structured:
+                    out.record({'type': 'sentence', 'text': sent.text, 'words': dep_list})
+                else:
+                    out.print(pd.DataFrame(dep_list))
                 try:
-                    root_index = df[df['head'] == "root"].index[0]
+                    tree = DepTree.from_sentence(sent)
+                    tree.root()
                 except Exception as e:
                     raise Exception(f"Exception while looking for head == root: {e}") from e
-                print_deptree(df, root_index)
-        pp.pprint(f"\nTotal POS counts: {total_pos_counts}")
-        pp.pprint(f"\nTotal DEPREL-POS counts: {total_deprel_pos_counts}")
-        pp.pprint(f"\nTotal DEPREL-POS-LEMMA counts: {total_deprel_pos_lemma_counts}")
+                print_deptree(tree, out)
+        table = token_table.to_table()
+        total_pos_counts = frequency_counter(table, ['upos'])
+        total_deprel_pos_counts = frequency_counter(table, ['deprel', 'upos'])
+        total_deprel_pos_lemma_counts = frequency_counter(table, ['deprel', 'upos', 'lemma'])
+        out.print(pp.pformat(f"\nTotal POS counts: {total_pos_counts}"))
+        out.print(pp.pformat(f"\nTotal DEPREL-POS counts: {total_deprel_pos_counts}"))
+        out.print(pp.pformat(f"\nTotal DEPREL-POS-LEMMA counts: {total_deprel_pos_lemma_counts}"))
+        if out.structured:
+            out.record({'type': 'summary',
+                        'pos': count_records(total_pos_counts, ['upos']),
+                        'deprel_pos': count_records(total_deprel_pos_counts, ['deprel', 'upos']),
+                        'deprel_pos_lemma': count_records(total_deprel_pos_lemma_counts, ['deprel', 'upos', 'lemma']),
+                        })
+        if token_table_path:
+            write_token_table(table, token_table_path)
     except FileNotFoundError:
+        out.flush()
         print(f"Error: File {file_path} not found")
     except Exception as e:
+        out.flush()
         print(f"Error processing file: {e}")
+    finally:
+        if conllu is not None:
+            conllu.close()
+        if own_out:
+            out.close()
 
 
 def main():
     args = set_argparse()
-    nlp = init_nlp()
-    if nlp is None:
-        return
-    
-    process_file(args.input_file_path, nlp, args.maxlines)
+    with open_source(args,
+                     PROCESSORS,
+                     init_nlp,
+                     CACHE_STAGE,
+                     offline=args.from_conllu,
+                     ) as nlp, open_output(args) as out:
+        process_file(args.input_file_path,
+                     nlp,
+                     args.maxlines,
+                     args.batch_size,
+                     args.token_table,
+                     out,
+                     args.conllu,
+                     args.from_conllu,
+                     )
 
 
 if __name__ == '__main__':
@@ -9,10 +9,21 @@ import stanza
 
 from src.util.pandas_config import configure_pandas_display
 from src.config.config import Config
+from src.util.batch_annotate import iter_annotated, BATCH_SIZE
+from src.util.nlp_daemon import stanza_pipeline
+from src.util.output_sink import OutputSink, open_sink
+from src.util.script_io import add_output_arguments, add_source_arguments, open_output, open_source
 
 configure_pandas_display()
 config = Config().config
 
+# Stanza processors run by this script
+PROCESSORS = 'tokenize,mwt,ner'
+PACKAGE = {"ner": ["ancora", "conll02"]}
+
+# content cache stage for this script's annotations
+CACHE_STAGE = f'stanza:{PROCESSORS}:{PACKAGE}'
+
 
 def set_argparse() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Obtain a list of identified Named Entities from constitución text.')
@@ -24,6 +35,8 @@ def set_argparse() -> argparse.Namespace:
                         type=int,
                         help='max number of input lines to process',
                         )
+    add_source_arguments(parser)
+    add_output_arguments(parser)
     parser.add_argument('input_file_path',
                         help='Path to the input file'
                         )
@@ -40,23 +53,27 @@ def init_nlp(use_gpu: bool = True) -> stanza.Pipeline:
         use_gpu: Whether to use GPU acceleration if available
     
     Returns:
-        Stanza Pipeline object or None if initialization fails
+        Stanza Pipeline object
     
     Raises:
         Exception: If pipeline initialization fails
     """
     try:
-        return stanza.Pipeline('es',
+        return stanza_pipeline('es',
+                               PROCESSORS,
                                use_gpu=use_gpu,
-                               processors='tokenize,mwt,ner',
-                               package={"ner": ["ancora", "conll02"]},
-                               download_method=None,
+                               package=PACKAGE,
                                )
     except Exception as e:
         raise Exception(f"Failed to initialize Stanza pipeline: {e}") from e
 
 
-def process_file(file_path: str, nlp: stanza.Pipeline, maxlines: int = None) -> None:
+def process_file(file_path: str,
+                 nlp: stanza.Pipeline,
+                 maxlines: int = None,
+                 batch_size: int = BATCH_SIZE,
+                 out: OutputSink = None,
+                 ) -> None:
     """
     Process a text file.
     
@@ -64,33 +81,46 @@ def process_file(file_path: str, nlp: stanza.Pipeline, maxlines: int = None) ->
         file_path: Path to the input file
         nlp: Initialized Stanza pipeline
         maxlines: Maximum number of lines to process from input file
+        batch_size: Number of lines annotated per pipeline call
+        out: Output sink of the entities (default: text to stdout)
     
     Raises:
         FileNotFoundError: If input file does not exist
         Exception: If dependency parsing fails
     """
+    own_out = out is None
+    out = open_sink() if own_out else out
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             line_text_list = f.readlines()
 
-        for line_text in line_text_list[:maxlines if maxlines else config.get('maxlines_infinite')]:
-            doc = nlp(line_text)
-            print(f"\n{doc.text}")
+        for _, doc in iter_annotated(nlp,
+                                     line_text_list[:maxlines if maxlines else config.get('maxlines_infinite')],
+                                     batch_size,
+                                     ):
+            out.print(f"\n{doc.text}")
             for ent in doc.ents:
-                print(f'entity: {ent.text}\t: {ent.type}')
+                out.print(f'entity: {ent.text}\t: {ent.type}')
+            if out.structured:
+                out.record({'type': 'document',
+                            'text': doc.text,
+                            'entities': [{'text': ent.text, 'type': ent.type} for ent in doc.ents],
+                            })
     except FileNotFoundError:
+        out.flush()
         print(f"Error: File {file_path} not found")
     except Exception as e:
+        out.flush()
         print(f"Error processing file: {e}")
+    finally:
+        if own_out:
+            out.close()
 
 
 def main():
     args = set_argparse()
-    nlp = init_nlp()
-    if nlp is None:
-        return
-    
-    process_file(args.input_file_path, nlp, args.maxlines)
+    with open_source(args, PROCESSORS, init_nlp, CACHE_STAGE) as nlp, open_output(args) as out:
+        process_file(args.input_file_path, nlp, args.maxlines, args.batch_size, out)
 
 
 if __name__ == '__main__':
@@ -9,11 +9,21 @@ import pprint as pp
 import stanza
 
 from src.config.config import Config
+from src.util.batch_annotate import iter_annotated, BATCH_SIZE
+from src.util.nlp_daemon import stanza_pipeline
+from src.util.output_sink import OutputSink, open_sink
 from src.util.pandas_config import configure_pandas_display
+from src.util.script_io import add_output_arguments, add_source_arguments, open_output, open_source
 
 config = Config().config
 configure_pandas_display()
 
+# Stanza processors run by this script
+PROCESSORS = 'tokenize,mwt,coref'
+
+# content cache stage for this script's annotations
+CACHE_STAGE = f'stanza:{PROCESSORS}'
+
 
 def set_argparse() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Obtain a list of co-referenced Named Entities from constitución text.')
@@ -29,6 +39,8 @@ def set_argparse() -> argparse.Namespace:
                         help='print a set of coref representative texts for each document',
                         action="store_true",
                         )
+    add_source_arguments(parser)
+    add_output_arguments(parser)
     parser.add_argument('input_file_path',
                         help='Path to the input file'
                         )
@@ -45,16 +57,15 @@ def init_nlp(use_gpu: bool = True) -> stanza.Pipeline:
         use_gpu: Whether to use GPU acceleration if available
     
     Returns:
-        Stanza Pipeline object or None if initialization fails
+        Stanza Pipeline object
     
     Raises:
         Exception: If pipeline initialization fails
     """
     try:
-        return stanza.Pipeline('es',
+        return stanza_pipeline('es',
+                               PROCESSORS,
                                use_gpu=use_gpu,
-                               processors='tokenize,mwt,coref',
-                               download_method=None,  # to save queries to source
                                )
     except Exception as e:
         raise Exception(f"Failed to initialize Stanza pipeline: {e}") from e
@@ -64,6 +75,8 @@ def process_file(file_path: str,
                  nlp: stanza.Pipeline,
                  maxlines: int = None,
                  summarize: bool = False,
+                 batch_size: int = BATCH_SIZE,
+                 out: OutputSink = None,
                  ) -> None:
     """
     Process a text file for co-reference analysis.
@@ -73,31 +86,48 @@ def process_file(file_path: str,
         nlp: Initialized Stanza pipeline for text processing
         maxlines: Maximum number of lines to process from input file (None for all lines)
         summarize: If True, print a set of co-reference representative texts for each document
+        batch_size: Number of lines annotated per pipeline call
+        out: Output sink of the co-references (default: text to stdout)
     """
     with open(file_path, 'r', encoding='utf-8') as f:
         line_text_list = f.readlines()
 
-    for line_text in line_text_list[:maxlines if maxlines else config.get('maxlines_infinite')]:
-        print(f"\n{line_text}")
-        doc = nlp(line_text)
-        print(f"{doc:C}")
-        if summarize:
-            print('Coref representative texts:')
-            coref_text_set = set()
-            for word in doc.iter_words():
-                for coref_att in word.coref_chains:
-                    coref_text_set.add(coref_att.chain.representative_text)
-            pp.pprint(coref_text_set)
-        print()
+    own_out = out is None
+    out = open_sink() if own_out else out
+    try:
+        for line_text, doc in iter_annotated(nlp,
+                                             line_text_list[:maxlines if maxlines else config.get('maxlines_infinite')],
+                                             batch_size,
+                                             ):
+            out.print(f"\n{line_text}")
+            out.print(f"{doc:C}")
+            if summarize:
+                out.print('Coref representative texts:')
+                coref_text_set = set()
+                for word in doc.iter_words():
+                    for coref_att in word.coref_chains:
+                        coref_text_set.add(coref_att.chain.representative_text)
+                out.print(pp.pformat(coref_text_set))
+            out.print()
+            if out.structured:
+                out.record({'type': 'document',
+                            'text': line_text.rstrip('\n'),
+                            'coref': [{'representative': chain.representative_text,
+                                       'mentions': [{'sentence': mention.sentence,
+                                                     'start_word': mention.start_word,
+                                                     'end_word': mention.end_word,
+                                                     } for mention in chain.mentions],
+                                       } for chain in doc.coref],
+                            })
+    finally:
+        if own_out:
+            out.close()
 
 
 def main():
     args = set_argparse()
-    nlp = init_nlp()
-    if nlp is None:
-        return
-
-    process_file(args.input_file_path, nlp, args.maxlines, args.summarize)
+    with open_source(args, PROCESSORS, init_nlp, CACHE_STAGE) as nlp, open_output(args) as out:
+        process_file(args.input_file_path, nlp, args.maxlines, args.summarize, args.batch_size, out)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Compare Stanza annotation throughput, per processor set,
+annotating line by line against annotating batches of lines.
+Batched annotations are checked against the line by line ones: words, their annotations and coref chains.
+"""
+
+import argparse
+import sys
+import time
+
+from src.config.config import Config
+from src.util.batch_annotate import iter_annotated
+from src.util.model_registry import ModelRegistry, get_stanza
+
+config = Config().config
+
+# processor sets of the 03_* sandbox scripts, with their extra pipeline options
+PROCESSOR_SETS = {
+    '03_01': ('tokenize,mwt,pos,constituency', {}),
+    '03_02': ('tokenize,mwt,pos,lemma,depparse', {}),
+    '03_03': ('tokenize,mwt,ner', {'package': {"ner": ["ancora", "conll02"]}}),
+    '03_04': ('tokenize,mwt,coref', {}),
+}
+
+# default batch sizes to compare against line by line annotation
+BATCH_SIZES = [8, 32, 128]
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Compare per-line and batched Stanza annotation throughput.')
+    parser.add_argument('-v', '--verbose', help='work verbosely', action="store_true")
+    parser.add_argument('-m', '--maxlines',
+                        type=int,
+                        default=100,
+                        help='max number of input lines to annotate (default: 100)',
+                        )
+    parser.add_argument('-b', '--batch-sizes',
+                        type=int,
+                        nargs='+',
+                        default=BATCH_SIZES,
+                        help=f'batch sizes to measure (default: {" ".join(map(str, BATCH_SIZES))})',
+                        )
+    parser.add_argument('-s', '--scripts',
+                        nargs='+',
+                        choices=list(PROCESSOR_SETS),
+                        default=list(PROCESSOR_SETS),
+                        help='scripts whose processor sets are measured (default: all)',
+                        )
+    parser.add_argument('--cpu', help='run the pipelines on CPU', action="store_true")
+    parser.add_argument('input_file_path', help='Path to the input file, e.g. constitucion_sent_cr.txt')
+
+    args = parser.parse_args()
+    args.prog = parser.prog
+
+    return args
+
+
+def doc_signature(doc) -> tuple:
+    """Return the annotations of a document, as comparable values: its words and its coref chains."""
+    chains = [(chain.representative_text, [(mention.sentence, mention.start_word, mention.end_word)
+                                           for mention in chain.mentions])
+              for chain in getattr(doc, 'coref', None) or []]
+    return doc.to_dict(), chains
+
+
+def time_per_line(nlp, lines: list[str]) -> tuple[float, list]:
+    """Annotate lines one pipeline call each; return seconds and documents."""
+    start = time.perf_counter()
+    docs = [nlp(line) for line in lines]
+    return time.perf_counter() - start, docs
+
+
+def time_batched(nlp, lines: list[str], batch_size: int) -> tuple[float, list]:
+    """Annotate lines batch_size lines per pipeline call; return seconds and documents."""
+    start = time.perf_counter()
+    docs = [doc for _, doc in iter_annotated(nlp, lines, batch_size)]
+    return time.perf_counter() - start, docs
+
+
+def main():
+    args = set_argparse()
+
+    if args.verbose:
+        print(f"Running {args.prog}:", file=sys.stderr)
+        print(f"{args.input_file_path=}", file=sys.stderr)
+
+    with open(args.input_file_path, encoding='utf-8') as f:
+        lines = f.readlines()[:args.maxlines]
+
+    print(f"{'script':>6} {'mode':>9} {'secs':>8} {'sents':>6} {'sents/s':>8} {'speedup':>8} {'diffs':>6}")
+    for script in args.scripts:
+        processors, options = PROCESSOR_SETS[script]
+        if args.verbose:
+            print(f"loading {processors}", file=sys.stderr)
+        nlp = get_stanza('es', processors, use_gpu=not args.cpu, **options)
+        # warm up, so that lazy initialization is not measured
+        nlp(lines[0])
+
+        base_secs, base_docs = time_per_line(nlp, lines)
+        base_signatures = [doc_signature(doc) for doc in base_docs]
+        sent_count = sum(len(doc.sentences) for doc in base_docs)
+        print(f"{script:>6} {'per-line':>9} {base_secs:>8.2f} {sent_count:>6} "
+              f"{sent_count / base_secs:>8.1f} {1.0:>8.2f} {0:>6}")
+        for batch_size in args.batch_sizes:
+            secs, docs = time_batched(nlp, lines, batch_size)
+            sent_count = sum(len(doc.sentences) for doc in docs)
+            # lines whose batched annotations differ from the line by line ones
+            diffs = sum(doc_signature(doc) != signature for doc, signature in zip(docs, base_signatures))
+            print(f"{script:>6} {f'b={batch_size}':>9} {secs:>8.2f} {sent_count:>6} "
+                  f"{sent_count / secs:>8.1f} {base_secs / secs:>8.2f} {diffs:>6}")
+        del nlp
+        ModelRegistry().clear()
+
+
+if __name__ == "__main__":
+    main()
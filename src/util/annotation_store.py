@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+"""
+On-disk store of fully annotated Stanza documents.
+
+A single annotation run (src/legalogic/sandbox/03_00_stanza_annotate.py) executes
+all the Stanza processors once per article and saves the resulting documents here.
+The constituency, dependency, NER and coref scripts then read their documents from the store,
+instead of re-running the neural models.
+
+Documents are keyed by the hash of the article text, in NFC form; values are pickled.
+The lines of the input file last annotated in full are kept in order, as document keys,
+so identical lines keep their own positions, and documents of lines no longer in the input are dropped.
+The processors, package and Stanza version used are kept in the store metadata.
+
+Usage:
+    with AnnotationStore('data/annotations') as store:
+        store.require('tokenize,mwt,pos,constituency')
+        doc = store(line_text)
+"""
+
+import os
+import pickle
+import sqlite3
+from typing import Any, Iterator, Optional, Sequence
+
+from src.util.content_cache import content_key
+
+STORE_FILE_NAME = 'annotations.sqlite'
+
+# stage and version parts of the document keys
+STORE_STAGE = 'stanza-document'
+STORE_VERSION = '1'
+
+
+def document_key(in_txt: str) -> str:
+    """Return the store key of an article text."""
+    return content_key(STORE_STAGE, STORE_VERSION, in_txt)
+
+
+class AnnotationStore:
+    """
+    SQLite store of annotated documents, usable as a read-only pipeline.
+
+    Called with a text it returns the stored document, as a pipeline would;
+    bulk(texts) returns a list of them, so it can be passed to iter_annotated.
+    """
+
+    def __init__(self, store_dir: str):
+        os.makedirs(store_dir, exist_ok=True)
+        self.path = os.path.join(store_dir, STORE_FILE_NAME)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS documents ('
+            ' key TEXT PRIMARY KEY,'
+            ' position INTEGER NOT NULL,'
+            ' text TEXT NOT NULL,'
+            ' value BLOB NOT NULL'
+            ')'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS lines ('
+            ' position INTEGER PRIMARY KEY,'
+            ' key TEXT NOT NULL'
+            ')'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS metadata ('
+            ' name TEXT PRIMARY KEY,'
+            ' value TEXT NOT NULL'
+            ')'
+        )
+        self._conn.commit()
+
+    @property
+    def metadata(self) -> dict[str, str]:
+        """Annotation run settings: processors, package, stanza_version."""
+        return dict(self._conn.execute('SELECT name, value FROM metadata'))
+
+    def set_metadata(self, **values: str) -> None:
+        self._conn.executemany('INSERT OR REPLACE INTO metadata (name, value) VALUES (?, ?)',
+                               [(name, str(value)) for name, value in values.items()]
+                               )
+
+    @property
+    def processors(self) -> set[str]:
+        """Stanza processors whose annotations are in the stored documents."""
+        return set(filter(None, self.metadata.get('processors', '').split(',')))
+
+    def require(self, processors: str) -> None:
+        """Raise ValueError unless the stored documents carry the annotations of every processor."""
+        missing = set(processors.split(',')) - self.processors
+        if missing:
+            raise ValueError(f"Annotation store {self.path} lacks processors: {','.join(sorted(missing))}")
+
+    def __contains__(self, in_txt: str) -> bool:
+        return self._conn.execute('SELECT 1 FROM documents WHERE key = ?',
+                                  (document_key(in_txt),)
+                                  ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+
+    def get(self, in_txt: str, default: Any = None) -> Any:
+        """Return the stored document for the text, or default if there is none."""
+        row = self._conn.execute('SELECT value FROM documents WHERE key = ?',
+                                 (document_key(in_txt),)
+                                 ).fetchone()
+        return default if row is None else pickle.loads(row[0])
+
+    def put(self, in_txt: str, doc: Any, position: Optional[int] = None) -> None:
+        """Store the document for the text; it is committed on the next commit() or close()."""
+        if position is None:
+            position = len(self)
+        self._conn.execute('INSERT OR REPLACE INTO documents (key, position, text, value) VALUES (?, ?, ?, ?)',
+                           (document_key(in_txt),
+                            position,
+                            in_txt,
+                            pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL),
+                            )
+                           )
+
+    def __call__(self, in_txt: str) -> Any:
+        return self.bulk([in_txt])[0]
+
+    def bulk(self, texts: list[str]) -> list[Any]:
+        """Return the stored documents of a list of texts; raise KeyError if any is missing."""
+        missing = object()
+        docs = [self.get(in_txt, default=missing) for in_txt in texts]
+        for in_txt, doc in zip(texts, docs):
+            if doc is missing:
+                raise KeyError(f"Text not in annotation store {self.path}: {in_txt[:60]!r}")
+        return docs
+
+    def retain(self, texts: Sequence[str]) -> int:
+        """
+        Make texts, in order, the lines of the store, and drop the documents of any other text.
+
+        Returns:
+            Number of documents dropped
+        """
+        keys = [document_key(in_txt) for in_txt in texts]
+        self._conn.execute('DELETE FROM lines')
+        self._conn.executemany('INSERT INTO lines (position, key) VALUES (?, ?)', enumerate(keys))
+        keep = set(keys)
+        stale = [(key,) for (key,) in self._conn.execute('SELECT key FROM documents') if key not in keep]
+        self._conn.executemany('DELETE FROM documents WHERE key = ?', stale)
+        return len(stale)
+
+    def iter_documents(self) -> Iterator[tuple[str, Any]]:
+        """Yield (text, document) pairs of the lines of the store, in input order."""
+        for in_txt, value in self._conn.execute('SELECT d.text, d.value'
+                                                ' FROM lines l JOIN documents d ON d.key = l.key'
+                                                ' ORDER BY l.position'):
+            yield in_txt, pickle.loads(value)
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> 'AnnotationStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
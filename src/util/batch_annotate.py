@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+"""
+Batched annotation of texts with a Stanza pipeline.
+
+Instead of one pipeline call, and one small forward pass per processor, for every text,
+texts are passed to the pipeline as lists of stanza.Document objects,
+which Stanza processes in bulk, batching across documents.
+Results are yielded in input order.
+
+Stanza's bulk processing merges the sentences of all the documents into one document,
+which is only right for processors that work sentence by sentence.
+Processors that work on whole documents, like coref, are run afterwards on each document on its own,
+so that, e.g., coreference chains never link mentions of different articles.
+"""
+
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+# default number of texts per pipeline call
+BATCH_SIZE = 32
+
+# Stanza processors working on whole documents, never run on merged documents
+DOCUMENT_PROCESSORS = ('coref', )
+
+
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[list[Any]]:
+    """Yield lists of up to batch_size consecutive items."""
+    item_iter = iter(items)
+    while batch := list(islice(item_iter, batch_size)):
+        yield batch
+
+
+def bulk_annotate(nlp: Any, texts: list[str]) -> list[Any]:
+    """
+    Annotate a list of texts in a single pipeline call.
+
+    nlp may be a stanza.Pipeline or a wrapper providing bulk(texts),
+    like CachedPipeline or DaemonPipeline.
+    Document processors, like coref, are run document by document.
+    """
+    if hasattr(nlp, 'bulk'):
+        return nlp.bulk(texts)
+    import stanza  # pylint: disable=import-outside-toplevel
+    docs = [stanza.Document([], text=text) for text in texts]
+    processors = list(nlp.processors)
+    document_processors = [name for name in processors if name in DOCUMENT_PROCESSORS]
+    if not document_processors:
+        return nlp(docs)
+    docs = nlp(docs, processors=[name for name in processors if name not in DOCUMENT_PROCESSORS])
+    return [nlp(doc, processors=document_processors) for doc in docs]
+
+
+def iter_annotated(nlp: Any, texts: Iterable[str], batch_size: int = BATCH_SIZE) -> Iterator[tuple[str, Any]]:
+    """
+    Yield (text, annotated document) pairs, in input order.
+
+    Args:
+        nlp: stanza.Pipeline, or a wrapper providing bulk(texts)
+        texts: texts to annotate, e.g. the lines of an input file
+        batch_size: number of texts per pipeline call; 1 annotates text by text
+    """
+    for batch in iter_batches(texts, batch_size):
+        yield from zip(batch, bulk_annotate(nlp, batch))
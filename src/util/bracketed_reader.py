@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+"""
+Streaming reader of bracketed constituency trees, as printed by Stanza,
+e.g. in src/legalogic/sandbox/03_01_stanza_const_parse.out.
+
+Trees are read back without Stanza, either as light BracketNode trees,
+which have the label and children attributes of Stanza's ParseTree and print the same way,
+or into a compact TreeBank (src/util/compact_tree.py).
+A tree line starts with '(', a label and a child '(' ; any other line is taken as text,
+and the last text line before a tree as the sentence of that tree.
+
+Usage:
+    for sentence_text, tree in iter_out_trees('src/legalogic/sandbox/03_01_stanza_const_parse.out'):
+        ...
+"""
+
+import re
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from src.util.compact_tree import BRACKET_TOKEN_PATTERN, TreeBank, escape_label, unescape_label
+
+# start of a line holding a tree, or its first line
+TREE_START_PATTERN = re.compile(r'\([^\s()]+ \(')
+
+
+class BracketNode:
+    """Constituency tree node with the label and children attributes of Stanza's ParseTree."""
+
+    __slots__ = ('label', 'children')
+
+    def __init__(self, label: str, children: Optional[list['BracketNode']] = None):
+        self.label = label
+        self.children = children if children is not None else []
+
+    def is_leaf(self) -> bool:
+        return not self.children
+
+    def __str__(self) -> str:
+        """The bracketed form, as Stanza prints its trees."""
+        parts = []
+        stack: list[Optional[BracketNode]] = [self]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                parts.append(')')
+                continue
+            label = escape_label(node.label)
+            if not node.children:
+                parts.append(f' {label}' if parts else label)
+                continue
+            parts.append(' (' if parts else '(')
+            parts.append(label)
+            stack.append(None)
+            stack.extend(reversed(node.children))
+        return ''.join(parts)
+
+    def __repr__(self) -> str:
+        return f'BracketNode({str(self)!r})'
+
+
+def parse_bracketed(text: str) -> BracketNode:
+    """Parse one bracketed tree; raise ValueError if it is not well formed."""
+    root = None
+    open_nodes: list[BracketNode] = []
+    expect_label = False
+    for token in BRACKET_TOKEN_PATTERN.findall(text):
+        if token == '(':
+            expect_label = True
+        elif token == ')':
+            if not open_nodes:
+                raise ValueError(f"Unbalanced bracketed tree: {text[:60]!r}")
+            open_nodes.pop()
+        else:
+            node = BracketNode(unescape_label(token))
+            if open_nodes:
+                open_nodes[-1].children.append(node)
+            elif root is None:
+                root = node
+            else:
+                raise ValueError(f"Bracketed text with several trees: {text[:60]!r}")
+            if expect_label:
+                open_nodes.append(node)
+            expect_label = False
+    if open_nodes or root is None:
+        raise ValueError(f"Unbalanced bracketed tree: {text[:60]!r}")
+    return root
+
+
+def iter_bracketed_lines(lines: Iterable[str]) -> Iterator[tuple[Optional[str], str]]:
+    """
+    Yield (sentence text, bracketed tree) for every tree of the lines.
+
+    The sentence text is the last non-tree line before the tree, or None if there is none.
+    A tree may span several lines.
+    """
+    sentence_text = None
+    tree_parts: list[str] = []
+    depth = 0
+    for line in lines:
+        if tree_parts:
+            tree_parts.append(line)
+            depth += line.count('(') - line.count(')')
+        elif TREE_START_PATTERN.match(line):
+            tree_parts.append(line)
+            depth = line.count('(') - line.count(')')
+        else:
+            if line.strip():
+                sentence_text = line.rstrip('\n')
+            continue
+        if depth <= 0:
+            yield sentence_text, ' '.join(part.strip() for part in tree_parts)
+            tree_parts = []
+            sentence_text = None
+    if tree_parts:
+        raise ValueError(f"Unterminated bracketed tree: {tree_parts[0][:60]!r}")
+
+
+def iter_out_trees(source: Union[str, IO[str]]) -> Iterator[tuple[Optional[str], BracketNode]]:
+    """Yield (sentence text, tree) for every tree of a file, given by path or as an open text file."""
+    if isinstance(source, str):
+        with open(source, encoding='utf-8') as f:
+            yield from iter_out_trees(f)
+        return
+    for sentence_text, bracketed in iter_bracketed_lines(source):
+        yield sentence_text, parse_bracketed(bracketed)
+
+
+def read_treebank(source: Union[str, IO[str]], bank: Optional[TreeBank] = None) -> TreeBank:
+    """Read every tree of a file, given by path or as an open text file, into a compact TreeBank."""
+    bank = bank if bank is not None else TreeBank()
+    if isinstance(source, str):
+        with open(source, encoding='utf-8') as f:
+            return read_treebank(f, bank)
+    for _, bracketed in iter_bracketed_lines(source):
+        bank.add_bracketed(bracketed)
+    return bank
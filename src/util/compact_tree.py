@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+
+"""
+Compact, array-backed constituency trees.
+
+A tree is stored in preorder as four int32 arrays:
+    labels        label id of each node
+    parent        index of the parent node, -1 for the root
+    first_child   index of the first child, -1 for leaves
+    next_sibling  index of the next sibling, -1 for last children
+Label ids come from a LabelVocab, whose first ids are the UPOS tags and the grammatical
+categories of src/util/tags.py, so tag and category tests are integer comparisons.
+
+A TreeBank holds a whole corpus of trees as the concatenation of their arrays,
+and is saved to and loaded from a single .npz file.
+Trees convert from and to Stanza ParseTree objects and bracketed strings,
+where parentheses inside labels are written -LRB- and -RRB-, as Stanza does.
+
+Usage:
+    PYTHONPATH=. python src/util/compact_tree.py -v src/legalogic/sandbox/03_01_stanza_const_parse.out
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+from src.util.tags import gram_categories, upos_tags
+
+# tokens of a bracketed tree
+BRACKET_TOKEN_PATTERN = re.compile(r'\(|\)|[^\s()]+')
+
+# escapes of parentheses inside labels
+LABEL_ESCAPES = {'(': '-LRB-', ')': '-RRB-'}
+LABEL_UNESCAPES = {escaped: label for label, escaped in LABEL_ESCAPES.items()}
+LABEL_UNESCAPE_PATTERN = re.compile('|'.join(map(re.escape, LABEL_UNESCAPES)))
+
+# index value meaning no node
+NO_NODE = -1
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Load the bracketed trees of a file into a compact TreeBank.')
+    parser.add_argument('-v', '--verbose', help='work verbosely', action="store_true")
+    parser.add_argument('-o', '--output', help='save the TreeBank to this .npz file')
+    parser.add_argument('input_file_path', help='file with one bracketed tree per line, among other lines')
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+class LabelVocab:
+    """Interned tree labels: UPOS tags first, then grammatical categories, then any other label (words)."""
+
+    def __init__(self, labels: Optional[Iterable[str]] = None):
+        self.labels: list[str] = []
+        self.ids: dict[str, int] = {}
+        for label in sorted(upos_tags):
+            self.intern(label)
+        self.upos_count = len(self.labels)
+        for label in sorted(gram_categories):
+            self.intern(label)
+        self.category_end = len(self.labels)
+        for label in labels or ():
+            self.intern(label)
+
+    @classmethod
+    def restore(cls, labels: list[str], upos_count: int, category_end: int) -> 'LabelVocab':
+        """Return the vocabulary with exactly the given labels and ids, e.g. as saved with a TreeBank."""
+        vocab = cls.__new__(cls)
+        vocab.labels = list(labels)
+        vocab.ids = {label: label_id for label_id, label in enumerate(vocab.labels)}
+        vocab.upos_count = upos_count
+        vocab.category_end = category_end
+        return vocab
+
+    def intern(self, label: str) -> int:
+        label_id = self.ids.get(label)
+        if label_id is None:
+            label_id = self.ids[label] = len(self.labels)
+            self.labels.append(label)
+        return label_id
+
+    def __getitem__(self, label_id: int) -> str:
+        return self.labels[label_id]
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def is_upos(self, label_ids: Any) -> Any:
+        """Whether label ids, an int or an array, are UPOS tags."""
+        return label_ids < self.upos_count
+
+    def is_category(self, label_ids: Any) -> Any:
+        """Whether label ids, an int or an array, are grammatical categories of src/util/tags.py."""
+        return (label_ids >= self.upos_count) & (label_ids < self.category_end)
+
+
+def escape_label(label: str) -> str:
+    """Return a label with every parenthesis escaped, as written in bracketed trees."""
+    if '(' in label or ')' in label:
+        for char, escaped in LABEL_ESCAPES.items():
+            label = label.replace(char, escaped)
+    return label
+
+
+def unescape_label(label: str) -> str:
+    """Return a label of a bracketed tree with every escaped parenthesis restored; undoes escape_label."""
+    if '-' in label:
+        label = LABEL_UNESCAPE_PATTERN.sub(lambda match: LABEL_UNESCAPES[match.group()], label)
+    return label
+
+
+class CompactTree:
+    """A constituency tree as preorder arrays; see the module docstring."""
+
+    def __init__(self,
+                 labels: np.ndarray,
+                 parent: np.ndarray,
+                 first_child: np.ndarray,
+                 next_sibling: np.ndarray,
+                 vocab: LabelVocab,
+                 ):
+        self.labels = labels
+        self.parent = parent
+        self.first_child = first_child
+        self.next_sibling = next_sibling
+        self.vocab = vocab
+
+    @classmethod
+    def from_lists(cls, labels: list[int], parent: list[int], vocab: LabelVocab) -> 'CompactTree':
+        """Build the tree from preorder label ids and parent indexes."""
+        size = len(labels)
+        parent_array = np.array(parent, dtype=np.int32)
+        first_child = np.full(size, NO_NODE, dtype=np.int32)
+        next_sibling = np.full(size, NO_NODE, dtype=np.int32)
+        # non-root nodes grouped by parent, siblings in preorder
+        by_parent = np.argsort(parent_array[1:], kind='stable').astype(np.int32) + 1
+        parents = parent_array[by_parent]
+        same_parent = parents[1:] == parents[:-1]
+        next_sibling[by_parent[:-1][same_parent]] = by_parent[1:][same_parent]
+        first = np.concatenate(([True], ~same_parent)) if size > 1 else np.zeros(0, dtype=bool)
+        first_child[parents[first]] = by_parent[first]
+        return cls(np.array(labels, dtype=np.int32), parent_array, first_child, next_sibling, vocab)
+
+    @classmethod
+    def from_parse_tree(cls, tree: Any, vocab: LabelVocab) -> 'CompactTree':
+        """Build the tree of a Stanza ParseTree, or any tree of nodes with label and children."""
+        labels, parent = [], []
+        stack = [(tree, NO_NODE)]
+        while stack:
+            node, node_parent = stack.pop()
+            index = len(labels)
+            labels.append(vocab.intern(node.label))
+            parent.append(node_parent)
+            stack.extend((child, index) for child in reversed(node.children))
+        return cls.from_lists(labels, parent, vocab)
+
+    @classmethod
+    def from_bracketed(cls, text: str, vocab: LabelVocab) -> 'CompactTree':
+        """Build the tree of a bracketed string, e.g. (ROOT (sentence (sn (grup.nom (PROPN Costa)))))."""
+        labels, parent = [], []
+        open_nodes = []
+        expect_label = False
+        for token in BRACKET_TOKEN_PATTERN.findall(text):
+            if token == '(':
+                expect_label = True
+            elif token == ')':
+                if not open_nodes:
+                    raise ValueError(f"Unbalanced bracketed tree: {text[:60]!r}")
+                open_nodes.pop()
+                if not open_nodes:
+                    break
+            else:
+                parent.append(open_nodes[-1] if open_nodes else NO_NODE)
+                if not open_nodes and labels:
+                    raise ValueError(f"Bracketed text with several trees: {text[:60]!r}")
+                if expect_label:
+                    open_nodes.append(len(labels))
+                labels.append(vocab.intern(unescape_label(token)))
+                expect_label = False
+        if open_nodes or not labels:
+            raise ValueError(f"Unbalanced bracketed tree: {text[:60]!r}")
+        return cls.from_lists(labels, parent, vocab)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def label(self, node: int) -> str:
+        return self.vocab[self.labels[node]]
+
+    def children(self, node: int) -> Iterator[int]:
+        child = self.first_child[node]
+        while child != NO_NODE:
+            yield int(child)
+            child = self.next_sibling[child]
+
+    def leaves(self) -> np.ndarray:
+        """Return the indexes of the leaf nodes, in order."""
+        return np.flatnonzero(self.first_child == NO_NODE)
+
+    def subtree_ends(self) -> np.ndarray:
+        """Return, for every node, the end of its subtree: the subtree of n is nodes n to subtree_ends()[n] - 1."""
+        sizes = [1] * len(self)
+        parent = self.parent.tolist()
+        for node in range(len(self) - 1, 0, -1):
+            sizes[parent[node]] += sizes[node]
+        return np.arange(len(self), dtype=np.int32) + np.array(sizes, dtype=np.int32)
+
+    def text(self, node: int = 0) -> str:
+        """Return the leaf labels of the subtree of node, the whole tree by default, separated by spaces."""
+        leaves = self.leaves()
+        if node != 0:
+            end = self.subtree_ends()[node]
+            leaves = leaves[(leaves >= node) & (leaves < end)]
+        return ' '.join(self.vocab[label_id] for label_id in self.labels[leaves].tolist())
+
+    def depths(self) -> np.ndarray:
+        """Return the depth of every node, the root being at depth 0."""
+        depths = [0] * len(self)
+        for node, node_parent in enumerate(self.parent.tolist()[1:], start=1):
+            depths[node] = depths[node_parent] + 1
+        return np.array(depths, dtype=np.int32)
+
+    def to_parse_tree(self) -> Any:
+        """Return the tree as a Stanza ParseTree."""
+        from stanza.models.constituency.parse_tree import Tree  # pylint: disable=import-outside-toplevel
+        nodes: list[Any] = [None] * len(self)
+        for node in range(len(self) - 1, -1, -1):
+            nodes[node] = Tree(label=self.label(node), children=[nodes[child] for child in self.children(node)])
+        return nodes[0]
+
+    def to_bracketed(self, node: int = 0) -> str:
+        """Return the subtree of node, the whole tree by default, as a bracketed string, as printed by Stanza."""
+        parts = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                parts.append(')')
+                continue
+            label = escape_label(self.label(node))
+            if self.first_child[node] == NO_NODE:
+                parts.append(f' {label}' if parts else label)
+                continue
+            parts.append(' (' if parts else '(')
+            parts.append(label)
+            stack.append(-1)
+            stack.extend(reversed(list(self.children(node))))
+        return ''.join(parts)
+
+
+class TreeBank:
+    """
+    A corpus of compact trees sharing one LabelVocab,
+    stored as the concatenation of their arrays, with per-tree offsets.
+    """
+
+    def __init__(self, vocab: Optional[LabelVocab] = None):
+        self.vocab = vocab if vocab is not None else LabelVocab()
+        self._parts: list[CompactTree] = []
+        self._arrays: Optional[dict[str, np.ndarray]] = None
+        self.offsets = np.zeros(1, dtype=np.int64)
+
+    def append(self, tree: CompactTree) -> None:
+        if tree.vocab is not self.vocab:
+            raise ValueError("Tree labels are interned in another vocabulary")
+        self._parts.append(tree)
+
+    def add_parse_tree(self, tree: Any) -> None:
+        self.append(CompactTree.from_parse_tree(tree, self.vocab))
+
+    def add_bracketed(self, text: str) -> None:
+        self.append(CompactTree.from_bracketed(text, self.vocab))
+
+    @property
+    def arrays(self) -> dict[str, np.ndarray]:
+        """The concatenated labels, parent, first_child and next_sibling arrays, with tree-local indexes."""
+        if self._parts:
+            previous = [] if self._arrays is None else [self._arrays]
+            parts = previous + [{'labels': tree.labels,
+                                 'parent': tree.parent,
+                                 'first_child': tree.first_child,
+                                 'next_sibling': tree.next_sibling,
+                                 } for tree in self._parts]
+            self._arrays = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+            self.offsets = np.concatenate((self.offsets,
+                                           self.offsets[-1] + np.cumsum([len(tree) for tree in self._parts])))
+            self._parts = []
+        if self._arrays is None:
+            empty = np.zeros(0, dtype=np.int32)
+            return {'labels': empty, 'parent': empty, 'first_child': empty, 'next_sibling': empty}
+        return self._arrays
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1 + len(self._parts)
+
+    def __getitem__(self, index: int) -> CompactTree:
+        arrays = self.arrays
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return CompactTree(*(arrays[name][start:end] for name in ('labels', 'parent', 'first_child', 'next_sibling')),
+                           vocab=self.vocab,
+                           )
+
+    def __iter__(self) -> Iterator[CompactTree]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        np.savez(path,
+                 offsets=self.offsets,
+                 vocab=np.array(self.vocab.labels, dtype=str),
+                 vocab_bounds=np.array([self.vocab.upos_count, self.vocab.category_end]),
+                 **self.arrays,
+                 )
+
+    @classmethod
+    def load(cls, path: str) -> 'TreeBank':
+        with np.load(path) as data:
+            bank = cls(LabelVocab.restore(data['vocab'].tolist(), *data['vocab_bounds'].tolist()))
+            bank._arrays = {name: data[name] for name in ('labels', 'parent', 'first_child', 'next_sibling')}
+            bank.offsets = data['offsets']
+        return bank
+
+
+def main():
+    args = set_argparse()
+
+    start = time.perf_counter()
+    bank = TreeBank()
+    with open(args.input_file_path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('(ROOT'):
+                bank.add_bracketed(line)
+    node_count = len(bank.arrays['labels'])
+    if args.verbose:
+        print(f"{len(bank)} trees, {node_count} nodes, {len(bank.vocab)} labels "
+              f"loaded in {time.perf_counter() - start:.3f} s", file=sys.stderr)
+    if args.output:
+        bank.save(args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+
+"""
+Streaming CoNLL-U export and import of dependency parses.
+
+Documents are written one at a time, each starting with a '# newdoc id = <doc_id>' comment,
+and each sentence with '# sent_id = <doc_id>-<sent_id>' and '# text = <text>' comments.
+Multi-word tokens get their range lines, and the character offsets of tokens and words
+are kept in the MISC column as start_char=...|end_char=..., as Stanza writes them.
+Files ending in .gz or .zst are compressed.
+
+The reader streams documents back with the attributes of Stanza documents, sentences and words
+used by DepTree.from_sentence and TokenTableBuilder.add_document, multi-word tokens as word parents,
+so dependency trees and the token table are rebuilt without Stanza.
+
+Usage:
+    PYTHONPATH=. python src/util/conllu.py -o data/annotations/tokens.arrow data/annotations/dep_parse.conllu.gz
+"""
+
+import argparse
+import gzip
+import io
+import sys
+from typing import Any, Iterator, NamedTuple, Optional, TextIO, Union
+
+import pyarrow as pa
+
+from src.util.deptree import DepTree
+from src.util.output_sink import OutputSink
+from src.util.token_table import build_token_table, write_token_table
+
+# value of empty CoNLL-U fields
+EMPTY = '_'
+
+# MISC keys of character offsets
+OFFSET_KEYS = ('start_char', 'end_char')
+
+
+class ConlluToken(NamedTuple):
+    """A multi-word token, with the attributes of a Stanza token."""
+    id: tuple[int, ...]
+    text: str
+    misc: Optional[str]
+    start_char: Optional[int]
+    end_char: Optional[int]
+
+
+class ConlluWord(NamedTuple):
+    """A word, with the attributes of a Stanza word."""
+    id: int
+    text: str
+    lemma: Optional[str]
+    upos: Optional[str]
+    xpos: Optional[str]
+    feats: Optional[str]
+    head: Optional[int]
+    deprel: Optional[str]
+    deps: Optional[str]
+    misc: Optional[str]
+    start_char: Optional[int]
+    end_char: Optional[int]
+    # multi-word token of the word, if any
+    parent: Optional[ConlluToken] = None
+
+
+class ConlluSentence(NamedTuple):
+    """A sentence, with the attributes of a Stanza sentence."""
+    sent_id: Optional[str]
+    text: Optional[str]
+    words: list[ConlluWord]
+
+
+class ConlluDocument(NamedTuple):
+    """A document, with the attributes of a Stanza document."""
+    doc_id: Optional[str]
+    sentences: list[ConlluSentence]
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Build the token table of a CoNLL-U file.')
+    parser.add_argument('-v', '--verbose', help='work verbosely', action="store_true")
+    parser.add_argument('-o', '--output',
+                        required=True,
+                        help='path of the token table, .arrow or .parquet',
+                        )
+    parser.add_argument('input_file_path',
+                        help='CoNLL-U file, e.g. written by 03_02_stanza_dep_parse.py --conllu',
+                        )
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+def _field(value: Any) -> str:
+    """Return a value as a CoNLL-U field: '_' if empty, without tabs or newlines."""
+    if value is None or value == '':
+        return EMPTY
+    return str(value).replace('\t', ' ').replace('\n', ' ')
+
+
+def _misc(misc: Optional[str], start_char: Optional[int], end_char: Optional[int]) -> str:
+    """Return the MISC field of a word or token, with its character offsets."""
+    entries = [misc] if misc else []
+    if start_char is not None and end_char is not None:
+        entries.append(f"start_char={start_char}|end_char={end_char}")
+    return _field('|'.join(entries))
+
+
+def format_sentence(sentence: Any, sent_id: str) -> str:
+    """Return the CoNLL-U lines of a Stanza sentence, ending with the blank separator line."""
+    lines = [f"# sent_id = {sent_id}"]
+    if getattr(sentence, 'text', None):
+        lines.append(f"# text = {_field(sentence.text)}")
+    for word in sentence.words:
+        token = getattr(word, 'parent', None)
+        if token is not None and len(token.id) > 1 and word.id == token.id[0]:
+            lines.append('\t'.join((f"{token.id[0]}-{token.id[-1]}", _field(token.text),
+                                    *[EMPTY] * 7,
+                                    _misc(getattr(token, 'misc', None),
+                                          getattr(token, 'start_char', None),
+                                          getattr(token, 'end_char', None)),
+                                    )))
+        lines.append('\t'.join((str(word.id),
+                                _field(word.text),
+                                _field(word.lemma),
+                                _field(word.upos),
+                                _field(word.xpos),
+                                _field(word.feats),
+                                _field(word.head),
+                                _field(word.deprel),
+                                _field(getattr(word, 'deps', None)),
+                                _misc(getattr(word, 'misc', None),
+                                      getattr(word, 'start_char', None),
+                                      getattr(word, 'end_char', None)),
+                                )))
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def write_document(out: OutputSink, doc_id: Any, doc: Any) -> None:
+    """Write a Stanza document to an output sink, as CoNLL-U."""
+    out.print(f"# newdoc id = {doc_id}")
+    for sent_id, sentence in enumerate(doc.sentences):
+        out.print(format_sentence(sentence, f"{doc_id}-{sent_id}"))
+
+
+def _open_text(path: str) -> TextIO:
+    """Open a text file for reading, decompressing it if its name ends in .gz or .zst."""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    if path.endswith('.zst'):
+        try:
+            import zstandard  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError("Reading .zst files requires the zstandard package") from e
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True),
+                                encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def _value(field: str) -> Optional[str]:
+    return None if field == EMPTY else field
+
+
+def _parse_misc(misc: str) -> tuple[str, dict[str, int]]:
+    """Return a MISC field without its character offsets, and the offsets."""
+    offsets = {}
+    if misc != EMPTY:
+        entries = []
+        for entry in misc.split('|'):
+            key, _, value = entry.partition('=')
+            if key in OFFSET_KEYS:
+                offsets[key] = int(value)
+            else:
+                entries.append(entry)
+        misc = '|'.join(entries) or EMPTY
+    return misc, offsets
+
+
+def _parse_token(fields: list[str]) -> ConlluToken:
+    first, _, last = fields[0].partition('-')
+    misc, offsets = _parse_misc(fields[9])
+    return ConlluToken(tuple(range(int(first), int(last) + 1)),
+                       fields[1],
+                       _value(misc),
+                       offsets.get('start_char'),
+                       offsets.get('end_char'),
+                       )
+
+
+def _parse_word(fields: list[str], token: Optional[ConlluToken] = None) -> ConlluWord:
+    misc, offsets = _parse_misc(fields[9])
+    return ConlluWord(int(fields[0]),
+                      fields[1],
+                      _value(fields[2]),
+                      _value(fields[3]),
+                      _value(fields[4]),
+                      _value(fields[5]),
+                      None if fields[6] == EMPTY else int(fields[6]),
+                      _value(fields[7]),
+                      _value(fields[8]),
+                      _value(misc),
+                      offsets.get('start_char'),
+                      offsets.get('end_char'),
+                      token,
+                      )
+
+
+def iter_sentences(lines: Iterator[str]) -> Iterator[tuple[Optional[str], ConlluSentence]]:
+    """
+    Yield (document id, sentence) for every sentence of CoNLL-U lines.
+
+    The document id is that of the last '# newdoc id' comment, or None before any.
+    The words of multi-word tokens get their token, from its range line, as parent; empty nodes are skipped.
+
+    Raises:
+        ValueError: If a word line does not have 10 fields
+    """
+    doc_id, sent_id, text, token = None, None, None, None
+    words: list[ConlluWord] = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.rstrip('\n')
+        if not line:
+            if words:
+                yield doc_id, ConlluSentence(sent_id, text, words)
+            sent_id, text, token, words = None, None, None, []
+        elif line.startswith('#'):
+            key, _, value = line[1:].partition('=')
+            key = key.strip()
+            if key == 'newdoc id' or key == 'newdoc':
+                doc_id = value.strip()
+            elif key == 'sent_id':
+                sent_id = value.strip()
+            elif key == 'text':
+                text = value[1:] if value.startswith(' ') else value
+        else:
+            fields = line.split('\t')
+            if len(fields) != 10:
+                raise ValueError(f"Line {line_number}: {len(fields)} CoNLL-U fields instead of 10")
+            if fields[0].isdigit():
+                word_id = int(fields[0])
+                words.append(_parse_word(fields, token if token is not None and word_id in token.id else None))
+            elif '-' in fields[0]:
+                token = _parse_token(fields)
+    if words:
+        yield doc_id, ConlluSentence(sent_id, text, words)
+
+
+def iter_documents(source: Union[str, TextIO]) -> Iterator[ConlluDocument]:
+    """Yield the documents of a CoNLL-U file, given by path or as an open text file, one at a time."""
+    if isinstance(source, str):
+        with _open_text(source) as f:
+            yield from iter_documents(f)
+        return
+    document = None
+    for doc_id, sentence in iter_sentences(source):
+        if document is not None and doc_id != document.doc_id:
+            yield document
+            document = None
+        if document is None:
+            document = ConlluDocument(doc_id, [])
+        document.sentences.append(sentence)
+    if document is not None:
+        yield document
+
+
+def iter_deptrees(source: Union[str, TextIO]) -> Iterator[DepTree]:
+    """Yield the dependency tree of every sentence of a CoNLL-U file."""
+    for document in iter_documents(source):
+        for sentence in document.sentences:
+            yield DepTree.from_sentence(sentence)
+
+
+def conllu_token_table(source: Union[str, TextIO]) -> pa.Table:
+    """Return the token table of a CoNLL-U file, documents being numbered in file order."""
+    return build_token_table(enumerate(iter_documents(source)))
+
+
+def main():
+    args = set_argparse()
+
+    table = conllu_token_table(args.input_file_path)
+    write_token_table(table, args.output)
+    if args.verbose:
+        print(f"{table.num_rows} words written to {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+"""
+Content-addressed cache for per-article processing results.
+
+Results are keyed by a hash of the article text, in NFC form,
+the processing stage name and the model/version that produced them,
+so re-runs only recompute articles whose text, stage or model changed.
+
+Entries live in a single SQLite file; values are pickled.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import unicodedata
+from typing import Any, Callable
+
+from src.util.batch_annotate import bulk_annotate
+
+CACHE_FILE_NAME = 'content_cache.sqlite'
+
+
+def normalize_text(in_txt: str) -> str:
+    """
+    Return the normalized form of a text, as used for cache keys: its NFC form.
+
+    Texts that differ only in Unicode composition share cached results;
+    white space is kept as is, since the pipelines' token offsets depend on it.
+    """
+    return unicodedata.normalize('NFC', in_txt)
+
+
+def content_key(stage: str, version: str, in_txt: str) -> str:
+    """Return the cache key for a text processed by a stage with a given model/version."""
+    key_hash = hashlib.sha256()
+    for part in (stage, version, normalize_text(in_txt)):
+        key_hash.update(part.encode('utf-8'))
+        key_hash.update(b'\0')
+    return key_hash.hexdigest()
+
+
+class ContentCache:
+    """
+    On-disk, content-addressed cache of processing results.
+
+    Usage:
+        cache = ContentCache('data/cache')
+        result = cache.get_or_compute('sentences', 'es_core_news_lg-3.8.0', text, segment)
+    """
+
+    def __init__(self, cache_dir: str):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, CACHE_FILE_NAME)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            ' key TEXT PRIMARY KEY,'
+            ' stage TEXT NOT NULL,'
+            ' version TEXT NOT NULL,'
+            ' value BLOB NOT NULL'
+            ')'
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, stage: str, version: str, in_txt: str, default: Any = None) -> Any:
+        """Return the cached result for the text, or default if there is none."""
+        row = self._conn.execute('SELECT value FROM cache WHERE key = ?',
+                                 (content_key(stage, version, in_txt),)
+                                 ).fetchone()
+        if row is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return pickle.loads(row[0])
+
+    def put(self, stage: str, version: str, in_txt: str, value: Any) -> None:
+        """Store the result for the text; it is committed on the next commit() or close()."""
+        self._conn.execute('INSERT OR REPLACE INTO cache (key, stage, version, value) VALUES (?, ?, ?, ?)',
+                           (content_key(stage, version, in_txt),
+                            stage,
+                            version,
+                            pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                            )
+                           )
+
+    def get_or_compute(self, stage: str, version: str, in_txt: str, compute: Callable[[str], Any]) -> Any:
+        """Return the cached result for the text, computing and storing it if missing."""
+        missing = object()
+        value = self.get(stage, version, in_txt, default=missing)
+        if value is missing:
+            value = compute(in_txt)
+            self.put(stage, version, in_txt, value)
+        return value
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def stats(self) -> str:
+        """Return a one-line summary of cache hits and misses."""
+        return f'content cache {self.path}: {self.hits} hits, {self.misses} misses'
+
+    def __enter__(self) -> 'ContentCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class CachedPipeline:
+    """
+    Callable wrapper of an nlp pipeline that reads its results from a ContentCache.
+
+    The pipeline itself is only loaded, through load_nlp, on the first cache miss,
+    so a re-run over unchanged articles does not pay the model load time.
+    """
+
+    def __init__(self,
+                 load_nlp: Callable[[], Callable[[str], Any]],
+                 cache: ContentCache,
+                 stage: str,
+                 version: str,
+                 ):
+        self._load_nlp = load_nlp
+        self._nlp = None
+        self.cache = cache
+        self.stage = stage
+        self.version = version
+
+    @property
+    def nlp(self) -> Callable[[str], Any]:
+        """The wrapped pipeline, loaded on first use."""
+        if self._nlp is None:
+            self._nlp = self._load_nlp()
+        return self._nlp
+
+    def __call__(self, in_txt: str) -> Any:
+        return self.cache.get_or_compute(self.stage, self.version, in_txt, lambda t: self.nlp(t))
+
+    def bulk(self, texts: list[str]) -> list[Any]:
+        """Return results for a list of texts, annotating the missing ones in a single pipeline call."""
+        missing = object()
+        results = [self.cache.get(self.stage, self.version, in_txt, default=missing) for in_txt in texts]
+        missing_indexes = [i for i, result in enumerate(results) if result is missing]
+        if missing_indexes:
+            computed = bulk_annotate(self.nlp, [texts[i] for i in missing_indexes])
+            for i, result in zip(missing_indexes, computed):
+                self.cache.put(self.stage, self.version, texts[i], result)
+                results[i] = result
+        return results
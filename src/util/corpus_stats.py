@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+"""
+Frequency tables over the token table.
+
+Counts are computed on the integer codes of the dictionary encoded columns,
+with one np.unique over a combined key per table, instead of a Counter update per word.
+Results are ordered by decreasing count, ties in order of first occurrence,
+which is the order a Counter filled word by word would print in.
+
+Usage:
+    PYTHONPATH=. python src/util/corpus_stats.py -c upos -c deprel,upos -c deprel,upos,lemma -n 20
+"""
+
+import argparse
+from collections import Counter
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.config.config import Config
+from src.util.pandas_config import configure_pandas_display
+from src.util.token_table import read_token_table
+
+configure_pandas_display()
+
+config = Config().config
+
+# column combinations counted when none is given
+DEFAULT_COLUMN_SETS = ['upos', 'deprel,upos', 'deprel,upos,lemma']
+
+# largest combined key that fits in an int64
+MAX_COMBINED_KEY = 2 ** 62
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Print frequency tables of token table columns.')
+    parser.add_argument('-t', '--token-table',
+                        default=config.get('token_table'),
+                        help=f"path of the token table (default: {config.get('token_table')})",
+                        )
+    parser.add_argument('-c', '--columns',
+                        action='append',
+                        help=f'comma separated columns to count together (repeatable; '
+                             f'default: {" ".join(DEFAULT_COLUMN_SETS)})',
+                        )
+    parser.add_argument('-n', '--top',
+                        type=int,
+                        help='print only the n most frequent combinations',
+                        )
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+def column_codes(table: pa.Table, column: str) -> tuple[np.ndarray, list[Any]]:
+    """
+    Return the integer codes of a column and the value of each code.
+
+    Dictionary columns use their dictionary indexes, nulls getting an extra None code;
+    other columns are encoded with np.unique.
+    """
+    values = table[column].combine_chunks()
+    if pa.types.is_dictionary(values.type):
+        labels = values.dictionary.to_pylist() + [None]
+        return values.indices.fill_null(len(labels) - 1).to_numpy(), labels
+    uniques, codes = np.unique(values.to_numpy(zero_copy_only=False), return_inverse=True)
+    return codes, uniques.tolist()
+
+
+def count_combinations(table: pa.Table, columns: Sequence[str]) -> tuple[list[list[Any]], np.ndarray]:
+    """
+    Count the rows of each combination of values of the columns.
+
+    Returns:
+        - per column, the values of each combination
+        - the count of each combination
+        both by decreasing count, ties in order of first occurrence
+    """
+    encoded = [column_codes(table, column) for column in columns]
+    cardinalities = [len(labels) for _, labels in encoded]
+    if np.prod(cardinalities, dtype=float) < MAX_COMBINED_KEY:
+        key = np.zeros(table.num_rows, dtype=np.int64)
+        for (codes, _), cardinality in zip(encoded, cardinalities):
+            key = key * cardinality + codes
+        _, first_rows, counts = np.unique(key, return_index=True, return_counts=True)
+    else:
+        key = np.stack([codes for codes, _ in encoded], axis=1)
+        _, first_rows, counts = np.unique(key, axis=0, return_index=True, return_counts=True)
+
+    order = np.lexsort((first_rows, -counts))
+    first_rows = first_rows[order]
+    values = [[labels[code] for code in codes[first_rows].tolist()] for codes, labels in encoded]
+    return values, counts[order]
+
+
+def frequency_table(table: pa.Table, columns: Sequence[str]) -> pd.DataFrame:
+    """Return the counts of count_combinations as a DataFrame with the columns and a count column."""
+    values, counts = count_combinations(table, columns)
+    frame = pd.DataFrame(dict(zip(columns, values)))
+    frame['count'] = counts
+    return frame
+
+
+def frequency_counter(table: pa.Table, columns: Sequence[str]) -> Counter:
+    """Return the counts of count_combinations as a Counter, keyed by value, or by tuple of values."""
+    values, counts = count_combinations(table, columns)
+    keys = values[0] if len(columns) == 1 else zip(*values)
+    return Counter(dict(zip(keys, counts.tolist())))
+
+
+def main():
+    args = set_argparse()
+    table = read_token_table(args.token_table)
+    for column_set in args.columns or DEFAULT_COLUMN_SETS:
+        columns = column_set.split(',')
+        frame = frequency_table(table, columns)
+        print(f"\n{' x '.join(columns)}: {len(frame)} combinations")
+        print(frame.head(args.top) if args.top else frame)
+
+
+if __name__ == '__main__':
+    main()
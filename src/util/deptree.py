@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+"""
+Compact dependency tree of a sentence.
+
+Built once per sentence, from a Stanza sentence or from the token table,
+with word heads and deprels as integer arrays and the children of every node
+in CSR form: the children of head id h (0 being the root) are
+children[child_offsets[h]:child_offsets[h + 1]], as word indexes in word order.
+Traversal, subtree extraction and printing are iterative and linear in the sentence length.
+
+Usage:
+    tree = DepTree.from_sentence(sentence)
+    print(tree.format_tree())
+"""
+
+from typing import Any, Iterator, Optional, Sequence
+
+import numpy as np
+import pyarrow as pa
+
+# indentation added at each tree level by format_tree
+INDENT_SIZE = 4
+
+# head id of the words without a head, as MISSING_INT in the token table
+MISSING_HEAD = -1
+
+
+class DepTree:
+    """
+    Dependency tree over the words of a sentence.
+
+    Words are referred to by their 0-based index; word index i has Stanza word id i + 1.
+    """
+
+    def __init__(self,
+                 words: Sequence[str],
+                 heads: np.ndarray,
+                 deprels: np.ndarray,
+                 deprel_labels: Sequence[Optional[str]],
+                 ):
+        """
+        Args:
+            words: word texts
+            heads: head word id of each word, 0 for the root
+            deprels: deprel code of each word, an index into deprel_labels
+            deprel_labels: deprel label of each code
+
+        Raises:
+            ValueError: If a head is missing (negative) or beyond the last word
+        """
+        self.words = words
+        self.heads = np.asarray(heads, dtype=np.int32)
+        invalid = np.flatnonzero((self.heads < 0) | (self.heads > len(self.heads)))
+        if len(invalid):
+            raise ValueError(f"Dependency tree with missing or out of range heads at word ids "
+                             f"{(invalid[:10] + 1).tolist()}: the sentence needs a dependency parse")
+        self.deprels = np.asarray(deprels, dtype=np.int32)
+        self.deprel_labels = deprel_labels
+        # stable sort by head keeps siblings in word order
+        self.children = np.argsort(self.heads, kind='stable').astype(np.int32)
+        self.child_offsets = np.zeros(len(self.heads) + 2, dtype=np.int32)
+        np.cumsum(np.bincount(self.heads, minlength=len(self.heads) + 1), out=self.child_offsets[1:])
+
+    @classmethod
+    def from_arrays(cls, words: Sequence[str], heads: Sequence[int], deprels: Sequence[Optional[str]]) -> 'DepTree':
+        """Build the tree from per-word texts, head ids (None if missing) and deprel labels."""
+        labels: dict[Optional[str], int] = {}
+        codes = [labels.setdefault(deprel, len(labels)) for deprel in deprels]
+        head_ids = np.array([MISSING_HEAD if head is None else head for head in heads], dtype=np.int32)
+        return cls(words, head_ids, np.array(codes, dtype=np.int32), list(labels))
+
+    @classmethod
+    def from_sentence(cls, sentence: Any) -> 'DepTree':
+        """Build the tree of a Stanza sentence."""
+        return cls.from_arrays([word.text for word in sentence.words],
+                               [word.head for word in sentence.words],
+                               [word.deprel for word in sentence.words],
+                               )
+
+    def __len__(self) -> int:
+        return len(self.heads)
+
+    def child_nodes(self, head_id: int) -> np.ndarray:
+        """Return the word indexes of the dependents of a head id (0 for the root), in word order."""
+        return self.children[self.child_offsets[head_id]:self.child_offsets[head_id + 1]]
+
+    def roots(self) -> np.ndarray:
+        """Return the word indexes of the root words."""
+        return self.child_nodes(0)
+
+    def root(self) -> int:
+        """Return the word index of the first root word."""
+        roots = self.roots()
+        if len(roots) == 0:
+            raise ValueError("Dependency tree without root")
+        return int(roots[0])
+
+    def deprel(self, node: int) -> Optional[str]:
+        return self.deprel_labels[self.deprels[node]]
+
+    def preorder(self, node: Optional[int] = None) -> Iterator[tuple[int, int]]:
+        """Yield (word index, depth) of the subtree of node, the first root by default, in preorder."""
+        stack = [(self.root() if node is None else node, 0)]
+        while stack:
+            node, depth = stack.pop()
+            yield node, depth
+            stack.extend((int(child), depth + 1) for child in self.child_nodes(node + 1)[::-1])
+
+    def subtree(self, node: int) -> np.ndarray:
+        """Return the word indexes of the subtree of node, node included, in word order."""
+        return np.sort(np.fromiter((n for n, _ in self.preorder(node)), dtype=np.int32))
+
+    def format_tree(self, node: Optional[int] = None, indent_size: int = INDENT_SIZE) -> str:
+        """Return the subtree of node, the first root by default, one 'word -- deprel' line per word."""
+        return '\n'.join(f"{' ' * (depth * indent_size)}{self.words[n]} -- {self.deprel(n)}"
+                         for n, depth in self.preorder(node))
+
+
+def iter_table_trees(table: pa.Table) -> Iterator[tuple[int, int, DepTree]]:
+    """
+    Yield (doc_id, sent_id, tree) for every sentence of a token table.
+
+    Deprel codes are the table dictionary indexes, shared by all the trees.
+    """
+    doc_ids = table['doc_id'].to_numpy()
+    sent_ids = table['sent_id'].to_numpy()
+    heads = table['head'].to_numpy()
+    words = table['text'].to_pylist()
+    deprel_column = table['deprel'].combine_chunks()
+    deprel_labels = deprel_column.dictionary.to_pylist() + [None]
+    deprels = deprel_column.indices.fill_null(len(deprel_labels) - 1).to_numpy()
+
+    starts = np.flatnonzero((np.diff(doc_ids) != 0) | (np.diff(sent_ids) != 0)) + 1
+    bounds = np.concatenate(([0], starts, [len(heads)])) if len(heads) else np.array([0])
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        yield (int(doc_ids[start]),
+               int(sent_ids[start]),
+               DepTree(words[start:end], heads[start:end], deprels[start:end], deprel_labels),
+               )
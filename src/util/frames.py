@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+
+"""
+Semantic frames of the verbs of the token table.
+
+A frame is a verb, with its lemma, whether it is negated or passive, its modal auxiliary if any,
+and its arguments: the nsubj, obj, iobj and obl dependents, subtypes included,
+each with its role, its full deprel, like nsubj:pass, its case marker, head word and phrase:
+the words of its dependency subtree, in order, multi-word tokens wholly inside it, like "al", as such.
+A frame is passive when a dependent of the verb has the pass subtype, like nsubj:pass in
+"Se garantiza la libertad", where the subject is what is guaranteed.
+Frames are extracted with array operations over the whole token table,
+processed in chunks of whole articles: head rows, roles, depths and ancestors are computed
+for every word at once, without walking the trees sentence by sentence.
+
+The frame table has one row per verb, with its arguments as a list column,
+and is written as an Arrow IPC file, or Parquet if its path ends in .parquet.
+It is indexed by verb lemma on load.
+
+Usage:
+    PYTHONPATH=. python src/util/frames.py build
+    PYTHONPATH=. python src/util/frames.py verb garantizar -n 20
+    PYTHONPATH=. python src/util/frames.py verbs -n 20
+"""
+
+import argparse
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.config.config import Config
+from src.util.corpus_stats import column_codes
+from src.util.pandas_config import configure_pandas_display
+from src.util.token_table import read_token_table, write_token_table
+
+configure_pandas_display()
+
+config = Config().config
+
+# part of speech of the frame predicates
+PREDICATE_UPOS = ('VERB', )
+
+# deprels of the frame arguments, without subtype
+ARGUMENT_ROLES = ('nsubj', 'obj', 'iobj', 'obl')
+
+# lemmas of the auxiliaries taken as modals
+MODAL_LEMMAS = ('poder', 'deber', 'soler', 'querer')
+
+# lemmas of the adverbs negating a verb, besides words with the Polarity=Neg feature
+NEGATION_LEMMAS = ('no', 'nunca', 'jamás', 'tampoco')
+
+# approximate number of token rows extracted at once, cut at article boundaries
+CHUNK_ROWS = 1 << 20
+
+# deprel subtype of the dependents of passive verbs
+PASSIVE_SUBTYPE = 'pass'
+
+# argument columns of the frame summaries: roles, and deprels shown apart from their role
+SUMMARY_COLUMNS = ('nsubj', 'nsubj:pass', 'obj', 'iobj', 'obl')
+
+# separator of the phrases of a role in the frame summaries
+PHRASE_SEPARATOR = '; '
+
+# type of the list column of frame arguments
+ARGUMENT_TYPE = pa.struct([('role', pa.string()),
+                           ('deprel', pa.string()),
+                           ('case', pa.string()),
+                           ('lemma', pa.string()),
+                           ('text', pa.string()),
+                           ('phrase', pa.string()),
+                           ])
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Extract and query the semantic frames of the verbs.')
+    parser.add_argument('-f', '--frames',
+                        default=config.get('frame_table'),
+                        help=f"path of the frame table (default: {config.get('frame_table')})",
+                        )
+    parser.add_argument('-n', '--top',
+                        type=int,
+                        default=20,
+                        help='number of rows to print (default: 20)',
+                        )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build', help='extract the frames of the token table')
+    build_parser.add_argument('-t', '--token-table',
+                              default=config.get('token_table'),
+                              help=f"path of the token table (default: {config.get('token_table')})",
+                              )
+    verb_parser = subparsers.add_parser('verb', help='print the frames of a verb lemma')
+    verb_parser.add_argument('lemma')
+    subparsers.add_parser('verbs', help='print the most frequent verb lemmas')
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+def _label_mask(labels: list[Optional[str]], wanted: Iterable[str]) -> np.ndarray:
+    """Return, for every code, whether its label without subtype is among the wanted ones."""
+    wanted = set(wanted)
+    return np.array([label is not None and label.split(':')[0] in wanted for label in labels], dtype=bool)
+
+
+def head_rows(doc_ids: np.ndarray, sent_ids: np.ndarray, heads: np.ndarray) -> np.ndarray:
+    """Return the row of the head of every word of token table columns, -1 for roots."""
+    new_sentence = np.ones(len(heads), dtype=bool)
+    new_sentence[1:] = (np.diff(doc_ids) != 0) | (np.diff(sent_ids) != 0)
+    sentence_start = np.flatnonzero(new_sentence)[np.cumsum(new_sentence) - 1]
+    return np.where(heads > 0, sentence_start + heads - 1, -1)
+
+
+def subtree_spans(head_row: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the first and last rows of the subtree of every word.
+
+    Bounds are pushed up to the heads of all words at once, once per tree level.
+    """
+    first = np.arange(len(head_row))
+    last = first.copy()
+    dependents = np.flatnonzero(head_row >= 0)
+    heads = head_row[dependents]
+    while True:
+        new_first, new_last = first.copy(), last.copy()
+        np.minimum.at(new_first, heads, first[dependents])
+        np.maximum.at(new_last, heads, last[dependents])
+        if np.array_equal(new_first, first) and np.array_equal(new_last, last):
+            return first, last
+        first, last = new_first, new_last
+
+
+def ancestor_tables(head_row: np.ndarray) -> tuple[np.ndarray, list[np.ndarray]]:
+    """
+    Return the depth of every word, and tables of ancestors: the k-th table holds
+    the 2**k-th ancestor of every word, roots being their own ancestors.
+
+    Depths and ancestors are doubled for all words at once, by pointer jumping.
+    """
+    ancestor = np.where(head_row >= 0, head_row, np.arange(len(head_row)))
+    depth = (head_row >= 0).astype(np.int64)
+    tables = [ancestor]
+    for _ in range(len(head_row).bit_length()):
+        if np.array_equal(ancestor[ancestor], ancestor):
+            break
+        depth = depth + depth[ancestor]
+        ancestor = ancestor[ancestor]
+        tables.append(ancestor)
+    return depth, tables
+
+
+def subtree_rows(roots: np.ndarray,
+                 head_row: np.ndarray,
+                 first: np.ndarray,
+                 last: np.ndarray,
+                 ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the rows of the subtrees of some words, as (subtree number, row) pairs,
+    grouped by subtree, rows in order.
+
+    The rows between the first and last ones of a subtree are kept if the subtree root is their ancestor,
+    so that the words of other subtrees, inside the span of non-projective ones, are left out.
+    """
+    depth, tables = ancestor_tables(head_row)
+    lengths = last[roots] - first[roots] + 1
+    pair_subtree = np.repeat(np.arange(len(roots)), lengths)
+    pair_starts = np.cumsum(lengths) - lengths
+    pair_row = first[roots][pair_subtree] + np.arange(len(pair_subtree)) - pair_starts[pair_subtree]
+    steps = depth[pair_row] - depth[roots][pair_subtree]
+    ancestor = pair_row.copy()
+    for k, table in enumerate(tables):
+        ancestor = np.where((np.maximum(steps, 0) >> k) & 1 == 1, table[ancestor], ancestor)
+    member = (steps >= 0) & (ancestor == roots[pair_subtree])
+    return pair_subtree[member], pair_row[member]
+
+
+def phrase_texts(pair_subtree: np.ndarray,
+                 pair_row: np.ndarray,
+                 subtree_count: int,
+                 text_codes: np.ndarray,
+                 text_labels: list[Optional[str]],
+                 token_codes: np.ndarray,
+                 token_labels: list[Optional[str]],
+                 token_len: np.ndarray,
+                 ) -> list[str]:
+    """
+    Return the text of every subtree, given by its (subtree number, row) pairs, as returned by subtree_rows.
+
+    A multi-word token whose words are all in the subtree is written as the token, like "al" for "a el";
+    the words of tokens split across subtrees are written as such.
+    """
+    # whether each pair starts a multi-word token wholly inside its subtree
+    pair_end = np.minimum(np.arange(len(pair_row)) + token_len[pair_row], len(pair_row)) - 1
+    whole = ((token_len[pair_row] > 1)
+             & (pair_subtree[pair_end] == pair_subtree)
+             & (pair_row[pair_end] - pair_row == token_len[pair_row] - 1))
+    # next words of these tokens, written with their first word
+    covered = np.zeros(len(pair_row) + 1, dtype=np.int64)
+    np.add.at(covered, np.flatnonzero(whole) + 1, 1)
+    np.add.at(covered, pair_end[whole] + 1, -1)
+    inside = np.cumsum(covered)[:-1] > 0
+    written = np.flatnonzero(~inside)
+    words = [token_labels[token_codes[row]] if is_token else text_labels[text_codes[row]]
+             for row, is_token in zip(pair_row[written].tolist(), whole[written].tolist())]
+    offsets = np.zeros(subtree_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pair_subtree[written], minlength=subtree_count), out=offsets[1:])
+    return [' '.join(words[start:end]) for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+
+
+def iter_article_chunks(table: pa.Table, chunk_rows: int = CHUNK_ROWS) -> Iterator[pa.Table]:
+    """Yield consecutive slices of a token table of about chunk_rows rows, cut at article boundaries."""
+    doc_ids = table['doc_id'].to_numpy()
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(doc_ids) != 0) + 1, [len(doc_ids)]))
+    cuts = np.unique(np.concatenate((starts[np.searchsorted(starts, np.arange(0, len(doc_ids), chunk_rows))],
+                                     [len(doc_ids)])))
+    for start, end in zip(cuts[:-1].tolist(), cuts[1:].tolist()):
+        yield table.slice(start, end - start)
+
+
+def extract_frames(chunk: pa.Table) -> pa.Table:
+    """Return the frame table of a token table holding whole sentences."""
+    doc_ids = chunk['doc_id'].to_numpy()
+    sent_ids = chunk['sent_id'].to_numpy()
+    head_row = head_rows(doc_ids, sent_ids, chunk['head'].to_numpy())
+    upos_codes, upos_labels = column_codes(chunk, 'upos')
+    deprel_codes, deprel_labels = column_codes(chunk, 'deprel')
+    lemma_codes, lemma_labels = column_codes(chunk, 'lemma')
+    text_codes, text_labels = column_codes(chunk, 'text')
+    feats_codes, feats_labels = column_codes(chunk, 'feats')
+
+    # frame of every predicate word, and frame of the head of every word; the extra last entry is for roots
+    predicates = np.flatnonzero(_label_mask(upos_labels, PREDICATE_UPOS)[upos_codes])
+    frame_of_row = np.full(len(head_row) + 1, -1)
+    frame_of_row[predicates] = np.arange(len(predicates))
+    head_frame = frame_of_row[head_row]
+
+    role_of_code = np.array([ARGUMENT_ROLES.index(label.split(':')[0])
+                             if label is not None and label.split(':')[0] in ARGUMENT_ROLES else -1
+                             for label in deprel_labels])
+    roles = role_of_code[deprel_codes]
+
+    negative = (_label_mask(lemma_labels, NEGATION_LEMMAS)[lemma_codes]
+                | np.array([label is not None and 'Polarity=Neg' in label for label in feats_labels])[feats_codes])
+    negations = (head_frame >= 0) & _label_mask(deprel_labels, ('advmod', ))[deprel_codes] & negative
+    negated = np.zeros(len(predicates), dtype=bool)
+    negated[head_frame[negations]] = True
+
+    passive_codes = np.array([label is not None and label.partition(':')[2] == PASSIVE_SUBTYPE
+                              for label in deprel_labels], dtype=bool)
+    passives = (head_frame >= 0) & passive_codes[deprel_codes]
+    passive = np.zeros(len(predicates), dtype=bool)
+    passive[head_frame[passives]] = True
+
+    modals = np.flatnonzero((head_frame >= 0)
+                            & _label_mask(deprel_labels, ('aux', ))[deprel_codes]
+                            & _label_mask(lemma_labels, MODAL_LEMMAS)[lemma_codes])
+    # lemma code of the first modal of every frame; the last code of dictionary columns is None
+    modal_codes = np.full(len(predicates), len(lemma_labels) - 1)
+    modal_codes[head_frame[modals][::-1]] = lemma_codes[modals][::-1]
+
+    # first case marker of every word
+    cases = np.flatnonzero((head_row >= 0) & _label_mask(deprel_labels, ('case', ))[deprel_codes])
+    case_of_row = np.full(len(head_row), -1)
+    case_of_row[head_row[cases][::-1]] = cases[::-1]
+
+    # arguments, grouped by frame, in word order
+    arguments = np.flatnonzero((head_frame >= 0) & (roles >= 0))
+    arguments = arguments[np.argsort(head_frame[arguments], kind='stable')]
+    offsets = np.zeros(len(predicates) + 1, dtype=np.int32)
+    np.cumsum(np.bincount(head_frame[arguments], minlength=len(predicates)), out=offsets[1:])
+    first, last = subtree_spans(head_row)
+    if 'token_len' in chunk.column_names:
+        token_codes, token_labels = column_codes(chunk, 'token')
+        token_len = chunk['token_len'].to_numpy()
+    else:
+        # token tables written before multi-word tokens were kept
+        token_codes, token_labels = np.zeros(len(head_row), dtype=np.int64), [None]
+        token_len = np.ones(len(head_row), dtype=np.int64)
+    phrases = phrase_texts(*subtree_rows(arguments, head_row, first, last),
+                           len(arguments),
+                           text_codes,
+                           text_labels,
+                           token_codes,
+                           token_labels,
+                           token_len,
+                           )
+
+    case_rows = case_of_row[arguments].tolist()
+    argument_struct = pa.StructArray.from_arrays(
+        [pa.array([ARGUMENT_ROLES[role] for role in roles[arguments].tolist()], type=pa.string()),
+         pa.array([deprel_labels[code] for code in deprel_codes[arguments].tolist()], type=pa.string()),
+         pa.array([text_labels[text_codes[row]] if row >= 0 else None for row in case_rows], type=pa.string()),
+         pa.array([lemma_labels[code] for code in lemma_codes[arguments].tolist()], type=pa.string()),
+         pa.array([text_labels[code] for code in text_codes[arguments].tolist()], type=pa.string()),
+         pa.array(phrases, type=pa.string()),
+         ],
+        fields=list(ARGUMENT_TYPE),
+    )
+    return pa.table({'doc_id': pa.array(doc_ids[predicates]),
+                     'sent_id': pa.array(sent_ids[predicates]),
+                     'word_id': pa.array(chunk['word_id'].to_numpy()[predicates]),
+                     'verb': pa.array([lemma_labels[code] for code in lemma_codes[predicates].tolist()],
+                                      type=pa.string()),
+                     'negated': pa.array(negated),
+                     'passive': pa.array(passive),
+                     'modal': pa.array([lemma_labels[code] for code in modal_codes.tolist()], type=pa.string()),
+                     'arguments': pa.ListArray.from_arrays(pa.array(offsets), argument_struct),
+                     })
+
+
+def build_frame_table(table: pa.Table, chunk_rows: int = CHUNK_ROWS) -> pa.Table:
+    """Return the frame table of a token table, extracted chunk by chunk."""
+    chunks = [extract_frames(chunk) for chunk in iter_article_chunks(table, chunk_rows)]
+    return pa.concat_tables(chunks) if chunks else extract_frames(table)
+
+
+def summary_column(argument: dict) -> str:
+    """Return the frame summary column of an argument: its deprel if shown apart, else its role."""
+    return argument['deprel'] if argument['deprel'] in SUMMARY_COLUMNS else argument['role']
+
+
+class FrameTable:
+    """
+    Frame table indexed by verb lemma.
+
+    Usage:
+        frames = FrameTable.load('data/annotations/frames.arrow')
+        frames.by_verb('garantizar')
+    """
+
+    def __init__(self, table: pa.Table):
+        self.table = table
+        # frame rows of every verb lemma
+        verbs = table['verb'].to_pandas()
+        self.index: dict[str, np.ndarray] = verbs.groupby(verbs, dropna=True).indices
+
+    @classmethod
+    def from_token_table(cls, table: pa.Table, chunk_rows: int = CHUNK_ROWS) -> 'FrameTable':
+        return cls(build_frame_table(table, chunk_rows))
+
+    @classmethod
+    def load(cls, path: str) -> 'FrameTable':
+        return cls(read_token_table(path))
+
+    def save(self, path: str) -> None:
+        write_token_table(self.table, path)
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def verb_counts(self) -> pd.Series:
+        """Return the number of frames of every verb lemma, most frequent first."""
+        counts = pd.Series({verb: len(rows) for verb, rows in self.index.items()}, dtype=int)
+        return counts.sort_values(ascending=False, kind='stable')
+
+    def by_verb(self, lemma: str) -> pd.DataFrame:
+        """
+        Return the frames of a verb lemma, in corpus order.
+
+        Returns:
+            DataFrame with the doc_id, sent_id, word_id, verb, negated, passive and modal columns,
+            and a column per argument role, with the phrases of that role;
+            passive subjects get their own nsubj:pass column
+        """
+        rows = self.index.get(lemma, np.zeros(0, dtype=np.int64))
+        frames = self.table.take(pa.array(rows, type=pa.int64()))
+        summary = frames.drop_columns(['arguments']).to_pandas()
+        arguments = frames['arguments'].to_pylist()
+        for column in SUMMARY_COLUMNS:
+            summary[column] = [PHRASE_SEPARATOR.join(argument['phrase'] for argument in frame_arguments
+                                                     if summary_column(argument) == column)
+                               for frame_arguments in arguments]
+        return summary
+
+
+def main():
+    args = set_argparse()
+
+    if args.command == 'build':
+        frames = FrameTable.from_token_table(read_token_table(args.token_table))
+        frames.save(args.frames)
+        print(f"{len(frames)} frames of {len(frames.index)} verbs written to {args.frames}")
+        return
+    frames = FrameTable.load(args.frames)
+    if args.command == 'verb':
+        print(frames.by_verb(args.lemma).head(args.top))
+    elif args.command == 'verbs':
+        print(frames.verb_counts().head(args.top))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+"""
+Process-wide registry of NLP models (spaCy, Stanza, Flair).
+
+Each (library, model, processors, device) combination, plus any extra load options,
+is loaded at most once per process, on first use, and shared by every caller.
+When the models loaded exceed the memory budget, the least recently used ones are evicted.
+
+Usage:
+    from src.util.model_registry import get_spacy, get_stanza
+
+    nlp = get_spacy('es_core_news_lg')
+    nlp = get_stanza('es', 'tokenize,mwt,pos,constituency')
+"""
+
+from collections import OrderedDict
+import gc
+import os
+import sys
+import threading
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+from src.config.config import Config
+from src.util.singleton import Singleton
+
+
+class ModelKey(NamedTuple):
+    """Identification of a loaded model."""
+    library: str
+    model: str
+    processors: Optional[str]
+    device: Optional[str]
+    options: tuple
+
+
+class ModelEntry(NamedTuple):
+    """A loaded model and its estimated memory size."""
+    model: Any
+    size_bytes: int
+
+
+def freeze(value: Any) -> Hashable:
+    """Return a hashable, order-independent version of a load option value."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def current_rss() -> int:
+    """Return the resident memory of this process, in bytes, or 0 if not available (Linux only)."""
+    try:
+        with open('/proc/self/statm', encoding='utf-8') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def load_spacy(model: str, processors: Optional[str], device: Optional[str], **options) -> Any:
+    """Load a spaCy pipeline; processors, if given, are the only components enabled."""
+    import spacy  # pylint: disable=import-outside-toplevel
+    if device is not None and device != 'cpu':
+        spacy.require_gpu()
+    if processors is not None:
+        options['enable'] = processors.split(',')
+    return spacy.load(model, **options)
+
+
+def load_stanza(model: str, processors: Optional[str], device: Optional[str], **options) -> Any:
+    """Load a Stanza pipeline; model is the language code."""
+    import stanza  # pylint: disable=import-outside-toplevel
+    options.setdefault('download_method', None)
+    return stanza.Pipeline(model,
+                           processors=processors,
+                           use_gpu=device != 'cpu',
+                           **options,
+                           )
+
+
+def load_flair(model: str, processors: Optional[str], device: Optional[str], **options) -> Any:
+    """Load a Flair classifier or tagger."""
+    import flair  # pylint: disable=import-outside-toplevel
+    from flair.nn import Classifier  # pylint: disable=import-outside-toplevel
+    if device is not None:
+        import torch  # pylint: disable=import-outside-toplevel
+        flair.device = torch.device(device)
+    return Classifier.load(model, **options)
+
+
+LOADERS: dict[str, Callable[..., Any]] = {
+    'spacy': load_spacy,
+    'stanza': load_stanza,
+    'flair': load_flair,
+}
+
+
+class ModelRegistry(metaclass=Singleton):
+    """
+    Singleton, thread-safe registry of lazily loaded models.
+
+    Concurrent requests for the same model wait for a single load;
+    loads of different models run in parallel.
+    Model sizes are estimated from the growth of the process resident memory during the load.
+    """
+
+    def __init__(self, memory_budget_mb: Optional[float] = None):
+        if memory_budget_mb is None:
+            memory_budget_mb = Config().config.get('model_memory_budget_mb')
+        self.memory_budget = None if memory_budget_mb is None else int(memory_budget_mb * 1024 * 1024)
+        self._models: OrderedDict[ModelKey, ModelEntry] = OrderedDict()
+        self._load_locks: dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self,
+            library: str,
+            model: str,
+            processors: Optional[str] = None,
+            device: Optional[str] = None,
+            **options,
+            ) -> Any:
+        """
+        Return the model, loading it on first use.
+
+        Args:
+            library: one of 'spacy', 'stanza', 'flair'
+            model: model name, or language code for Stanza
+            processors: Stanza processors, or spaCy components to enable, comma separated
+            device: 'cpu', 'cuda', ... ; None for the library default
+            options: extra keyword arguments for the library loader
+        """
+        if library not in LOADERS:
+            raise ValueError(f"Unknown model library: {library}")
+        key = ModelKey(library, model, processors, device, freeze(options))
+
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is not None:
+                self._models.move_to_end(key)
+                return entry.model
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    self._models.move_to_end(key)
+                    return entry.model
+
+            rss_before = current_rss()
+            loaded_model = LOADERS[library](model, processors, device, **options)
+            size_bytes = max(current_rss() - rss_before, 0)
+
+            with self._lock:
+                self._models[key] = ModelEntry(loaded_model, size_bytes)
+                self._evict(keep=key)
+            return loaded_model
+
+    def evict(self, key: ModelKey) -> None:
+        """Forget a model, so that it is reloaded on its next use."""
+        with self._lock:
+            self._models.pop(key, None)
+        release_memory()
+
+    def clear(self) -> None:
+        """Forget every model."""
+        with self._lock:
+            self._models.clear()
+        release_memory()
+
+    def loaded(self) -> list[tuple[ModelKey, int]]:
+        """Return the loaded models, least recently used first, with their estimated sizes."""
+        with self._lock:
+            return [(key, entry.size_bytes) for key, entry in self._models.items()]
+
+    def _evict(self, keep: ModelKey) -> None:
+        """Evict least recently used models, other than keep, while over budget. Called with the lock held."""
+        if self.memory_budget is None:
+            return
+        total = sum(entry.size_bytes for entry in self._models.values())
+        evicted = False
+        for key in list(self._models):
+            if total <= self.memory_budget:
+                break
+            if key == keep:
+                continue
+            total -= self._models.pop(key).size_bytes
+            evicted = True
+        if evicted:
+            release_memory()
+
+
+def release_memory() -> None:
+    """Give back memory of dropped models, including cached GPU memory if torch is in use."""
+    gc.collect()
+    torch = sys.modules.get('torch')
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def get_spacy(model: str, enable: Optional[str] = None, device: Optional[str] = None, **options) -> Any:
+    """Return the shared spaCy pipeline for a model."""
+    return ModelRegistry().get('spacy', model, enable, device, **options)
+
+
+def get_stanza(lang: str, processors: str, use_gpu: bool = True, **options) -> Any:
+    """Return the shared Stanza pipeline for a language and processors."""
+    return ModelRegistry().get('stanza', lang, processors, None if use_gpu else 'cpu', **options)
+
+
+def get_flair(model: str, device: Optional[str] = None, **options) -> Any:
+    """Return the shared Flair classifier or tagger."""
+    return ModelRegistry().get('flair', model, None, device, **options)
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+
+"""
+Local daemon that keeps NLP pipelines warm and annotates texts over a Unix domain socket.
+
+Loading a Stanza or spaCy pipeline takes tens of seconds; with the daemon running,
+scripts get annotations from already loaded pipelines instead.
+Pipelines are taken from the model registry, so each one is loaded once, on first request.
+
+Messages, both ways, are an 8-byte big-endian length followed by a pickled dict.
+The socket is created readable and writable by its owner only,
+since pickled data must only be exchanged with trusted peers.
+
+Usage:
+    PYTHONPATH=. python src/util/nlp_daemon.py serve --preload stanza:es:tokenize,mwt,pos,constituency
+    PYTHONPATH=. python src/util/nlp_daemon.py status
+    PYTHONPATH=. python src/util/nlp_daemon.py stop
+
+Scripts get a Stanza pipeline through stanza_pipeline,
+which uses the daemon when it is listening and the local registry otherwise.
+"""
+
+import argparse
+import os
+import pickle
+import socket
+import socketserver
+import struct
+import sys
+import threading
+from typing import Any, Optional
+
+from src.config.config import Config
+from src.util.batch_annotate import bulk_annotate
+from src.util.model_registry import ModelRegistry, get_stanza
+
+config = Config().config
+
+# default socket path
+SOCKET_PATH = config.get('nlp_daemon_socket', '/tmp/legalogic_nlp.sock')
+
+# message length prefix
+LENGTH_FORMAT = '>Q'
+LENGTH_SIZE = struct.calcsize(LENGTH_FORMAT)
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Keep NLP pipelines warm behind a Unix domain socket.')
+    parser.add_argument('-v', '--verbose', help='work verbosely', action="store_true")
+    parser.add_argument('-S', '--socket',
+                        default=SOCKET_PATH,
+                        help=f'path of the Unix domain socket (default: {SOCKET_PATH})',
+                        )
+    parser.add_argument('-p', '--preload',
+                        action='append',
+                        default=[],
+                        help='pipeline to load at start, as library:model[:processors], '
+                             'e.g. stanza:es:tokenize,mwt,pos,constituency (repeatable)',
+                        )
+    parser.add_argument('command',
+                        choices=['serve', 'status', 'stop'],
+                        help='serve: run the daemon; status: list its loaded models; stop: shut it down',
+                        )
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+def send_message(sock: socket.socket, message: dict) -> None:
+    """Send a length-prefixed pickled message."""
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    sock.sendall(struct.pack(LENGTH_FORMAT, len(payload)) + payload)
+
+
+def recv_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Receive exactly size bytes, or None if the peer closed the connection first."""
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_message(sock: socket.socket) -> Optional[dict]:
+    """Receive a length-prefixed pickled message, or None if the connection was closed."""
+    header = recv_exactly(sock, LENGTH_SIZE)
+    if header is None:
+        return None
+    payload = recv_exactly(sock, struct.unpack(LENGTH_FORMAT, header)[0])
+    if payload is None:
+        return None
+    return pickle.loads(payload)
+
+
+def annotate(nlp: Any, library: str, texts: list[str]) -> list[Any]:
+    """
+    Annotate a list of texts in one call to the pipeline, keeping their order.
+
+    Stanza documents are returned as such; spaCy documents as Doc.to_json() dicts,
+    since a pickled Doc would carry the whole model vocabulary along.
+    """
+    if library == 'stanza':
+        return bulk_annotate(nlp, texts)
+    if library == 'spacy':
+        return [doc.to_json() for doc in nlp.pipe(texts)]
+    return [nlp(text) for text in texts]
+
+
+class NLPRequestHandler(socketserver.BaseRequestHandler):
+    """Serve the requests of one client connection, until it closes."""
+
+    def handle(self):
+        while (request := recv_message(self.request)) is not None:
+            try:
+                reply = self.server.dispatch(request)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                reply = {'ok': False, 'error': f'{type(e).__name__}: {e}'}
+            send_message(self.request, reply)
+            if request.get('op') == 'stop':
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class NLPDaemon(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server annotating texts with pipelines from the model registry."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, verbose: bool = False):
+        """
+        Raises:
+            RuntimeError: If another daemon is listening on the socket; a stale socket file is removed
+        """
+        if daemon_available(socket_path):
+            raise RuntimeError(f"An NLP daemon is already listening on {socket_path}")
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, NLPRequestHandler)
+        finally:
+            os.umask(old_umask)
+        self.socket_path = socket_path
+        self.verbose = verbose
+        self.registry = ModelRegistry()
+        # pipelines are not thread-safe: one annotation at a time per pipeline
+        self._pipeline_locks: dict[tuple, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def dispatch(self, request: dict) -> dict:
+        """Run a request and return its reply."""
+        op = request.get('op')
+        if op in {'ping', 'stop'}:
+            return {'ok': True}
+        if op == 'status':
+            return {'ok': True, 'models': [(tuple(key), size) for key, size in self.registry.loaded()]}
+        if op == 'annotate':
+            return {'ok': True, 'docs': self.annotate(request)}
+        raise ValueError(f"Unknown request op: {op}")
+
+    def annotate(self, request: dict) -> list[Any]:
+        library = request['library']
+        options = request.get('options', {})
+        nlp = self.registry.get(library,
+                                request['model'],
+                                request.get('processors'),
+                                request.get('device'),
+                                **options,
+                                )
+        lock_key = (library, request['model'], request.get('processors'), request.get('device'), repr(options))
+        with self._locks_lock:
+            lock = self._pipeline_locks.setdefault(lock_key, threading.Lock())
+        with lock:
+            if self.verbose:
+                print(f"annotating {len(request['texts'])} texts with {lock_key}", file=sys.stderr)
+            return annotate(nlp, library, request['texts'])
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class DaemonPipeline:
+    """
+    Client-side stand-in for a pipeline served by the daemon.
+
+    Called with a text it returns one annotated document, as the pipeline would;
+    bulk(texts) annotates a list of texts in a single round trip.
+    """
+
+    def __init__(self,
+                 library: str,
+                 model: str,
+                 processors: Optional[str] = None,
+                 device: Optional[str] = None,
+                 socket_path: str = SOCKET_PATH,
+                 **options,
+                 ):
+        self.request = {
+            'op': 'annotate',
+            'library': library,
+            'model': model,
+            'processors': processors,
+            'device': device,
+            'options': options,
+        }
+        self.socket_path = socket_path
+        self._sock = None
+        self._lock = threading.Lock()
+
+    def bulk(self, texts: list[str]) -> list[Any]:
+        """Annotate a list of texts; results keep the input order."""
+        reply = self._call({**self.request, 'texts': list(texts)})
+        return reply['docs']
+
+    def __call__(self, text: str) -> Any:
+        return self.bulk([text])[0]
+
+    def _call(self, request: dict) -> dict:
+        with self._lock:
+            if self._sock is None:
+                self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._sock.connect(self.socket_path)
+            send_message(self._sock, request)
+            reply = recv_message(self._sock)
+        if reply is None:
+            raise ConnectionError(f"NLP daemon at {self.socket_path} closed the connection")
+        if not reply['ok']:
+            raise RuntimeError(f"NLP daemon error: {reply['error']}")
+        return reply
+
+    def close(self) -> None:
+        with self._lock:
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+
+
+def daemon_request(request: dict, socket_path: str = SOCKET_PATH, timeout: Optional[float] = None) -> dict:
+    """Send a single request to the daemon and return its reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        send_message(sock, request)
+        reply = recv_message(sock)
+    if reply is None:
+        raise ConnectionError(f"NLP daemon at {socket_path} closed the connection")
+    return reply
+
+
+def daemon_available(socket_path: str = SOCKET_PATH) -> bool:
+    """Whether a daemon is listening on the socket."""
+    if not os.path.exists(socket_path):
+        return False
+    try:
+        return daemon_request({'op': 'ping'}, socket_path, timeout=1.0)['ok']
+    except OSError:
+        return False
+
+
+def stanza_pipeline(lang: str, processors: str, use_gpu: bool = True, **options) -> Any:
+    """Return a Stanza pipeline: served by the daemon if it is listening, else loaded in this process."""
+    if daemon_available():
+        return DaemonPipeline('stanza', lang, processors, None if use_gpu else 'cpu', **options)
+    return get_stanza(lang, processors, use_gpu=use_gpu, **options)
+
+
+def serve(socket_path: str, preload: list[str], verbose: bool = False) -> None:
+    """Run the daemon until it receives a stop request."""
+    with NLPDaemon(socket_path, verbose=verbose) as server:
+        for spec in preload:
+            library, model, *processors = spec.split(':', 2)
+            if verbose:
+                print(f"preloading {spec}", file=sys.stderr)
+            server.registry.get(library, model, processors[0] if processors else None)
+        if verbose:
+            print(f"NLP daemon listening on {socket_path}", file=sys.stderr)
+        server.serve_forever()
+
+
+def main():
+    args = set_argparse()
+
+    if args.command == 'serve':
+        try:
+            serve(args.socket, args.preload, args.verbose)
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if not daemon_available(args.socket):
+        print(f"No NLP daemon listening on {args.socket}", file=sys.stderr)
+        sys.exit(1)
+
+    reply = daemon_request({'op': args.command}, args.socket)
+    if args.command == 'status':
+        for key, size in reply['models']:
+            print(f"{size / 2**20:10.1f} MB  {key}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+
+"""
+Persistent lexicon of noun phrases, the grup.nom constituents collapsed by 03_01_stanza_const_parse.py -g.
+
+Each phrase is kept with its normalized form (casefolded, single spaces), its lemmas,
+and postings of the sentences where it occurs: the article, by its position in the input
+(the line number, as the doc_id of the token table), and the sentence number within the article,
+with the number of occurrences. Phrase frequencies are the sums of their postings.
+As with the production store, re-processing an input line replaces its postings,
+and the hash of the article text only tells whether the line still holds the same article.
+Lexicons written before positions were kept have their postings dropped on opening, to be rebuilt.
+Phrases are queried by prefix of their normalized form, through an index range scan,
+and by any of their lemmas, or lowercase words when the parse had no lemmas;
+phrases stored with their words as lemmas get their real lemmas from the first occurrence that has them.
+
+Usage:
+    PYTHONPATH=. python src/util/np_lexicon.py prefix "asamblea"
+    PYTHONPATH=. python src/util/np_lexicon.py lemma derecho
+    PYTHONPATH=. python src/util/np_lexicon.py top -k 20
+"""
+
+import argparse
+from collections import Counter
+import os
+import sqlite3
+from typing import Any, Iterable, NamedTuple, Optional, Sequence
+
+from src.config.config import Config
+from src.util.annotation_store import document_key
+
+config = Config().config
+
+# label of the collapsed noun phrase constituents
+PHRASE_LABEL = 'grup.nom'
+
+# upper bound of the strings starting with a given prefix
+PREFIX_END = '\U0010ffff'
+
+# separator of the words and lemmas of a phrase
+WORD_SEPARATOR = ' '
+
+
+class NounPhrase(NamedTuple):
+    """A noun phrase occurrence: its words and, if known, their lemmas."""
+    text: str
+    lemmas: Optional[tuple[str, ...]]
+
+
+class LexiconEntry(NamedTuple):
+    text: str
+    normalized: str
+    lemmas: str
+    frequency: int
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Query the noun phrase lexicon.')
+    parser.add_argument('-l', '--lexicon',
+                        default=config.get('np_lexicon'),
+                        help=f"path of the noun phrase lexicon (default: {config.get('np_lexicon')})",
+                        )
+    parser.add_argument('-k', '--limit',
+                        type=int,
+                        default=20,
+                        help='max number of phrases to print (default: 20)',
+                        )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    prefix_parser = subparsers.add_parser('prefix', help='print the phrases starting with a prefix')
+    prefix_parser.add_argument('prefix')
+    lemma_parser = subparsers.add_parser('lemma', help='print the phrases with a lemma')
+    lemma_parser.add_argument('lemma')
+    subparsers.add_parser('top', help='print the most frequent phrases')
+    postings_parser = subparsers.add_parser('postings', help='print the sentences of a phrase')
+    postings_parser.add_argument('phrase')
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+def normalize_phrase(text: str) -> str:
+    """Return the normalized form of a phrase: casefolded, with single spaces between words."""
+    return WORD_SEPARATOR.join(text.casefold().split())
+
+
+def noun_phrases(tree: Any, lemmas: Optional[Sequence[str]] = None) -> list[NounPhrase]:
+    """
+    Return the outermost grup.nom constituents of a tree, as collapsed by 03_01_stanza_const_parse.py -g.
+
+    Args:
+        tree: Stanza ParseTree, or any tree of nodes with label and children
+        lemmas: lemma of every leaf of the tree, in order, if known
+    """
+    words: list[str] = []
+    spans: list[tuple[int, int]] = []
+    # entries are (node, None) for nodes to visit, or (None, start leaf) at the end of a phrase
+    stack: list[tuple[Any, Optional[int]]] = [(tree, None)]
+    inside = 0
+    while stack:
+        node, start = stack.pop()
+        if node is None:
+            spans.append((start, len(words)))
+            inside -= 1
+            continue
+        if node.label == PHRASE_LABEL and not inside:
+            if not node.children:
+                words.append(node.label)
+                spans.append((len(words) - 1, len(words)))
+                continue
+            stack.append((None, len(words)))
+            inside += 1
+        if not node.children:
+            words.append(node.label)
+        stack.extend((child, None) for child in reversed(node.children))
+    if lemmas is not None and len(lemmas) != len(words):
+        lemmas = None
+    return [NounPhrase(WORD_SEPARATOR.join(words[start:end]),
+                       tuple(lemmas[start:end]) if lemmas is not None else None)
+            for start, end in spans]
+
+
+class NPLexicon:
+    """
+    SQLite lexicon of noun phrases, with their sentence postings.
+
+    Usage:
+        with NPLexicon('data/annotations/np_lexicon.sqlite') as lexicon:
+            lexicon.set_article(line_number,
+                                article_text,
+                                [noun_phrases(sentence.constituency) for sentence in doc.sentences],
+                                )
+            lexicon.prefix('asamblea')
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        columns = {name for _, name, *_ in self._conn.execute('PRAGMA table_info(postings)')}
+        if columns and 'position' not in columns:
+            # postings keyed by article text alone, where repeated articles overwrote each other
+            self._conn.execute('DROP TABLE postings')
+        self._conn.executescript(
+            'CREATE TABLE IF NOT EXISTS phrases ('
+            ' id INTEGER PRIMARY KEY,'
+            ' text TEXT NOT NULL UNIQUE,'
+            ' normalized TEXT NOT NULL,'
+            ' lemmas TEXT NOT NULL'
+            ');'
+            'CREATE INDEX IF NOT EXISTS phrases_normalized ON phrases (normalized);'
+            'CREATE TABLE IF NOT EXISTS phrase_lemmas ('
+            ' lemma TEXT NOT NULL,'
+            ' phrase_id INTEGER NOT NULL REFERENCES phrases (id),'
+            ' PRIMARY KEY (lemma, phrase_id)'
+            ') WITHOUT ROWID;'
+            'CREATE TABLE IF NOT EXISTS postings ('
+            ' position INTEGER NOT NULL,'
+            ' sentence INTEGER NOT NULL,'
+            ' phrase_id INTEGER NOT NULL REFERENCES phrases (id),'
+            ' count INTEGER NOT NULL,'
+            ' article TEXT NOT NULL,'
+            ' PRIMARY KEY (position, sentence, phrase_id)'
+            ');'
+            'CREATE INDEX IF NOT EXISTS postings_phrase ON postings (phrase_id);'
+        )
+        self._conn.commit()
+        self._phrase_ids: dict[str, int] = {}
+        # ids of the phrases whose lemmas are their words, for want of lemmas in the parse
+        self._unlemmatized: set[int] = set()
+        for phrase_id, text, unlemmatized in self._conn.execute('SELECT id, text, lemmas = normalized FROM phrases'):
+            self._phrase_ids[text] = phrase_id
+            if unlemmatized:
+                self._unlemmatized.add(phrase_id)
+
+    def _set_lemmas(self, phrase_id: int, lemmas: str) -> None:
+        self._conn.execute('UPDATE phrases SET lemmas = ? WHERE id = ?', (lemmas, phrase_id))
+        self._conn.execute('DELETE FROM phrase_lemmas WHERE phrase_id = ?', (phrase_id,))
+        self._conn.executemany('INSERT OR IGNORE INTO phrase_lemmas (lemma, phrase_id) VALUES (?, ?)',
+                               [(lemma, phrase_id) for lemma in set(lemmas.split(WORD_SEPARATOR))]
+                               )
+
+    def phrase_id(self, phrase: NounPhrase) -> int:
+        """Return the id of a phrase, adding it if new, or setting its lemmas if it had none so far."""
+        phrase_id = self._phrase_ids.get(phrase.text)
+        if phrase_id is not None and not (phrase.lemmas and phrase_id in self._unlemmatized):
+            return phrase_id
+        normalized = normalize_phrase(phrase.text)
+        lemmas = normalize_phrase(WORD_SEPARATOR.join(phrase.lemmas)) if phrase.lemmas else normalized
+        if phrase_id is None:
+            phrase_id = self._conn.execute('INSERT INTO phrases (text, normalized, lemmas) VALUES (?, ?, ?)',
+                                           (phrase.text, normalized, lemmas)
+                                           ).lastrowid
+            self._phrase_ids[phrase.text] = phrase_id
+        self._set_lemmas(phrase_id, lemmas)
+        if phrase.lemmas:
+            self._unlemmatized.discard(phrase_id)
+        else:
+            self._unlemmatized.add(phrase_id)
+        return phrase_id
+
+    def set_article(self,
+                    position: int,
+                    article_text: str,
+                    sentence_phrases: Sequence[Iterable[NounPhrase]],
+                    ) -> None:
+        """
+        Replace the postings of the article at a position of the input; committed on the next commit() or close().
+
+        Args:
+            position: position of the article in the input, its line number
+            article_text: text of the article
+            sentence_phrases: noun phrases of each sentence of the article, in order
+        """
+        article = document_key(article_text)
+        self._conn.execute('DELETE FROM postings WHERE position = ?', (position,))
+        rows = []
+        for sentence, phrases in enumerate(sentence_phrases):
+            counts = Counter(self.phrase_id(phrase) for phrase in phrases)
+            rows.extend((position, sentence, phrase_id, count, article) for phrase_id, count in counts.items())
+        self._conn.executemany('INSERT INTO postings (position, sentence, phrase_id, count, article)'
+                               ' VALUES (?, ?, ?, ?, ?)',
+                               rows)
+
+    def retain(self, article_texts: Sequence[str]) -> int:
+        """
+        Drop the postings of every article other than article_texts, at their positions in the input.
+
+        Returns:
+            Number of articles dropped
+        """
+        keep = {(position, document_key(article_text)) for position, article_text in enumerate(article_texts)}
+        stale = [row for row in self._conn.execute('SELECT DISTINCT position, article FROM postings')
+                 if row not in keep]
+        self._conn.executemany('DELETE FROM postings WHERE position = ? AND article = ?', stale)
+        return len(stale)
+
+    def _entries(self, where: str = '', params: tuple = (), limit: Optional[int] = None) -> list[LexiconEntry]:
+        query = ('SELECT p.text, p.normalized, p.lemmas, SUM(o.count) AS frequency'
+                 ' FROM phrases p JOIN postings o ON o.phrase_id = p.id'
+                 f' {where} GROUP BY p.id ORDER BY frequency DESC, p.normalized')
+        if limit is not None:
+            query += f' LIMIT {int(limit)}'
+        return [LexiconEntry(*row) for row in self._conn.execute(query, params)]
+
+    def lookup(self, text: str) -> Optional[LexiconEntry]:
+        """Return the entry of a phrase, by its exact text, or None if it is not in the lexicon."""
+        entries = self._entries('WHERE p.text = ?', (text,))
+        return entries[0] if entries else None
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> list[LexiconEntry]:
+        """Return the phrases whose normalized form starts with the normalized prefix, most frequent first."""
+        prefix = normalize_phrase(prefix)
+        return self._entries('WHERE p.normalized >= ? AND p.normalized < ?', (prefix, prefix + PREFIX_END), limit)
+
+    def by_lemma(self, lemma: str, limit: Optional[int] = None) -> list[LexiconEntry]:
+        """Return the phrases with a lemma, or with a word when the parse had no lemmas, most frequent first."""
+        return self._entries('WHERE p.id IN (SELECT phrase_id FROM phrase_lemmas WHERE lemma = ?)',
+                             (normalize_phrase(lemma),), limit)
+
+    def top_k(self, k: int) -> list[LexiconEntry]:
+        """Return the k most frequent phrases."""
+        return self._entries(limit=k)
+
+    def postings(self, text: str) -> list[tuple[int, int, int]]:
+        """Return the (article line number, sentence number, count) postings of a phrase, by its exact text."""
+        return self._conn.execute('SELECT o.position, o.sentence, o.count'
+                                  ' FROM postings o JOIN phrases p ON p.id = o.phrase_id'
+                                  ' WHERE p.text = ? ORDER BY o.position, o.sentence',
+                                  (text,)
+                                  ).fetchall()
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> 'NPLexicon':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main():
+    args = set_argparse()
+
+    with NPLexicon(args.lexicon) as lexicon:
+        if args.command == 'postings':
+            for position, sentence, count in lexicon.postings(args.phrase)[:args.limit]:
+                print(f"{position:>5} {sentence:>3} {count:>3}")
+            return
+        if args.command == 'prefix':
+            entries = lexicon.prefix(args.prefix, args.limit)
+        elif args.command == 'lemma':
+            entries = lexicon.by_lemma(args.lemma, args.limit)
+        else:
+            entries = lexicon.top_k(args.limit)
+        for entry in entries:
+            print(f"{entry.frequency:>6}  {entry.text}  [{entry.lemmas}]")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+
+"""
+Buffered output sinks of the 03_* scripts.
+
+A sink takes both the human-readable output of a script, through print(), and its results
+as JSON-serializable records, through record(), and writes only one of them:
+    TextSink   the human-readable text, as printed to stdout so far
+    JsonlSink  one JSON record per line
+Output is gathered in memory and written in large chunks, to stdout or to a file,
+compressed with gzip when the file name ends in .gz, or with zstd when it ends in .zst.
+A threaded sink hands the chunks to a background writer thread,
+so that compression and writes overlap with parsing.
+
+Usage:
+    with open_sink('out.jsonl.gz', threaded=True) as out:
+        out.print(sentence.text)
+        out.record({'type': 'sentence', 'text': sentence.text})
+"""
+
+import gzip
+import json
+import queue
+import sys
+import threading
+from typing import Any, BinaryIO, Optional
+
+# size of the text gathered before it is written, in characters
+BUFFER_SIZE = 1 << 20
+
+# max number of chunks waiting for the writer thread
+WRITER_QUEUE_SIZE = 8
+
+# output formats, by name
+OUTPUT_FORMATS = ('text', 'jsonl')
+
+
+class _WriterThread:
+    """Background thread writing the chunks put in its queue to a binary stream."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._queue: queue.Queue[Optional[bytes]] = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name='output-writer', daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            chunk = self._queue.get()
+            try:
+                if chunk is None:
+                    return
+                if self._error is None:
+                    self._stream.write(chunk)
+            except BaseException as e:  # pylint: disable=broad-except
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise IOError(f"Output writer failed: {self._error}") from self._error
+
+    def write(self, chunk: bytes) -> None:
+        self._raise_error()
+        self._queue.put(chunk)
+
+    def join(self) -> None:
+        """Wait until every chunk put so far is written."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_error()
+
+
+class OutputSink:
+    """
+    Buffered writer of the output of a script; subclasses choose what is written.
+
+    Args:
+        stream: binary stream where to write
+        close_stream: whether to close the stream when the sink is closed
+        threaded: whether to write from a background thread
+        buffer_size: size of the text gathered before it is written, in characters
+    """
+    # whether the sink writes records rather than human-readable text
+    structured = False
+
+    def __init__(self,
+                 stream: BinaryIO,
+                 close_stream: bool = False,
+                 threaded: bool = False,
+                 buffer_size: int = BUFFER_SIZE,
+                 ):
+        self._stream = stream
+        self._close_stream = close_stream
+        self._buffer_size = buffer_size
+        self._chunks: list[str] = []
+        self._size = 0
+        self._writer = _WriterThread(stream) if threaded else None
+
+    def print(self, *values: Any, sep: str = ' ') -> None:
+        """Write a line of human-readable output, as print() does."""
+
+    def record(self, record: dict) -> None:
+        """Write a result record."""
+
+    def _append(self, text: str) -> None:
+        self._chunks.append(text)
+        self._size += len(text)
+        if self._size >= self._buffer_size:
+            self._write_chunks()
+
+    def _write_chunks(self) -> None:
+        if not self._chunks:
+            return
+        chunk = ''.join(self._chunks).encode('utf-8')
+        self._chunks = []
+        self._size = 0
+        if self._writer is not None:
+            self._writer.write(chunk)
+        else:
+            self._stream.write(chunk)
+
+    def flush(self) -> None:
+        """Write all the output gathered so far, e.g. before printing elsewhere to the same stream."""
+        self._write_chunks()
+        if self._writer is not None:
+            self._writer.join()
+        self._stream.flush()
+
+    def close(self) -> None:
+        try:
+            self._write_chunks()
+            if self._writer is not None:
+                self._writer.close()
+        finally:
+            if self._close_stream:
+                self._stream.close()
+            else:
+                self._stream.flush()
+
+    def __enter__(self) -> 'OutputSink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class TextSink(OutputSink):
+    """Sink of the human-readable output; records are dropped."""
+
+    def print(self, *values: Any, sep: str = ' ') -> None:
+        self._append(sep.join(map(str, values)) + '\n')
+
+
+class JsonlSink(OutputSink):
+    """Sink of the records, one JSON object per line; human-readable output is dropped."""
+    structured = True
+
+    def record(self, record: dict) -> None:
+        self._append(json.dumps(record, ensure_ascii=False, default=_json_default) + '\n')
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the sets and tuples of the scripts' results."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _open_stream(path: str) -> tuple[BinaryIO, bool]:
+    """Return the binary stream of an output path, '-' being stdout, and whether it must be closed."""
+    if path == '-':
+        sys.stdout.flush()
+        return sys.stdout.buffer, False
+    if path.endswith('.gz'):
+        return gzip.open(path, 'wb'), True
+    if path.endswith('.zst'):
+        try:
+            import zstandard  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError("Writing .zst output requires the zstandard package") from e
+        return zstandard.ZstdCompressor().stream_writer(open(path, 'wb')), True
+    return open(path, 'wb', buffering=BUFFER_SIZE), True
+
+
+def output_format(path: str) -> str:
+    """Return the output format of a path: jsonl if its name, without compression suffix, ends in .jsonl."""
+    for suffix in ('.gz', '.zst'):
+        if path.endswith(suffix):
+            path = path[:-len(suffix)]
+    return 'jsonl' if path.endswith('.jsonl') else 'text'
+
+
+def open_sink(path: str = '-', out_format: Optional[str] = None, threaded: bool = False) -> OutputSink:
+    """
+    Open the sink of an output path.
+
+    Args:
+        path: output file path, '-' for stdout; compressed if it ends in .gz or .zst
+        out_format: 'text' or 'jsonl'; by default, guessed from the path
+        threaded: whether to write from a background thread
+
+    Raises:
+        ValueError: If the output format is unknown
+    """
+    out_format = out_format or output_format(path)
+    if out_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format {out_format!r}, not in {OUTPUT_FORMATS}")
+    stream, close_stream = _open_stream(path)
+    sink_class = JsonlSink if out_format == 'jsonl' else TextSink
+    return sink_class(stream, close_stream=close_stream, threaded=threaded)
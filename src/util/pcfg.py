@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+
+"""
+Probabilistic context-free grammar estimated from constituency production counts.
+
+Rules are grouped by left-hand side label, in CSR form: the rules of lhs label id l are
+rule_rhs[lhs_offsets[l]:lhs_offsets[l + 1]], with their counts and log probabilities in NumPy arrays.
+Probabilities are relative frequencies within each lhs, with some probability mass
+kept for productions not seen in the counts.
+
+Trees of a compact TreeBank are scored in batch: every node that counts as a production
+(a non-UPOS node with children, as in 03_01_stanza_const_parse.py -p) is matched
+to its rule through a hash of its labels, computed for all nodes at once.
+Trees with a low mean log probability per node, or with unseen productions, are flagged for review.
+Since every node of the trees is scored, the grammar is only built from production stores
+counted over full trees, grup.noms included; others are refused.
+
+Usage:
+    PYTHONPATH=. python src/util/pcfg.py -f data/annotations/forest.npz -n 20
+"""
+
+import argparse
+from collections import Counter
+import os
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.config.config import Config
+from src.util.compact_tree import LabelVocab, TreeBank, NO_NODE
+from src.util.pandas_config import configure_pandas_display
+from src.util.production_store import ProductionStore
+
+configure_pandas_display()
+
+config = Config().config
+
+# probability mass of unseen productions, in counts added to each lhs total
+SMOOTHING = 0.5
+
+# log probability of productions whose lhs was never seen
+UNSEEN_LHS_LOGPROB = np.log(1e-6)
+
+# z-score of the mean log probability per node below which a tree is unusual
+Z_THRESHOLD = -2.0
+
+# odd multipliers of the production hash, computed modulo 2**64
+HASH_BASE = np.uint64(0x9E3779B97F4A7C15)
+HASH_LHS = np.uint64(0xC2B2AE3D27D4EB4F)
+HASH_LEN = np.uint64(0x165667B19E3779F9)
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Score constituency trees with a PCFG of the production counts.')
+    parser.add_argument('-s', '--store',
+                        default=config.get('production_store'),
+                        help=f"path of the production store (default: {config.get('production_store')})",
+                        )
+    parser.add_argument('-f', '--forest',
+                        required=True,
+                        help='TreeBank .npz file of the trees to score, e.g. saved by 03_01_stanza_const_parse.py -f',
+                        )
+    parser.add_argument('-z', '--z-threshold',
+                        type=float,
+                        default=Z_THRESHOLD,
+                        help='flag trees whose mean log probability per node has a lower z-score '
+                             f'(default: {Z_THRESHOLD})',
+                        )
+    parser.add_argument('-n', '--top',
+                        type=int,
+                        default=20,
+                        help='number of flagged trees to print (default: 20)',
+                        )
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+def production_hashes(lhs: np.ndarray, rhs_labels: np.ndarray, rhs_lens: np.ndarray) -> np.ndarray:
+    """
+    Return a 64-bit hash of each production.
+
+    Args:
+        lhs: lhs label id of each production
+        rhs_labels: rhs label ids of all productions, concatenated, each production's labels in order
+        rhs_lens: number of rhs labels of each production, all > 0
+    """
+    starts = np.concatenate(([0], np.cumsum(rhs_lens)[:-1]))
+    positions = np.arange(len(rhs_labels)) - np.repeat(starts, rhs_lens)
+    powers = np.ones(int(rhs_lens.max(initial=1)), dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for i in range(1, len(powers)):
+            powers[i] = powers[i - 1] * HASH_BASE
+        terms = (rhs_labels.astype(np.uint64) + np.uint64(1)) * powers[positions]
+        rhs_hash = np.add.reduceat(terms, starts) if len(terms) else np.zeros(0, dtype=np.uint64)
+        return (rhs_hash
+                + (lhs.astype(np.uint64) + np.uint64(1)) * HASH_LHS
+                + rhs_lens.astype(np.uint64) * HASH_LEN)
+
+
+class PCFG:
+    """Rule probabilities by lhs, estimated from production counts."""
+
+    def __init__(self, counts: Counter, vocab: LabelVocab, smoothing: float = SMOOTHING):
+        """
+        Args:
+            counts: production counts, keyed by (lhs, rhs label, ...) tuples
+            vocab: vocabulary where labels are interned, usually that of the TreeBank to score
+            smoothing: probability mass of unseen productions, in counts added to each lhs total
+        """
+        self.vocab = vocab
+        productions = sorted(((vocab.intern(production[0]), tuple(vocab.intern(label) for label in production[1:])),
+                              count)
+                             for production, count in counts.items() if count > 0 and len(production) > 1)
+        self.rule_lhs = np.array([lhs for (lhs, _), _ in productions], dtype=np.int32)
+        self.rule_rhs = [rhs for (_, rhs), _ in productions]
+        self.rule_counts = np.array([count for _, count in productions], dtype=np.int64)
+
+        label_count = len(vocab)
+        self.lhs_offsets = np.zeros(label_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.rule_lhs, minlength=label_count), out=self.lhs_offsets[1:])
+        self.lhs_totals = np.bincount(self.rule_lhs, weights=self.rule_counts, minlength=label_count)
+
+        denominators = self.lhs_totals + smoothing
+        self.rule_logprob = np.log(self.rule_counts / denominators[self.rule_lhs])
+        with np.errstate(divide='ignore'):
+            self.unseen_logprob = np.where(self.lhs_totals > 0,
+                                           np.log(smoothing / denominators) if smoothing > 0 else -np.inf,
+                                           UNSEEN_LHS_LOGPROB,
+                                           )
+
+        rhs_lens = np.array([len(rhs) for rhs in self.rule_rhs], dtype=np.int64)
+        rhs_labels = np.array([label for rhs in self.rule_rhs for label in rhs], dtype=np.int64)
+        hashes = production_hashes(self.rule_lhs, rhs_labels, rhs_lens)
+        self._hash_order = np.argsort(hashes)
+        self._sorted_hashes = hashes[self._hash_order]
+        if len(hashes) and np.any(self._sorted_hashes[1:] == self._sorted_hashes[:-1]):
+            raise ValueError("Production hash collision")
+
+    @classmethod
+    def from_store(cls, path: str, vocab: LabelVocab, smoothing: float = SMOOTHING) -> 'PCFG':
+        """
+        Build the grammar of a production store.
+
+        Raises:
+            FileNotFoundError: If there is no store at path
+            ValueError: If the store holds no counts, or was not counted over full trees, grup.noms included
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Production store {path} not found: "
+                                    "build it with 03_01_stanza_const_parse.py -p, e.g. make productions_seed")
+        with ProductionStore(path) as store:
+            store.require_full_trees()
+            if store.article_count() == 0:
+                raise ValueError(f"Production store {path} holds no production counts")
+            return cls(store.totals(), vocab, smoothing)
+
+    def __len__(self) -> int:
+        return len(self.rule_lhs)
+
+    def rules(self, lhs: str) -> list[tuple[tuple[str, ...], float]]:
+        """Return the rules of an lhs label, as (rhs labels, probability), most probable first."""
+        lhs_id = self.vocab.ids.get(lhs)
+        if lhs_id is None or lhs_id >= len(self.lhs_totals):
+            return []
+        start, end = self.lhs_offsets[lhs_id], self.lhs_offsets[lhs_id + 1]
+        order = np.argsort(-self.rule_logprob[start:end], kind='stable') + start
+        return [(tuple(self.vocab[label] for label in self.rule_rhs[i]), float(np.exp(self.rule_logprob[i])))
+                for i in order]
+
+    def rule_table(self) -> pd.DataFrame:
+        """Return all rules, with their counts and probabilities."""
+        return pd.DataFrame({'lhs': [self.vocab[lhs] for lhs in self.rule_lhs.tolist()],
+                             'rhs': [' '.join(self.vocab[label] for label in rhs) for rhs in self.rule_rhs],
+                             'count': self.rule_counts,
+                             'prob': np.exp(self.rule_logprob),
+                             })
+
+    def lookup(self, lhs: np.ndarray, rhs_labels: np.ndarray, rhs_lens: np.ndarray) -> np.ndarray:
+        """Return the rule index of each production, or -1 for productions not in the grammar."""
+        if len(self) == 0:
+            return np.full(len(lhs), -1, dtype=np.int64)
+        hashes = production_hashes(lhs, rhs_labels, rhs_lens)
+        positions = np.minimum(np.searchsorted(self._sorted_hashes, hashes), len(self) - 1)
+        return np.where(self._sorted_hashes[positions] == hashes, self._hash_order[positions], -1)
+
+    def unseen(self, lhs: np.ndarray) -> np.ndarray:
+        """Return the log probability of an unseen production of each lhs label id."""
+        known = lhs < len(self.unseen_logprob)
+        return np.where(known, self.unseen_logprob[np.where(known, lhs, 0)], UNSEEN_LHS_LOGPROB)
+
+    def score_treebank(self, bank: TreeBank) -> pd.DataFrame:
+        """
+        Score every tree of the bank.
+
+        Returns:
+            DataFrame indexed by tree number, with the number of scored nodes,
+            the tree log probability, the mean log probability per node and the number of unseen productions
+        """
+        if bank.vocab is not self.vocab:
+            raise ValueError("The TreeBank labels are interned in another vocabulary")
+        arrays = bank.arrays
+        labels, parent = arrays['labels'], arrays['parent']
+        tree_count = len(bank)
+        sizes = np.diff(bank.offsets)
+        tree_of_node = np.repeat(np.arange(tree_count), sizes)
+        global_parent = np.where(parent == NO_NODE, NO_NODE, parent + bank.offsets[tree_of_node])
+
+        # productions: nodes with children whose label is not a UPOS tag
+        children = np.flatnonzero(global_parent != NO_NODE)
+        children = children[np.argsort(global_parent[children], kind='stable')]
+        heads, rhs_lens = np.unique(global_parent[children], return_counts=True)
+        scored = ~self.vocab.is_upos(labels[heads])
+        rhs_labels = labels[children][np.repeat(scored, rhs_lens)]
+        heads, rhs_lens = heads[scored], rhs_lens[scored]
+
+        rule_index = self.lookup(labels[heads], rhs_labels, rhs_lens)
+        unseen = rule_index < 0
+        logprob = np.where(unseen, self.unseen(labels[heads]), self.rule_logprob[np.maximum(rule_index, 0)])
+
+        head_trees = tree_of_node[heads]
+        node_counts = np.bincount(head_trees, minlength=tree_count)
+        tree_logprob = np.bincount(head_trees, weights=logprob, minlength=tree_count)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_logprob = tree_logprob / node_counts
+        return pd.DataFrame({'nodes': node_counts,
+                             'logprob': tree_logprob,
+                             'mean_logprob': mean_logprob,
+                             'unseen': np.bincount(head_trees, weights=unseen, minlength=tree_count).astype(int),
+                             })
+
+
+def flag_unusual(scores: pd.DataFrame, z_threshold: float = Z_THRESHOLD) -> pd.DataFrame:
+    """Return the scores of trees with unseen productions or a low mean log probability, least likely first."""
+    mean_logprob = scores['mean_logprob']
+    z_scores = (mean_logprob - mean_logprob.mean()) / (mean_logprob.std() or 1.0)
+    flagged = scores.assign(z=z_scores)[(z_scores < z_threshold) | (scores['unseen'] > 0)]
+    return flagged.sort_values('mean_logprob')
+
+
+def describe(bank: TreeBank, flagged: pd.DataFrame, top: int) -> Sequence[str]:
+    """Return a line per flagged tree: its scores and its text."""
+    return [f"{row.Index:>5} {row.nodes:>4} {row.mean_logprob:>8.3f} {row.z:>6.2f} {row.unseen:>3}  "
+            f"{bank[row.Index].text()}"
+            for row in flagged.head(top).itertuples()]
+
+
+def main():
+    args = set_argparse()
+    bank = TreeBank.load(args.forest)
+    pcfg = PCFG.from_store(args.store, bank.vocab)
+    scores = pcfg.score_treebank(bank)
+    flagged = flag_unusual(scores, args.z_threshold)
+    print(f"{len(pcfg)} rules, {len(bank)} trees, {len(flagged)} flagged")
+    print(f"{'tree':>5} {'node':>4} {'mean lp':>8} {'z':>6} {'new':>3}  text")
+    for line in describe(bank, flagged, args.top):
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
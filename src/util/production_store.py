@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+
+"""
+Persistent store of constituency grammar production counts.
+
+A production is a tree node label with the labels of its children, as counted by
+03_01_stanza_const_parse.py -p: ('sn', 'spec', 'grup.nom') is the rule sn -> spec grup.nom.
+Productions are counted over the full trees, inside grup.noms too, whatever the script displays,
+which the store metadata records: stores written before, maybe from collapsed trees, lack the mark.
+Counts are kept per article, keyed by its position in the input (line number, or tree number
+with --from-out) together with the hash of its text: re-processing an input line replaces its counts
+instead of adding them again, repeated articles or sentences each keep their own counts,
+and stores written by parallel runs over different articles can be merged.
+Stores written before positions were kept have their counts dropped on opening, to be rebuilt.
+
+Usage:
+    PYTHONPATH=. python src/util/production_store.py top -k 20
+    PYTHONPATH=. python src/util/production_store.py lengths
+    PYTHONPATH=. python src/util/production_store.py coverage -n 10 50 100
+    PYTHONPATH=. python src/util/production_store.py merge shard1.sqlite shard2.sqlite
+"""
+
+import argparse
+from collections import Counter
+import os
+import pprint as pp
+import sqlite3
+from typing import Any, Iterable, Optional, Sequence
+
+from src.config.config import Config
+from src.util.annotation_store import document_key
+from src.util.tags import upos_tags
+
+config = Config().config
+
+# separator of right-hand side labels in the rhs column
+RHS_SEPARATOR = ' '
+
+# metadata name and value marking the stores counted over full trees
+TREES_METADATA = 'trees'
+FULL_TREES = 'full'
+
+Production = tuple[str, ...]
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Query and merge grammar production counts.')
+    parser.add_argument('-s', '--store',
+                        default=config.get('production_store'),
+                        help=f"path of the production store (default: {config.get('production_store')})",
+                        )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    top_parser = subparsers.add_parser('top', help='print the most frequent productions')
+    top_parser.add_argument('-k', type=int, default=20, help='number of productions (default: 20)')
+    top_parser.add_argument('-l', '--lhs', help='only productions of this left-hand side label')
+    subparsers.add_parser('lengths', help='print the distribution of right-hand side lengths')
+    coverage_parser = subparsers.add_parser('coverage', help='print the share of nodes covered by the top N rules')
+    coverage_parser.add_argument('-n', type=int, nargs='+', default=[10, 50, 100, 500])
+    subparsers.add_parser('dump', help='print all production counts, as a Counter')
+    merge_parser = subparsers.add_parser('merge', help='merge the article counts of other stores into this one')
+    merge_parser.add_argument('shards', nargs='+', help='paths of the stores to merge')
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+def tree_productions(tree: Any) -> Counter:
+    """
+    Return the production counts of a constituency tree: one per node with children
+    whose label is not a UPOS tag, over the full tree, grup.noms included.
+
+    Args:
+        tree: Stanza ParseTree, or any tree of nodes with label and children
+    """
+    counts = Counter()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node.children and node.label not in upos_tags:
+            counts[(node.label, *(child.label for child in node.children))] += 1
+        stack.extend(node.children)
+    return counts
+
+
+class ProductionStore:
+    """
+    SQLite store of production counts per article.
+
+    Usage:
+        with ProductionStore('data/annotations/productions.sqlite') as store:
+            store.set_article(article_text, production_counts)
+            store.top_k(10)
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        columns = {name for _, name, *_ in self._conn.execute('PRAGMA table_info(article_counts)')}
+        if columns and 'position' not in columns:
+            # counts keyed by article text alone, where repeated articles overwrote each other
+            self._conn.executescript('DROP TABLE article_counts;'
+                                     'DROP TABLE IF EXISTS metadata;'
+                                     )
+        self._conn.executescript(
+            'CREATE TABLE IF NOT EXISTS productions ('
+            ' id INTEGER PRIMARY KEY,'
+            ' lhs TEXT NOT NULL,'
+            ' rhs TEXT NOT NULL,'
+            ' rhs_len INTEGER NOT NULL,'
+            ' UNIQUE (lhs, rhs)'
+            ');'
+            'CREATE TABLE IF NOT EXISTS article_counts ('
+            ' position INTEGER NOT NULL,'
+            ' article TEXT NOT NULL,'
+            ' production_id INTEGER NOT NULL REFERENCES productions (id),'
+            ' count INTEGER NOT NULL,'
+            ' PRIMARY KEY (position, article, production_id)'
+            ');'
+            'CREATE INDEX IF NOT EXISTS article_counts_production ON article_counts (production_id);'
+            'CREATE TABLE IF NOT EXISTS metadata ('
+            ' name TEXT PRIMARY KEY,'
+            ' value TEXT NOT NULL'
+            ');'
+        )
+        self._conn.commit()
+        self._production_ids: dict[Production, int] = {
+            (lhs, *rhs.split(RHS_SEPARATOR)): production_id
+            for production_id, lhs, rhs in self._conn.execute('SELECT id, lhs, rhs FROM productions')
+        }
+
+    @property
+    def metadata(self) -> dict[str, str]:
+        """Counting settings: trees, FULL_TREES when productions were counted over full trees."""
+        return dict(self._conn.execute('SELECT name, value FROM metadata'))
+
+    def set_metadata(self, **values: str) -> None:
+        self._conn.executemany('INSERT OR REPLACE INTO metadata (name, value) VALUES (?, ?)',
+                               [(name, str(value)) for name, value in values.items()]
+                               )
+
+    def require_full_trees(self) -> None:
+        """Raise ValueError unless the productions were counted over full trees, grup.noms included."""
+        if self.metadata.get(TREES_METADATA) != FULL_TREES:
+            raise ValueError(f"Production store {self.path} was not counted over full trees, grup.noms included: "
+                             "rebuild it with 03_01_stanza_const_parse.py -p, e.g. make productions_seed")
+
+    def production_id(self, production: Production) -> int:
+        """Return the id of a production, adding it if new."""
+        production_id = self._production_ids.get(production)
+        if production_id is None:
+            lhs, *rhs = production
+            production_id = self._conn.execute('INSERT INTO productions (lhs, rhs, rhs_len) VALUES (?, ?, ?)',
+                                               (lhs, RHS_SEPARATOR.join(rhs), len(rhs))
+                                               ).lastrowid
+            self._production_ids[production] = production_id
+        return production_id
+
+    def set_article(self, position: int, article_text: str, counts: Counter) -> None:
+        """
+        Replace the production counts of the article at a position of the input;
+        committed on the next commit() or close().
+        """
+        article = document_key(article_text)
+        self._conn.execute('DELETE FROM article_counts WHERE position = ?', (position,))
+        self._conn.executemany('INSERT INTO article_counts (position, article, production_id, count)'
+                               ' VALUES (?, ?, ?, ?)',
+                               [(position, article, self.production_id(production), count)
+                                for production, count in counts.items() if count > 0]
+                               )
+
+    def retain(self, article_texts: Sequence[str]) -> int:
+        """
+        Drop the counts of every article other than article_texts, at their positions in the input.
+
+        Returns:
+            Number of articles dropped
+        """
+        keep = {(position, document_key(article_text)) for position, article_text in enumerate(article_texts)}
+        stale = [row for row in self._conn.execute('SELECT DISTINCT position, article FROM article_counts')
+                 if row not in keep]
+        self._conn.executemany('DELETE FROM article_counts WHERE position = ? AND article = ?', stale)
+        return len(stale)
+
+    def merge(self, shard_path: str) -> None:
+        """
+        Add the article counts of another store, replacing those of articles present in both,
+        at the same position.
+        The full trees mark is kept only if both stores have it, or this one has no articles yet.
+        """
+        shard = sqlite3.connect(shard_path)
+        try:
+            if 'position' not in {name for _, name, *_ in shard.execute('PRAGMA table_info(article_counts)')}:
+                raise ValueError(f"Production store {shard_path} keeps no article positions: "
+                                 "rebuild it with 03_01_stanza_const_parse.py -p")
+            rows = shard.execute('SELECT a.position, a.article, p.lhs, p.rhs, a.count'
+                                 ' FROM article_counts a JOIN productions p ON p.id = a.production_id'
+                                 ).fetchall()
+            has_metadata = shard.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'metadata'"
+                                         ).fetchone() is not None
+            shard_trees = (dict(shard.execute('SELECT name, value FROM metadata')).get(TREES_METADATA)
+                           if has_metadata else None)
+        finally:
+            shard.close()
+        trees = shard_trees if self.article_count() == 0 else self.metadata.get(TREES_METADATA)
+        if trees is not None and trees == shard_trees:
+            self.set_metadata(**{TREES_METADATA: trees})
+        else:
+            self._conn.execute('DELETE FROM metadata WHERE name = ?', (TREES_METADATA,))
+        articles = {(position, article) for position, article, *_ in rows}
+        self._conn.executemany('DELETE FROM article_counts WHERE position = ? AND article = ?', articles)
+        self._conn.executemany('INSERT INTO article_counts (position, article, production_id, count)'
+                               ' VALUES (?, ?, ?, ?)',
+                               [(position, article, self.production_id((lhs, *rhs.split(RHS_SEPARATOR))), count)
+                                for position, article, lhs, rhs, count in rows]
+                               )
+
+    def _totals(self, where: str = '', params: tuple = (), limit: Optional[int] = None) -> list[tuple]:
+        query = ('SELECT p.lhs, p.rhs, SUM(a.count) AS total'
+                 ' FROM article_counts a JOIN productions p ON p.id = a.production_id'
+                 f' {where} GROUP BY p.id ORDER BY total DESC, p.id')
+        if limit is not None:
+            query += f' LIMIT {int(limit)}'
+        return self._conn.execute(query, params).fetchall()
+
+    def totals(self) -> Counter:
+        """Return the corpus count of every production, most frequent first."""
+        return Counter({(lhs, *rhs.split(RHS_SEPARATOR)): total for lhs, rhs, total in self._totals()})
+
+    def top_k(self, k: int, lhs: Optional[str] = None) -> list[tuple[Production, int]]:
+        """Return the k most frequent productions, optionally of a single left-hand side label, with counts."""
+        where, params = ('WHERE p.lhs = ?', (lhs,)) if lhs is not None else ('', ())
+        return [((lhs, *rhs.split(RHS_SEPARATOR)), total) for lhs, rhs, total in self._totals(where, params, k)]
+
+    def length_distribution(self) -> list[tuple[int, int, int]]:
+        """Return (right-hand side length, number of productions, number of nodes), by length."""
+        return self._conn.execute(
+            'SELECT p.rhs_len, COUNT(DISTINCT p.id), SUM(a.count)'
+            ' FROM article_counts a JOIN productions p ON p.id = a.production_id'
+            ' GROUP BY p.rhs_len ORDER BY p.rhs_len'
+        ).fetchall()
+
+    def coverage(self, top_n: Iterable[int]) -> list[tuple[int, float]]:
+        """Return, for each N, the share of all counted nodes whose production is among the N most frequent."""
+        totals = [total for _, _, total in self._totals()]
+        grand_total = sum(totals)
+        return [(n, sum(totals[:n]) / grand_total if grand_total else 0.0) for n in top_n]
+
+    def article_count(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM (SELECT DISTINCT position, article FROM article_counts)'
+                                  ).fetchone()[0]
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> 'ProductionStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main():
+    args = set_argparse()
+
+    with ProductionStore(args.store) as store:
+        if args.command == 'top':
+            for production, total in store.top_k(args.k, args.lhs):
+                print(f"{total:>7}  {production[0]} -> {' '.join(production[1:])}")
+        elif args.command == 'lengths':
+            print(f"{'rhs len':>7} {'rules':>6} {'nodes':>7}")
+            for rhs_len, rule_count, node_count in store.length_distribution():
+                print(f"{rhs_len:>7} {rule_count:>6} {node_count:>7}")
+        elif args.command == 'coverage':
+            for n, share in store.coverage(args.n):
+                print(f"top {n:>5} rules: {share:7.2%} of nodes")
+        elif args.command == 'dump':
+            pp.pprint(store.totals())
+        elif args.command == 'merge':
+            for shard_path in args.shards:
+                store.merge(shard_path)
+            print(f"{store.article_count()} articles in {store.path}")
+
+
+if __name__ == '__main__':
+    main()
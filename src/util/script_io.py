@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+"""
+Command line options and setup shared by the 03_* scripts:
+where their annotated documents come from, and where their output goes.
+
+Documents come from the annotation store written by 03_00_stanza_annotate.py (--store),
+from the Stanza pipeline through the content cache, or from the pipeline alone (--no-cache);
+output goes to a buffered sink, text or jsonl, to stdout or to a file (-o, --format, --threaded).
+
+Usage:
+    add_source_arguments(parser)
+    add_output_arguments(parser)
+    ...
+    with open_source(args, PROCESSORS, init_nlp) as nlp, open_output(args) as out:
+        process_file(args.input_file_path, nlp, args.maxlines, args.batch_size, out)
+"""
+
+import argparse
+from contextlib import contextmanager
+import sys
+from typing import Any, Callable, Iterator, Optional
+
+from src.config.config import Config
+from src.util.annotation_store import AnnotationStore
+from src.util.batch_annotate import BATCH_SIZE
+from src.util.content_cache import CachedPipeline, ContentCache
+from src.util.output_sink import OUTPUT_FORMATS, OutputSink, open_sink
+
+config = Config().config
+
+
+def add_source_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options choosing where annotated documents come from: -b, --cache-dir, --no-cache and --store."""
+    parser.add_argument('-b', '--batch-size',
+                        type=int,
+                        default=BATCH_SIZE,
+                        help=f'number of lines per pipeline call (default: {BATCH_SIZE})',
+                        )
+    parser.add_argument('--cache-dir',
+                        default=config.get('cache_dir'),
+                        help=f"directory of the content cache (default: {config.get('cache_dir')})",
+                        )
+    parser.add_argument('--no-cache',
+                        help='annotate every line, without the content cache',
+                        action="store_true",
+                        )
+    parser.add_argument('--store',
+                        nargs='?',
+                        const=config.get('annotation_store_dir'),
+                        help='read annotated documents from the annotation store written by 03_00_stanza_annotate.py, '
+                             f"instead of running the models (default directory: {config.get('annotation_store_dir')})",
+                        )
+
+
+def add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options choosing where output goes: -o, --format and --threaded."""
+    parser.add_argument('-o', '--output',
+                        default='-',
+                        help='output file, compressed if it ends in .gz or .zst (default: stdout)',
+                        )
+    parser.add_argument('--format',
+                        choices=OUTPUT_FORMATS,
+                        help='output format: text, as printed so far, or jsonl records (default: guessed from the '
+                             'output file name, jsonl if it ends in .jsonl, .jsonl.gz or .jsonl.zst)',
+                        )
+    parser.add_argument('--threaded',
+                        help='write the output from a background thread',
+                        action="store_true",
+                        )
+
+
+@contextmanager
+def open_source(args: argparse.Namespace,
+                processors: str,
+                init_nlp: Callable[[], Any],
+                stage: Optional[str] = None,
+                offline: bool = False,
+                ) -> Iterator[Any]:
+    """
+    Open the source of annotated documents chosen by the source options, closed on exit.
+
+    Args:
+        args: parsed arguments, with the source options and verbose
+        processors: Stanza processors whose annotations the script reads
+        init_nlp: function loading the Stanza pipeline, only called if the pipeline is run
+        stage: content cache stage of the annotations (default: stanza:<processors>)
+        offline: whether the script reads its documents from its input file, without any source
+
+    Yields:
+        The annotation store, the cached pipeline or the pipeline; None if offline
+
+    Raises:
+        ValueError: If the annotation store lacks any of the processors
+    """
+    store = AnnotationStore(args.store) if args.store and not offline else None
+    cache = None if args.no_cache or offline or store is not None else ContentCache(args.cache_dir)
+    try:
+        if offline:
+            yield None
+        elif store is not None:
+            store.require(processors)
+            yield store
+        elif cache is None:
+            yield init_nlp()
+        else:
+            import stanza  # pylint: disable=import-outside-toplevel
+            yield CachedPipeline(init_nlp, cache, stage or f'stanza:{processors}', f'stanza-{stanza.__version__}')
+    finally:
+        if store is not None:
+            store.close()
+        if cache is not None:
+            cache.close()
+            if args.verbose:
+                print(cache.stats(), file=sys.stderr)
+
+
+def open_output(args: argparse.Namespace) -> OutputSink:
+    """Open the output sink chosen by the output options."""
+    return open_sink(args.output, args.format, args.threaded)
@@ -15,12 +15,21 @@ references:
 - https://betterstack.com/community/questions/how-to-create-singleton-in-python/
 """
 
+import threading
+
+
 class Singleton(type):
     """Singleton superclass"""
     _instances = {}
+    # re-entrant, so that a singleton may create another one while being created
+    _lock = threading.RLock()
+
     def __call__(cls, *args, **kwargs):
         if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+            with Singleton._lock:
+                # another thread may have created the instance while this one waited
+                if cls not in cls._instances:
+                    cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
         return cls._instances[cls]
 
 
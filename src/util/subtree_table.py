@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+
+"""
+Hash-consing table of constituency subtrees.
+
+Every distinct subtree, a label with the subtrees of its children in order, gets a single id:
+identical subtrees, e.g. every (sn (spec (DET la)) (grup.nom (PROPN Asamblea) (PROPN Legislativa))),
+are stored once as (label id, child subtree ids) and referenced by that id.
+Ids are assigned bottom-up, children first, so a subtree's structural key only holds small integers,
+and finding whether a subtree was seen before is a single dict lookup.
+Per-subtree results, like the text of a collapsed grup.nom, are memoized by id.
+
+Usage:
+    PYTHONPATH=. python src/util/subtree_table.py -k 20 src/legalogic/sandbox/03_01_stanza_const_parse.out
+"""
+
+import argparse
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+import numpy as np
+
+from src.util.bracketed_reader import read_treebank
+from src.util.compact_tree import CompactTree, LabelVocab, TreeBank, NO_NODE, escape_label
+from src.util.tree_walker import iter_preorder
+
+T = TypeVar('T')
+
+# structural key of a subtree: its label id and the ids of its children's subtrees
+SubtreeKey = tuple[int, tuple[int, ...]]
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Count the repeated constituents of constituency trees.')
+    parser.add_argument('-k', '--top',
+                        type=int,
+                        default=20,
+                        help='number of repeated constituents to print (default: 20)',
+                        )
+    parser.add_argument('-l', '--min-leaves',
+                        type=int,
+                        default=2,
+                        help='only print constituents with at least this many words (default: 2)',
+                        )
+    parser.add_argument('input_file_path',
+                        help='TreeBank .npz file, or output file with bracketed trees, e.g. 03_01_stanza_const_parse.out',
+                        )
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+class SubtreeTable:
+    """
+    Distinct subtrees by structural key, with their number of occurrences.
+
+    Usage:
+        table = SubtreeTable()
+        subtree_ids = table.add_parse_tree(tree)
+        table.text(subtree_ids[id(tree)])
+    """
+
+    def __init__(self, vocab: Optional[LabelVocab] = None):
+        self.vocab = vocab if vocab is not None else LabelVocab()
+        self._ids: dict[SubtreeKey, int] = {}
+        # structural key, number of occurrences and number of leaves of each subtree id
+        self.keys: list[SubtreeKey] = []
+        self.counts: list[int] = []
+        self.leaf_counts: list[int] = []
+        self._memos: dict[str, dict[int, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def node_count(self) -> int:
+        """Return the number of nodes added, i.e. of subtree occurrences."""
+        return sum(self.counts)
+
+    def intern(self, label: str, child_ids: tuple[int, ...] = ()) -> int:
+        """Return the id of the subtree of this label and children, adding it if new, and count an occurrence."""
+        return self._intern(self.vocab.intern(label), child_ids)
+
+    def _intern(self, label_id: int, child_ids: tuple[int, ...]) -> int:
+        key = (label_id, child_ids)
+        subtree_id = self._ids.get(key)
+        if subtree_id is None:
+            subtree_id = len(self.keys)
+            self._ids[key] = subtree_id
+            self.keys.append(key)
+            self.counts.append(0)
+            self.leaf_counts.append(sum(self.leaf_counts[child_id] for child_id in child_ids) if child_ids else 1)
+        self.counts[subtree_id] += 1
+        return subtree_id
+
+    def find(self, label: str, child_ids: tuple[int, ...] = ()) -> Optional[int]:
+        """Return the id of the subtree of this label and children if it was seen, else None."""
+        label_id = self.vocab.ids.get(label)
+        return None if label_id is None else self._ids.get((label_id, child_ids))
+
+    def add_parse_tree(self, tree: Any) -> dict[int, int]:
+        """
+        Add every subtree of a Stanza ParseTree, or any tree of nodes with label and children.
+
+        Returns:
+            the subtree id of every node, keyed by the id() of the node, valid as long as the tree is alive
+        """
+        subtree_ids = {}
+        for node, _ in reversed(list(iter_preorder(tree))):
+            subtree_ids[id(node)] = self.intern(node.label, tuple(subtree_ids[id(child)] for child in node.children))
+        return subtree_ids
+
+    def add_compact_tree(self, tree: CompactTree) -> np.ndarray:
+        """Add every subtree of a compact tree; return the subtree id of every node."""
+        labels = tree.labels.tolist()
+        if tree.vocab is not self.vocab:
+            labels = [self.vocab.intern(tree.vocab[label_id]) for label_id in labels]
+        parent = tree.parent.tolist()
+        # subtree ids of the children of each node, last child first
+        child_ids: list[list[int]] = [[] for _ in labels]
+        subtree_ids = [0] * len(labels)
+        for node in range(len(labels) - 1, -1, -1):
+            subtree_ids[node] = self._intern(labels[node], tuple(reversed(child_ids[node])))
+            if parent[node] != NO_NODE:
+                child_ids[parent[node]].append(subtree_ids[node])
+        return np.array(subtree_ids, dtype=np.int64)
+
+    def add_treebank(self, bank: TreeBank) -> np.ndarray:
+        """Add every subtree of every tree of the bank; return the subtree id of every node, concatenated."""
+        return np.concatenate([self.add_compact_tree(tree) for tree in bank] or [np.zeros(0, dtype=np.int64)])
+
+    def memoize(self, name: str, subtree_id: int, compute: Callable[[int], T]) -> T:
+        """Return compute(subtree_id), computed once per subtree for each name of result."""
+        memo = self._memos.setdefault(name, {})
+        if subtree_id not in memo:
+            memo[subtree_id] = compute(subtree_id)
+        return memo[subtree_id]
+
+    def label(self, subtree_id: int) -> str:
+        return self.vocab[self.keys[subtree_id][0]]
+
+    def _iter_leaves(self, subtree_id: int) -> Iterator[int]:
+        stack = [subtree_id]
+        while stack:
+            label_id, child_ids = self.keys[stack.pop()]
+            if not child_ids:
+                yield label_id
+            stack.extend(reversed(child_ids))
+
+    def text(self, subtree_id: int) -> str:
+        """Return the leaf labels of a subtree, separated by spaces; memoized."""
+        return self.memoize('text', subtree_id,
+                            lambda i: ' '.join(self.vocab[label_id] for label_id in self._iter_leaves(i)))
+
+    def to_bracketed(self, subtree_id: int) -> str:
+        """Return a subtree as a bracketed string, as printed by Stanza."""
+        parts = []
+        stack = [subtree_id]
+        while stack:
+            subtree_id = stack.pop()
+            if subtree_id < 0:
+                parts.append(')')
+                continue
+            label_id, child_ids = self.keys[subtree_id]
+            label = escape_label(self.vocab[label_id])
+            if not child_ids:
+                parts.append(f' {label}' if parts else label)
+                continue
+            parts.append(' (' if parts else '(')
+            parts.append(label)
+            stack.append(-1)
+            stack.extend(reversed(child_ids))
+        return ''.join(parts)
+
+    def repeated(self, top: int, min_leaves: int = 2) -> list[tuple[int, int]]:
+        """Return the top most repeated subtrees with at least min_leaves leaves, as (subtree id, count)."""
+        candidates = [subtree_id for subtree_id, count in enumerate(self.counts)
+                      if count > 1 and self.leaf_counts[subtree_id] >= min_leaves]
+        candidates.sort(key=lambda subtree_id: (-self.counts[subtree_id], subtree_id))
+        return [(subtree_id, self.counts[subtree_id]) for subtree_id in candidates[:top]]
+
+    def summary(self, top: int = 10, min_leaves: int = 2) -> list[str]:
+        """Return lines describing the sharing of subtrees and the most repeated ones."""
+        node_count = self.node_count()
+        lines = [f"{len(self)} distinct subtrees for {node_count} nodes"
+                 f" ({len(self) / node_count if node_count else 0.0:.1%})"]
+        lines.extend(f"{count:>6}  {self.label(subtree_id)} {self.text(subtree_id)}"
+                     for subtree_id, count in self.repeated(top, min_leaves))
+        return lines
+
+
+def main():
+    args = set_argparse()
+
+    if args.input_file_path.endswith('.npz'):
+        bank = TreeBank.load(args.input_file_path)
+    else:
+        bank = read_treebank(args.input_file_path)
+    table = SubtreeTable(bank.vocab)
+    table.add_treebank(bank)
+    for line in table.summary(args.top, args.min_leaves):
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+"""
+Corpus-wide columnar token table.
+
+One row per word of the annotated corpus, with columns:
+    doc_id, sent_id, word_id, text, lemma, upos, xpos, feats, head, deprel, start_char, end_char,
+    token, token_len
+doc_id is the article position, its line number in the input file,
+sent_id the sentence position within its article,
+and word_id and head are the 1-based Stanza word ids (head 0 is the root).
+token_len is the number of words of the token a word starts, 0 for the next words of multi-word tokens,
+and token is the text of the multi-word token a word starts, like "al" for "a el", null otherwise.
+String columns are dictionary encoded, so they load as pandas categoricals
+and their integer codes can be used directly in vectorized operations.
+
+The table is written once, as an Arrow IPC file, and memory-mapped on read;
+a path ending in .parquet is written and read as Parquet instead.
+
+The articles are the lines of the input file, looked up in the annotation store,
+or, without input file, the lines of the last full run of 03_00_stanza_annotate.py.
+
+Usage:
+    PYTHONPATH=. python src/util/token_table.py data/preprocessed/constitucion_sent_cr.txt
+"""
+
+import argparse
+import os
+import sys
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from src.config.config import Config
+from src.util.annotation_store import AnnotationStore
+
+config = Config().config
+
+# integer columns
+INT_COLUMNS = ('doc_id', 'sent_id', 'word_id', 'head', 'start_char', 'end_char', 'token_len')
+
+# dictionary encoded string columns
+STRING_COLUMNS = ('text', 'lemma', 'upos', 'xpos', 'feats', 'deprel', 'token')
+
+# string columns taken from the word attributes of the same name
+WORD_COLUMNS = ('text', 'lemma', 'upos', 'xpos', 'feats', 'deprel')
+
+# column order of the table
+COLUMNS = ('doc_id', 'sent_id', 'word_id', 'text', 'lemma', 'upos', 'xpos', 'feats', 'head', 'deprel',
+           'start_char', 'end_char', 'token', 'token_len')
+
+# value of missing integers, e.g. character offsets of words inside multi-word tokens
+MISSING_INT = -1
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Write the token table of the annotation store.')
+    parser.add_argument('-v', '--verbose', help='work verbosely', action="store_true")
+    parser.add_argument('-s', '--store',
+                        default=config.get('annotation_store_dir'),
+                        help=f"directory of the annotation store (default: {config.get('annotation_store_dir')})",
+                        )
+    parser.add_argument('-o', '--output',
+                        default=config.get('token_table'),
+                        help=f"path of the token table, .arrow or .parquet (default: {config.get('token_table')})",
+                        )
+    parser.add_argument('input_file_path',
+                        nargs='?',
+                        help='input file whose lines are the articles, each looked up in the store '
+                             '(default: the lines of the last full annotation run)',
+                        )
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+class Interner:
+    """Map strings to consecutive integer ids, in order of first occurrence."""
+
+    def __init__(self):
+        self.ids: dict[Optional[str], int] = {}
+        self.values: list[Optional[str]] = []
+
+    def __call__(self, value: Optional[str]) -> int:
+        value_id = self.ids.get(value)
+        if value_id is None:
+            value_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return value_id
+
+    def dictionary_array(self, codes: list[int]) -> pa.DictionaryArray:
+        """Return the dictionary encoded array of the interned codes; None values become nulls."""
+        indices = np.array(codes, dtype=np.int32)
+        mask = indices == self.ids[None] if None in self.ids else None
+        dictionary = pa.array(['' if value is None else value for value in self.values], type=pa.string())
+        return pa.DictionaryArray.from_arrays(indices, dictionary, mask=mask)
+
+
+class TokenTableBuilder:
+    """Accumulate the words of annotated Stanza documents into columns."""
+
+    def __init__(self):
+        self.ints: dict[str, list[int]] = {column: [] for column in INT_COLUMNS}
+        self.codes: dict[str, list[int]] = {column: [] for column in STRING_COLUMNS}
+        self.interners: dict[str, Interner] = {column: Interner() for column in STRING_COLUMNS}
+
+    def add_document(self, doc_id: int, doc: Any) -> None:
+        """Append the words of a document."""
+        ints, codes, interners = self.ints, self.codes, self.interners
+        for sent_id, sentence in enumerate(doc.sentences):
+            for word in sentence.words:
+                start_char = getattr(word, 'start_char', None)
+                end_char = getattr(word, 'end_char', None)
+                token = getattr(word, 'parent', None)
+                token_ids = token.id if token is not None else (word.id, )
+                ints['doc_id'].append(doc_id)
+                ints['sent_id'].append(sent_id)
+                ints['word_id'].append(word.id)
+                ints['head'].append(MISSING_INT if word.head is None else word.head)
+                ints['start_char'].append(MISSING_INT if start_char is None else start_char)
+                ints['end_char'].append(MISSING_INT if end_char is None else end_char)
+                ints['token_len'].append(len(token_ids) if word.id == token_ids[0] else 0)
+                for column in WORD_COLUMNS:
+                    codes[column].append(interners[column](getattr(word, column)))
+                codes['token'].append(interners['token'](token.text if len(token_ids) > 1 and word.id == token_ids[0]
+                                                         else None))
+
+    def __len__(self) -> int:
+        return len(self.ints['doc_id'])
+
+    def to_table(self) -> pa.Table:
+        columns = {column: pa.array(np.array(self.ints[column], dtype=np.int32)) for column in INT_COLUMNS}
+        columns.update({column: self.interners[column].dictionary_array(self.codes[column])
+                        for column in STRING_COLUMNS})
+        return pa.table({column: columns[column] for column in COLUMNS})
+
+
+def build_token_table(docs: Iterable[tuple[int, Any]]) -> pa.Table:
+    """Return the token table of (doc_id, document) pairs."""
+    builder = TokenTableBuilder()
+    for doc_id, doc in docs:
+        builder.add_document(doc_id, doc)
+    return builder.to_table()
+
+
+def write_token_table(table: pa.Table, path: str) -> None:
+    """Write the table as an Arrow IPC file, or as Parquet if path ends in .parquet."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    if path.endswith('.parquet'):
+        pq.write_table(table, path)
+        return
+    with pa.OSFile(path, 'wb') as sink, ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def read_token_table(path: str) -> pa.Table:
+    """Read a token table; Arrow IPC files are memory-mapped rather than loaded."""
+    if path.endswith('.parquet'):
+        return pq.read_table(path)
+    return ipc.open_file(pa.memory_map(path, 'r')).read_all()
+
+
+def token_frame(table: pa.Table) -> pd.DataFrame:
+    """Return the token table as a DataFrame, with categorical string columns."""
+    return table.to_pandas()
+
+
+def main():
+    args = set_argparse()
+
+    with AnnotationStore(args.store) as store:
+        if args.input_file_path:
+            with open(args.input_file_path, 'r', encoding='utf-8') as f:
+                table = build_token_table((doc_id, store(line_text)) for doc_id, line_text in enumerate(f))
+        else:
+            table = build_token_table((doc_id, doc) for doc_id, (_, doc) in enumerate(store.iter_documents()))
+    write_token_table(table, args.output)
+    if args.verbose:
+        print(f"{table.num_rows} words of {len(pc.unique(table['doc_id']))} articles "
+              f"written to {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+
+"""
+Tregex-style pattern queries over the trees of a compact TreeBank.
+
+Pattern language, a subset of Tregex:
+    node            a label, alternative labels a|b|c, a /regex/ searched in labels, or __ for any node
+    A < B           A is the parent of B
+    A > B           A is a child of B
+    A << B          A dominates B
+    A >> B          A is dominated by B
+    A $ B           A is a sister of B
+    A $+ B          B is the immediate right sister of A
+    A $- B          B is the immediate left sister of A
+    A !< B          negation of any relation
+    A < (B < C)     parentheses group a node with its own relations
+Relations in sequence all apply to the first node: A < B > C means A < B and A > C.
+The result is every node matching the first node of the pattern.
+
+Example, sn nodes whose grup.nom has an sp child, under a sentence with an AUX grup.verb:
+    sn < (grup.nom < sp) >> (sentence < (grup.verb < AUX))
+
+Queries only evaluate candidate trees, those containing every label and parent-child label bigram
+the pattern requires, found in inverted indexes from label and label bigram to node ids.
+Within candidate trees, relations are evaluated on whole node arrays at once.
+
+Usage:
+    PYTHONPATH=. python src/util/tree_query.py -f data/annotations/forest.npz 'sn < (grup.nom < sp)'
+"""
+
+import argparse
+import re
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from src.util.compact_tree import TreeBank, NO_NODE
+
+# tokens of a pattern
+PATTERN_TOKEN_PATTERN = re.compile(r'\s*(<<|>>|\$\+|\$-|<|>|\$|!|\(|\)|/(?:[^/\\]|\\.)*/|[^\s()!<>$]+)')
+
+# relation operators
+RELATIONS = ('<', '>', '<<', '>>', '$', '$+', '$-')
+
+# wildcard node
+ANY_NODE = '__'
+
+
+def set_argparse() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Query the trees of a compact TreeBank with a Tregex-style pattern.')
+    parser.add_argument('-f', '--forest',
+                        required=True,
+                        help='TreeBank .npz file, e.g. saved by 03_01_stanza_const_parse.py -f',
+                        )
+    parser.add_argument('-n', '--max-matches',
+                        type=int,
+                        help='max number of matches to print',
+                        )
+    parser.add_argument('-b', '--bracketed',
+                        help='print matched subtrees bracketed, instead of their text',
+                        action="store_true",
+                        )
+    parser.add_argument('pattern', help="e.g. 'sn < (grup.nom < sp) >> (sentence < (grup.verb < AUX))'")
+    args = parser.parse_args()
+    args.prog = parser.prog
+    return args
+
+
+class NodeDesc(NamedTuple):
+    """Node description: literal labels, or a regex, or neither for any node."""
+    labels: Optional[frozenset[str]]
+    regex: Optional[re.Pattern]
+
+
+class Relation(NamedTuple):
+    op: str
+    negated: bool
+    target: 'Pattern'
+
+
+class Pattern(NamedTuple):
+    desc: NodeDesc
+    relations: tuple[Relation, ...]
+
+
+def parse_pattern(text: str) -> Pattern:
+    """Parse a pattern; raise ValueError if it is not well formed."""
+    tokens = PATTERN_TOKEN_PATTERN.findall(text)
+    if ''.join(tokens) != re.sub(r'\s+', '', text):
+        raise ValueError(f"Invalid characters in pattern: {text!r}")
+    position = 0
+
+    def peek() -> Optional[str]:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        if position >= len(tokens):
+            raise ValueError(f"Incomplete pattern: {text!r}")
+        position += 1
+        return tokens[position - 1]
+
+    def node_desc() -> NodeDesc:
+        token = take()
+        if token in RELATIONS or token in {'!', '(', ')'}:
+            raise ValueError(f"Node expected instead of {token!r} in pattern: {text!r}")
+        if token == ANY_NODE:
+            return NodeDesc(None, None)
+        if token.startswith('/') and token.endswith('/') and len(token) > 1:
+            return NodeDesc(None, re.compile(token[1:-1]))
+        return NodeDesc(frozenset(token.split('|')), None)
+
+    def pattern() -> Pattern:
+        if peek() == '(':
+            take()
+            result = pattern()
+            if take() != ')':
+                raise ValueError(f"Unbalanced parentheses in pattern: {text!r}")
+            return result
+        desc = node_desc()
+        relations = []
+        while peek() is not None and peek() != ')':
+            negated = peek() == '!'
+            if negated:
+                take()
+            op = take()
+            if op not in RELATIONS:
+                raise ValueError(f"Relation expected instead of {op!r} in pattern: {text!r}")
+            target = pattern() if peek() == '(' else Pattern(node_desc(), ())
+            relations.append(Relation(op, negated, target))
+        return Pattern(desc, tuple(relations))
+
+    result = pattern()
+    if position != len(tokens):
+        raise ValueError(f"Unexpected {tokens[position]!r} in pattern: {text!r}")
+    return result
+
+
+class TreeSlice(NamedTuple):
+    """Node arrays of some trees of a TreeBank, with indexes local to the slice."""
+    nodes: np.ndarray          # global node id of each slice node
+    labels: np.ndarray
+    parent: np.ndarray
+    next_sibling: np.ndarray
+    prev_sibling: np.ndarray
+    subtree_end: np.ndarray
+
+
+class TreeIndex:
+    """Inverted indexes of a TreeBank, and pattern queries over it."""
+
+    def __init__(self, bank: TreeBank):
+        self.bank = bank
+        arrays = bank.arrays
+        self.labels = arrays['labels']
+        self.offsets = bank.offsets
+        node_count = len(self.labels)
+        self.tree_of_node = np.repeat(np.arange(len(bank)), np.diff(self.offsets))
+        tree_start = self.offsets[self.tree_of_node]
+        self.parent = np.where(arrays['parent'] == NO_NODE, NO_NODE, arrays['parent'] + tree_start)
+        self.next_sibling = np.where(arrays['next_sibling'] == NO_NODE, NO_NODE, arrays['next_sibling'] + tree_start)
+        self.prev_sibling = np.full(node_count, NO_NODE, dtype=np.int64)
+        has_next = self.next_sibling != NO_NODE
+        self.prev_sibling[self.next_sibling[has_next]] = np.flatnonzero(has_next)
+        sizes = [1] * node_count
+        for node, node_parent in zip(range(node_count - 1, -1, -1), self.parent[::-1].tolist()):
+            if node_parent != NO_NODE:
+                sizes[node_parent] += sizes[node]
+        self.subtree_end = np.arange(node_count) + np.array(sizes, dtype=np.int64)
+
+        # label id -> node ids, in CSR form
+        self._label_nodes = np.argsort(self.labels, kind='stable')
+        self._label_offsets = np.zeros(len(bank.vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.labels, minlength=len(bank.vocab)), out=self._label_offsets[1:])
+
+        # (parent label, child label) bigram key -> child node ids, sorted by key
+        children = np.flatnonzero(self.parent != NO_NODE)
+        keys = self._bigram_keys(self.labels[self.parent[children]], self.labels[children])
+        order = np.argsort(keys, kind='stable')
+        self._bigram_keys_sorted = keys[order]
+        self._bigram_nodes = children[order]
+
+    def _bigram_keys(self, parent_labels: np.ndarray, child_labels: np.ndarray) -> np.ndarray:
+        return parent_labels.astype(np.int64) * len(self.bank.vocab) + child_labels
+
+    def label_nodes(self, label: str) -> np.ndarray:
+        """Return the ids of the nodes with a label."""
+        label_id = self.bank.vocab.ids.get(label)
+        if label_id is None or label_id >= len(self._label_offsets) - 1:
+            return np.zeros(0, dtype=np.int64)
+        return self._label_nodes[self._label_offsets[label_id]:self._label_offsets[label_id + 1]]
+
+    def bigram_nodes(self, parent_label: str, child_label: str) -> np.ndarray:
+        """Return the ids of the nodes with child_label whose parent has parent_label."""
+        ids = self.bank.vocab.ids
+        if parent_label not in ids or child_label not in ids:
+            return np.zeros(0, dtype=np.int64)
+        key = self._bigram_keys(np.array([ids[parent_label]]), np.array([ids[child_label]]))[0]
+        start, end = np.searchsorted(self._bigram_keys_sorted, [key, key + 1])
+        return self._bigram_nodes[start:end]
+
+    def candidate_trees(self, pattern: Pattern) -> np.ndarray:
+        """Return the trees that contain every label and bigram the pattern requires."""
+        candidates = np.arange(len(self.bank))
+        for node_ids in self._requirements(pattern):
+            candidates = np.intersect1d(candidates, self.tree_of_node[node_ids], assume_unique=False)
+        return candidates
+
+    def _requirements(self, pattern: Pattern) -> list[np.ndarray]:
+        """Return node id arrays, one per requirement, whose trees must all contain the matches."""
+        requirements = []
+        if pattern.desc.labels is not None:
+            requirements.append(np.concatenate([self.label_nodes(label) for label in pattern.desc.labels]))
+        for relation in pattern.relations:
+            if relation.negated:
+                continue
+            requirements.extend(self._requirements(relation.target))
+            target_labels = relation.target.desc.labels
+            if relation.op in {'<', '>'} and pattern.desc.labels is not None and target_labels is not None:
+                pairs = [(a, b) if relation.op == '<' else (b, a)
+                         for a in pattern.desc.labels for b in target_labels]
+                requirements.append(np.concatenate([self.bigram_nodes(a, b) for a, b in pairs]))
+        return requirements
+
+    def tree_slice(self, trees: np.ndarray) -> TreeSlice:
+        """Return the node arrays of some trees, with slice-local indexes."""
+        sizes = np.diff(self.offsets)[trees]
+        starts = self.offsets[trees]
+        local_starts = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(np.int64)
+        shift = np.repeat(local_starts - starts, sizes)
+        nodes = np.arange(int(sizes.sum())) - shift
+
+        def local(global_ids: np.ndarray) -> np.ndarray:
+            return np.where(global_ids == NO_NODE, NO_NODE, global_ids + shift)
+
+        return TreeSlice(nodes,
+                         self.labels[nodes],
+                         local(self.parent[nodes]),
+                         local(self.next_sibling[nodes]),
+                         local(self.prev_sibling[nodes]),
+                         self.subtree_end[nodes] + shift,
+                         )
+
+    def _desc_mask(self, desc: NodeDesc, tree_slice: TreeSlice) -> np.ndarray:
+        vocab = self.bank.vocab
+        if desc.labels is not None:
+            label_ids = [vocab.ids[label] for label in desc.labels if label in vocab.ids]
+        elif desc.regex is not None:
+            label_ids = [label_id for label_id, label in enumerate(vocab.labels) if desc.regex.search(label)]
+        else:
+            return np.ones(len(tree_slice.nodes), dtype=bool)
+        return np.isin(tree_slice.labels, label_ids)
+
+    def _match(self, pattern: Pattern, tree_slice: TreeSlice) -> np.ndarray:
+        """Return whether each slice node matches the pattern."""
+        matches = self._desc_mask(pattern.desc, tree_slice)
+        for relation in pattern.relations:
+            related = related_nodes(relation.op, self._match(relation.target, tree_slice), tree_slice)
+            matches &= ~related if relation.negated else related
+        return matches
+
+    def query(self, pattern: str, max_matches: Optional[int] = None) -> list[tuple[int, int]]:
+        """Return the (tree number, node index within the tree) of every node matching the pattern."""
+        parsed = parse_pattern(pattern)
+        trees = self.candidate_trees(parsed)
+        if len(trees) == 0:
+            return []
+        tree_slice = self.tree_slice(trees)
+        matched = tree_slice.nodes[np.flatnonzero(self._match(parsed, tree_slice))][:max_matches]
+        match_trees = self.tree_of_node[matched]
+        return list(zip(match_trees.tolist(), (matched - self.offsets[match_trees]).tolist()))
+
+
+def related_nodes(op: str, targets: np.ndarray, tree_slice: TreeSlice) -> np.ndarray:
+    """Return whether each slice node is in relation op with some target node."""
+    parent = tree_slice.parent
+    node_count = len(parent)
+    has_parent = parent != NO_NODE
+    if op == '<':
+        related = np.zeros(node_count, dtype=bool)
+        related[parent[targets & has_parent]] = True
+        return related
+    if op == '>':
+        return has_parent & targets[np.where(has_parent, parent, 0)]
+    if op == '<<':
+        target_sums = np.concatenate(([0], np.cumsum(targets)))
+        return target_sums[tree_slice.subtree_end] - target_sums[np.arange(node_count) + 1] > 0
+    if op == '>>':
+        target_nodes = np.flatnonzero(targets)
+        coverage = np.zeros(node_count + 1, dtype=np.int64)
+        np.add.at(coverage, target_nodes + 1, 1)
+        np.add.at(coverage, tree_slice.subtree_end[target_nodes], -1)
+        return np.cumsum(coverage)[:-1] > 0
+    if op == '$':
+        sister_targets = np.bincount(parent[targets & has_parent], minlength=node_count)
+        return has_parent & (sister_targets[np.where(has_parent, parent, 0)] - targets > 0)
+    if op in {'$+', '$-'}:
+        sister = tree_slice.next_sibling if op == '$+' else tree_slice.prev_sibling
+        has_sister = sister != NO_NODE
+        return has_sister & targets[np.where(has_sister, sister, 0)]
+    raise ValueError(f"Unknown relation: {op}")
+
+
+def main():
+    args = set_argparse()
+    bank = TreeBank.load(args.forest)
+    index = TreeIndex(bank)
+    for tree_number, node in index.query(args.pattern, args.max_matches):
+        tree = bank[tree_number]
+        print(f"{tree_number:>5} {node:>4}  {tree.to_bracketed(node) if args.bracketed else tree.text(node)}")
+
+
+if __name__ == '__main__':
+    main()
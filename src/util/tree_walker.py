@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+"""
+Iterative walker over constituency trees.
+
+Walks any tree whose nodes have label and children attributes, like Stanza's ParseTree,
+with an explicit stack, so that very deep trees do not reach the recursion limit.
+A visitor gets enter and leave callbacks, in preorder and postorder,
+and keeps whatever accumulators it needs across the whole traversal.
+
+Usage:
+    class LabelCounter(TreeVisitor):
+        def __init__(self):
+            self.counts = Counter()
+
+        def enter(self, node, depth):
+            self.counts[node.label] += 1
+            return True
+
+    visitor = walk_tree(tree, LabelCounter())
+"""
+
+from typing import Any, Iterator, TypeVar
+
+VisitorType = TypeVar('VisitorType', bound='TreeVisitor')
+
+
+class TreeVisitor:
+    """Callbacks of walk_tree; subclasses override the ones they need."""
+
+    def enter(self, node: Any, depth: int) -> bool:
+        """Called before the children of node; return False to skip them."""
+        return True
+
+    def leave(self, node: Any, depth: int) -> None:
+        """Called after the children of node, or right after enter if they were skipped."""
+
+
+def walk_tree(tree: Any, visitor: VisitorType) -> VisitorType:
+    """Walk the tree depth first, left to right, calling the visitor callbacks; return the visitor."""
+    # entries are (node, depth, entered): nodes to enter, or entered nodes to leave
+    stack = [(tree, 0, False)]
+    while stack:
+        node, depth, entered = stack.pop()
+        if entered:
+            visitor.leave(node, depth)
+            continue
+        stack.append((node, depth, True))
+        if visitor.enter(node, depth):
+            stack.extend((child, depth + 1, False) for child in reversed(node.children))
+    return visitor
+
+
+def iter_preorder(tree: Any) -> Iterator[tuple[Any, int]]:
+    """Yield (node, depth) for every node of the tree, in preorder."""
+    stack = [(tree, 0)]
+    while stack:
+        node, depth = stack.pop()
+        yield node, depth
+        stack.extend((child, depth + 1) for child in reversed(node.children))
+
+
+def tree_text(tree: Any) -> str:
+    """Return the leaf labels of the tree, separated by spaces."""
+    return ' '.join(node.label for node, _ in iter_preorder(tree) if not node.children)
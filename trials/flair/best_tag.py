@@ -1,6 +1,7 @@
 import time
 from flair.data import Sentence
-from flair.nn import Classifier
+
+from src.util.model_registry import get_flair
 
 # make a sentence
 # sentence = Sentence('George Washington went to Washington.')
@@ -11,7 +12,7 @@ sentence = Sentence(
 )
 
 # load the NER tagger
-tagger = Classifier.load('ner-large')
+tagger = get_flair('ner-large')
 
 start = time.time()
 
@@ -1,11 +1,12 @@
 from flair.data import Sentence
-from flair.nn import Classifier
+
+from src.util.model_registry import get_flair
 
 # make a sentence
 sentence = Sentence('I love Berlin and New York.')
 
 # load the sentiment tagger
-tagger = Classifier.load('sentiment')
+tagger = get_flair('sentiment')
 
 # run sentiment analysis over sentence
 tagger.predict(sentence)
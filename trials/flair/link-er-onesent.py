@@ -4,11 +4,12 @@ The linker does not only tag entities, but also attempts to link each entity
 to the corresponding Wikipedia URL if one exists.
 """
 
-from flair.nn import Classifier
 from flair.data import Sentence
 
+from src.util.model_registry import get_flair
+
 # load the model
-tagger = Classifier.load('linker')
+tagger = get_flair('linker')
 
 # make a sentence
 sentence = Sentence('Kirk and Spock met on the Enterprise.')
@@ -1,6 +1,7 @@
-from flair.nn import Classifier
 from flair.splitter import SegtokSentenceSplitter
 
+from src.util.model_registry import get_flair
+
 # example text with many sentences
 text = "Bayern played against Barcelona. The match took place in Barcelona."
 
@@ -11,7 +12,7 @@ splitter = SegtokSentenceSplitter()
 sentences = splitter.split(text)
 
 # predict tags for sentences
-tagger = Classifier.load('linker')
+tagger = get_flair('linker')
 tagger.predict(sentences)
 
 # iterate through sentences and print predicted labels
@@ -1,8 +1,9 @@
 from flair.data import Sentence
-from flair.models import SequenceTagger
+
+from src.util.model_registry import get_flair
 
 # load tagger
-tagger = SequenceTagger.load("flair/ner-spanish-large")
+tagger = get_flair("flair/ner-spanish-large")
 
 # make example sentence
 # sentence = Sentence("George Washington fue a Washington")
@@ -1,8 +1,8 @@
 import time
 
 from flair.data import Sentence
-from flair.nn import Classifier
 
+from src.util.model_registry import get_flair
 from trials.flair.best_tag import start
 
 # make a sentence
@@ -10,7 +10,7 @@ from trials.flair.best_tag import start
 sentence = Sentence('El primero de septiembre Chepito se ganó $1 mientras miraba Juego de Tronos.')
 
 # load the NER tagger
-tagger = Classifier.load('ner-ontonotes-large')
+tagger = get_flair('ner-ontonotes-large')
 
 start = time.time()
 # run NER over sentence
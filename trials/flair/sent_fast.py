@@ -1,10 +1,11 @@
 # ValueError: Could not find any model with name 'sentiment-fast'
 
-from flair.nn import Classifier
 from flair.data import Sentence
 
+from src.util.model_registry import get_flair
+
 # load the model
-tagger = Classifier.load('sentiment-fast')
+tagger = get_flair('sentiment-fast')
 
 # make a sentence
 sentence = Sentence('This movie is very bad.')
@@ -1,8 +1,9 @@
-from flair.nn import Classifier
 from flair.data import Sentence
 
+from src.util.model_registry import get_flair
+
 # load the model
-tagger = Classifier.load('sentiment')
+tagger = get_flair('sentiment')
 
 # make a sentence
 sentence = Sentence('This movie is not at all bad.')
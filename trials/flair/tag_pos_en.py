@@ -1,8 +1,9 @@
-from flair.nn import Classifier
 from flair.data import Sentence
 
+from src.util.model_registry import get_flair
+
 # load the model
-tagger = Classifier.load('pos')
+tagger = get_flair('pos')
 
 # make a sentence
 sentence = Sentence('Dirk went to the store.')
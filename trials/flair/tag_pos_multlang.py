@@ -1,8 +1,9 @@
-from flair.nn import Classifier
 from flair.data import Sentence
 
+from src.util.model_registry import get_flair
+
 # load model
-tagger = Classifier.load('pos-multi')
+tagger = get_flair('pos-multi')
 
 # text with English and German sentences
 sentence = Sentence('''